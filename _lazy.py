@@ -0,0 +1,70 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+
+
+class LazyPackage(ModuleType):
+    """
+    Package whose exported names are imported from their submodules on the
+    first access (PEP 562 module `__getattr__`), so importing the package
+    itself doesn't import any of them.
+
+    A submodule named after the function it exports (e.g. `quick_select`)
+    doesn't shadow the function once it's imported.
+    """
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Import the submodule of the exported name and cache the value.
+
+        :raises AttributeError: if the name isn't exported by the package
+        :param name: exported name
+        :type name: str
+        :return: value of the name in its submodule
+        :rtype: object
+        """
+        exports: dict[str, str] = self.__dict__["_EXPORTS"]
+        if name not in exports:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        value = getattr(import_module(exports[name], self.__name__), name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: object):
+        """
+        Set the attribute, except binding a submodule over an exported name.
+
+        :param name: attribute name
+        :type name: str
+        :param value: attribute value
+        :type value: object
+        """
+        if isinstance(value, ModuleType) and name in self.__dict__["_EXPORTS"]:
+            return  # the submodule itself is still in `sys.modules`
+
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> list[str]:
+        """
+        Attributes of the package with the exported names not imported yet.
+
+        :return: sorted attribute names
+        :rtype: list[str]
+        """
+        return sorted(set(super().__dir__()) | set(self.__dict__["_EXPORTS"]))
+
+
+def lazy_package(name: str, exports: dict[str, str]):
+    """
+    Turn the package into a `LazyPackage`; it's called from the `__init__`
+    of the package with its `__name__`.
+
+    :param name: full name of the package
+    :type name: str
+    :param exports: exported names to their relative submodule, e.g. ".stack"
+    :type exports: dict[str, str]
+    """
+    package = sys.modules[name]
+    package._EXPORTS = exports
+    package.__class__ = LazyPackage
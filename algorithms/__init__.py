@@ -1,6 +1,39 @@
 """
 Functions of the Algorithms are implemented
+
+Every function is imported from its module on the first access.
 """
-from .sorting import *  # noqa: F401, F403
-from .binary_search import binary_search  # noqa: F401
-from .quick_select import quick_select  # noqa: F401
+from _lazy import lazy_package
+from .sorting import __all__ as _sorting
+
+__all__ = _sorting + (
+    "binary_search",
+    "lower_bound",
+    "upper_bound",
+    "contains",
+    "search_many",
+    "exponential_search",
+    "interpolation_search",
+    "quick_select",
+    "select_many",
+    "registry",
+    "count_operations",
+)
+
+lazy_package(
+    __name__,
+    {
+        **{name: ".sorting" for name in _sorting},
+        "binary_search": ".binary_search",
+        "lower_bound": ".binary_search",
+        "upper_bound": ".binary_search",
+        "contains": ".binary_search",
+        "search_many": ".binary_search",
+        "exponential_search": ".exponential_search",
+        "interpolation_search": ".interpolation_search",
+        "quick_select": ".quick_select",
+        "select_many": ".quick_select",
+        "registry": ".metrics",
+        "count_operations": ".counters",
+    },
+)
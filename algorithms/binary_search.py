@@ -1,4 +1,10 @@
-from typing import Optional, List
+from bisect import bisect_left
+from typing import Any, Optional, Sequence, List
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 def binary_search(
@@ -29,13 +35,134 @@ def binary_search(
     """
     start = start if start is not None else 0
     end = end if end is not None else len(array) - 1
-    if start > end:
-        raise ValueError("Item isn't present in the array.")
+    while start <= end:  # iterative; no call per halving
+        middle = (start + end) // 2
+        if array[middle] < item:
+            start = middle + 1
+        elif array[middle] > item:
+            end = middle - 1
+        else:
+            return middle
+
+    raise ValueError("Item isn't present in the array.")
+
+
+def lower_bound(
+    item: Any,
+    array: Sequence[Any],
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> int:
+    """
+    Index of the first element of the sorted `array[start:end]` which isn't less
+    than item; where item would be inserted to keep the array sorted.
+    Time Complexity: `O(log(n))`
+
+    :param item: a value to search for
+    :type item: Any
+    :param array: sorted sequence to search in
+    :type array: Sequence[Any]
+    :param start: index of the first element of the range, defaults to 0
+    :type start: int, optional
+    :param end: index after the last element of the range, defaults to the length
+    :type end: int, optional
+    :return: index of the leftmost insertion point of item
+    :rtype: int
+    """
+    end = len(array) if end is None else end
+    while start < end:
+        middle = (start + end) // 2
+        if array[middle] < item:
+            start = middle + 1
+        else:
+            end = middle
+
+    return start
+
+
+def upper_bound(
+    item: Any,
+    array: Sequence[Any],
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> int:
+    """
+    Index of the first element of the sorted `array[start:end]` which is greater
+    than item; where item would be inserted after its equal elements.
+    Time Complexity: `O(log(n))`
+
+    :param item: a value to search for
+    :type item: Any
+    :param array: sorted sequence to search in
+    :type array: Sequence[Any]
+    :param start: index of the first element of the range, defaults to 0
+    :type start: int, optional
+    :param end: index after the last element of the range, defaults to the length
+    :type end: int, optional
+    :return: index of the rightmost insertion point of item
+    :rtype: int
+    """
+    end = len(array) if end is None else end
+    while start < end:
+        middle = (start + end) // 2
+        if item < array[middle]:
+            end = middle
+        else:
+            start = middle + 1
+
+    return start
+
+
+def contains(item: Any, array: Sequence[Any]) -> bool:
+    """
+    Boolean indicating whether the item is present in the sorted array,
+    without raising an exception on a miss.
+    Time Complexity: `O(log(n))`
+
+    :param item: a value to search for
+    :type item: Any
+    :param array: sorted sequence to search in
+    :type array: Sequence[Any]
+    :return: flag to check if item is in the array
+    :rtype: bool
+    """
+    index = lower_bound(item, array)
+    return index < len(array) and array[index] == item
+
+
+def search_many(queries: Sequence[Any], array: Sequence[Any]) -> List[int]:
+    """
+    Batched search of many items in the sorted array in one call;
+    the index of the first occurrence of every query, or `-1` if it's missing.
+
+    The queries are visited in sorted order, so every search starts from the
+    lower bound of the previous query and the array is swept once from left
+    to right. With NumPy arrays the whole batch is one vectorized `searchsorted`.
+
+    Time Complexity: `O(m*log(m) + m*log(n))`, for `m` queries.
+
+    :param queries: sequence of items to search for
+    :type queries: Sequence[Any]
+    :param array: sorted sequence to search in
+    :type array: Sequence[Any]
+    :return: list of indexes of the queries in the array, `-1` for the misses
+    :rtype: list[int]
+    """
+    result, position, length = [-1] * len(queries), 0, len(array)
+    vectorized = numpy is not None and isinstance(array, numpy.ndarray)
+    if vectorized and length:  # pragma: no cover
+        queries = numpy.asarray(queries)
+        positions = numpy.searchsorted(array, queries, side="left")
+        clipped = numpy.minimum(positions, length - 1)
+        found = (positions < length) & (array[clipped] == queries)
+        return numpy.where(found, positions, -1).tolist()
 
-    middle = (start + end) // 2
-    if array[middle] < item:
-        return binary_search(item=item, array=array, start=middle + 1, end=end)
-    elif array[middle] > item:
-        return binary_search(item=item, array=array, start=start, end=middle - 1)
+    for index in sorted(range(len(queries)), key=queries.__getitem__):
+        item = queries[index]
+        position = bisect_left(array, item, position)  # C lower bound
+        if position < length and array[position] == item:
+            result[index] = position
 
-    return middle  # base case
+    return result
@@ -0,0 +1,233 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import lt, le, eq, ne, gt, ge
+from typing import Any, Callable, Iterator, List, Optional
+
+# sorts which only compare the elements, so they can be counted through proxies
+COMPARISON_SORTS = frozenset(
+    (
+        "insertion_sort",
+        "bubble_sort",
+        "selection_sort",
+        "merge_sort",
+        "tim_sort",
+        "heap_sort",
+        "quick_sort",
+        "partial_sort",
+    )
+)
+
+
+class Operations:
+    """
+    # Operations
+    Counts of the operations recorded by `count_operations`; a plain class
+    rather than a dataclass, `dataclasses` is too heavy for the import time.
+
+    * comparisons: comparisons of the elements
+    * swaps: moves of the elements (a swap is two moves), the writes into the
+      array of the sorts, their merges and the heap `_swap`
+    * allocations: peak bytes of the auxiliary allocations of the sorts
+    """
+
+    __slots__ = ("comparisons", "swaps", "allocations")
+
+    def __init__(self, comparisons: int = 0, swaps: int = 0, allocations: int = 0):
+        self.comparisons, self.swaps, self.allocations = comparisons, swaps, allocations
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Operations):
+            return NotImplemented
+        return self._counts() == other._counts()
+
+    def _counts(self) -> tuple:
+        return self.comparisons, self.swaps, self.allocations
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "Operations(comparisons={}, swaps={}, allocations={})".format(
+            *self._counts()
+        )
+
+
+# counts of the active context, a context variable so every thread has its own
+current: ContextVar[Optional[Operations]] = ContextVar("current", default=None)
+# inside a sort whose elements count their own comparisons
+_proxied: ContextVar[bool] = ContextVar("proxied", default=False)
+# tracemalloc was started by `count_operations`, so resetting its peak is safe
+_traced: ContextVar[bool] = ContextVar("traced", default=False)
+
+
+def _comparison(operator: Callable[[Any, Any], bool], *, counted: bool = True):
+    def method(self, other):
+        operations = current.get()
+        if counted and operations is not None:
+            operations.comparisons += 1
+        other = other.value if isinstance(other, Counted) else other
+        return operator(self.value, other)
+
+    return method
+
+
+class Counted:
+    """
+    # Counted
+    Proxy of a value which counts its comparisons in the active context;
+    wrap the values with it to count the comparisons of any algorithm.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    __lt__, __le__, __eq__ = _comparison(lt), _comparison(le), _comparison(eq)
+    __ne__, __gt__, __ge__ = _comparison(ne), _comparison(gt), _comparison(ge)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"Counted({self.value!r})"
+
+
+class _CountedKey(Counted):
+    """
+    Proxy of a key in the `(key, index)` tuples of `keyed_sort`; comparing two
+    tuples calls `==` on the keys once and `<` only if they differ, so only
+    the equality is counted.
+    """
+
+    __slots__ = ()
+
+    __lt__, __le__ = _comparison(lt, counted=False), _comparison(le, counted=False)
+    __gt__, __ge__ = _comparison(gt, counted=False), _comparison(ge, counted=False)
+
+
+class _CountedList(list):
+    """
+    List of the elements of a counted sort which counts the writes into it
+    as moves; `keyed_sort` keeps it for its decorated copies.
+    """
+
+    __slots__ = ()
+
+    def __setitem__(self, index: Any, value: Any):
+        if isinstance(index, slice):
+            value = list(value)  # it may be an iterator, e.g. `reversed`
+            moves = len(value)
+        else:
+            moves = 1
+
+        operations = current.get()
+        if operations is not None:
+            operations.swaps += moves
+        super().__setitem__(index, value)
+
+
+def count_moves(array: List[Any], moves: int):
+    """
+    Count the moves into a list inside `count_operations`, unless the list
+    counts its writes itself.
+
+    :param array: list the elements are moved into
+    :type array: list[Any]
+    :param moves: number of moved elements
+    :type moves: int
+    """
+    operations = current.get()
+    if operations is not None and type(array) is not _CountedList:
+        operations.swaps += moves
+
+
+@contextmanager
+def count_operations() -> Iterator[Operations]:
+    """
+    Count the comparisons, swaps and auxiliary allocations in the context.
+
+    The comparisons are counted by `Counted` proxies: the comparison sorts
+    decorated with `process_timer` run on proxies of the elements (and keys),
+    the values given to `quick_select.partition` or the heaps should be wrapped.
+    The swaps are counted as moves: the comparison sorts run on a list which
+    counts the writes into it, and the merges into new lists, partition and
+    the heap `_swap` count theirs with `count_moves`, at the cost of reading
+    a context variable when it's disabled.
+    The peak auxiliary memory of the sorts is traced by `tracemalloc`, unless
+    the caller already traces the memory, so its own peak isn't reset.
+
+    The counts belong to the current thread (or task), and a nested context
+    adds its counts to the outer one when it exits.
+
+    ## Example:
+        >>> with count_operations() as operations:
+        ...     merge_sort(array)
+        >>> operations.comparisons
+
+    :return: the operations counted so far, filled in while the context runs
+    :rtype: Iterator[Operations]
+    """
+    import tracemalloc  # deferred, it's heavy for the import time
+
+    operations = Operations()
+    starting = not tracemalloc.is_tracing()
+    if starting:
+        tracemalloc.start()
+
+    outer = current.get()
+    tokens = current.set(operations), _traced.set(_traced.get() or starting)
+    try:
+        yield operations
+    finally:
+        current.reset(tokens[0])
+        _traced.reset(tokens[1])
+        if starting:
+            tracemalloc.stop()
+        if outer is not None:
+            outer.comparisons += operations.comparisons
+            outer.swaps += operations.swaps
+            outer.allocations = max(outer.allocations, operations.allocations)
+
+
+def counted_call(function: Callable[..., List[Any]], /, *args, **kwargs):
+    """
+    Call a comparison sort on the `Counted` proxies of its array, in a list
+    counting the moves, and record the peak of its auxiliary allocations.
+
+    :param function: function of sorting algorithms
+    :type function: Callable[..., list]
+    :param args: positional arguments, the array is the first one
+    :param kwargs: keyword arguments, the key is wrapped to return proxies
+    :return: result of the sort with the values unwrapped
+    :rtype: list
+    """
+    import tracemalloc
+
+    if _proxied.get() or not args:  # a nested call of the sort being counted
+        return function(*args, **kwargs)
+
+    key = kwargs.get("key")
+    if key is not None:
+        kwargs = {**kwargs, "key": lambda item: _CountedKey(key(item.value))}
+
+    array = _CountedList(Counted(item) for item in args[0])
+    traced = _traced.get()
+    if traced:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+
+    token = _proxied.set(True)
+    try:
+        result = function(array, *args[1:], **kwargs)
+    finally:
+        _proxied.reset(token)
+
+    if traced:
+        operations = current.get()
+        allocations = tracemalloc.get_traced_memory()[1] - before
+        operations.allocations = max(operations.allocations, allocations)
+
+    values = [item.value for item in result]
+    if result is array:  # sorted in place
+        args[0][:] = values
+        return args[0]
+
+    return values
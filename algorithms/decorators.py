@@ -1,28 +1,127 @@
-import logging, logging.config  # noqa: E401
-from functools import wraps
-from typing import Callable
-from timeit import default_timer as timer
+from contextvars import ContextVar
+from functools import partial, wraps
+from time import perf_counter as timer
+from typing import Any, Optional, Callable
 
+from . import counters
+from .metrics import registry
 
-logging.config.fileConfig(fname="logging.ini")
-logger = logging.getLogger(__name__)
+# inside a call recorded in the registry
+_recording: ContextVar[bool] = ContextVar("recording", default=False)
 
 
 def process_timer(function: Callable[[list], list]):
     """decorator for processing timer sorting algorithm functions
 
+    The calls and latencies are recorded in the metrics `registry` (not logged)
+    when it's enabled, only for the outermost call and not for the recursive
+    or nested calls of decorated functions; the comparison sorts count their
+    operations inside `counters.count_operations`. Each one is checked on its
+    own flag, so when both are off the only cost of a call is checking the two.
+
     :param function: function of sorting algorithms
     :type function: Callable[[list], list]
     :return: decorated function of sorting algorithms with process time
     :rtype: Callable[[list], list]
     """
+    name = function.__name__
+    compares = name in counters.COMPARISON_SORTS
 
     @wraps(function)
     def wrapper(*args, **kwargs):
-        start_time = timer()
-        result = function(*args, **kwargs)
-        process_time = (timer() - start_time) * 1_000_000  # convert to microseconds
-        logger.info(f"{function.__name__}[{len(result)}]: {process_time:.4f} μs")
+        call = function
+        if compares and counters.current.get() is not None:  # `count_operations`
+            call = partial(counters.counted_call, function)
+        if not registry.enabled or _recording.get():  # the outermost call only
+            return call(*args, **kwargs)
+
+        histogram = registry.histogram(name)
+        histogram.calls += 1
+        token = _recording.set(True)
+        try:
+            if histogram.calls % registry.sample:  # not sampled, only counted
+                return call(*args, **kwargs)
+
+            start_time = timer()
+            result = call(*args, **kwargs)
+        finally:
+            _recording.reset(token)
+
+        histogram.observe(timer() - start_time)
+        return result
+
+    return wrapper
+
+
+def keyed_sort(function: Callable[[list], list]):
+    """decorator adding `key` and `reverse` keyword arguments to sorting functions
+
+    The keys are computed once and the sort runs on `(key, index)` tuples
+    (decorate-sort-undecorate), so elements themselves are never compared
+    and equal keys keep their order for every algorithm.
+    Descending order reverses a copy of the input, sorts ascending and reverses
+    back, unless the function has its own `reverse` argument (it may be passed
+    positionally, e.g. `heap_sort(array, True)`); without a key, a function which
+    sorts in place still sorts the given list in place.
+    The copies keep the list subclass of the input, if it's one.
+
+    :param function: function of sorting algorithms
+    :type function: Callable[[list], list]
+    :return: decorated function of sorting algorithms with key and reverse
+    :rtype: Callable[[list], list]
+    """
+    code = function.__code__  # the parameter names, without importing `inspect`
+    names = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    native, positional = "reverse" in names, names[1 : code.co_argcount]
+    # index of a positional `reverse` into the arguments after the array
+    position = positional.index("reverse") if "reverse" in positional else None
+
+    @wraps(function)
+    def wrapper(
+        array: list,
+        *args,
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+        **kwargs,
+    ):
+        if position is not None and position < len(args):  # given positionally
+            reverse, args = args[position], args[:position] + args[position + 1 :]
+        if native:
+            kwargs["reverse"] = reverse
+        elif reverse:
+            source, array = array, _like(array, array[::-1])
+
+        if key is None:
+            result = function(array, *args, **kwargs)
+        else:  # negative indexes keep the order of equal keys in native reverse
+            sign = -1 if native and reverse else 1
+            decorated = [(key(item), sign * index) for index, item in enumerate(array)]
+            decorated = _like(array, decorated)
+            result = function(decorated, *args, **kwargs)
+            result = [array[sign * index] for _, index in result]
+
+        if reverse and not native:
+            result.reverse()
+            if result is array:  # sorted the copy in place, so the input too
+                source[:] = result
+                result = source
         return result
 
     return wrapper
+
+
+def _like(array: list, items: list) -> list:
+    """The items in a list of the list subclass of the array, if it's one of them;
+    e.g. the list of `count_operations` counting the moves.
+
+    :param array: list of the input
+    :type array: list
+    :param items: new list of the items
+    :type items: list
+    :return: the items in a list of the same type
+    :rtype: list
+    """
+    if type(array) is list or not isinstance(array, list):
+        return items
+
+    return type(array)(items)
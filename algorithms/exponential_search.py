@@ -0,0 +1,73 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Optional, Sequence
+
+
+def exponential_search(
+    item: Any,
+    array: Sequence[Any],
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+    right: bool = False,
+) -> int:
+    """
+    Exponential (Galloping) Search finds the range where the item would be
+    by probing `start`, `start + 1`, `start + 3`, `start + 7`, ... and then
+    it's a binary search in the last gap. It's useful for sorted streams of
+    unknown length; without `end` the probing stops on the first `IndexError`.
+    And it's faster than binary search when the item is near to the start,
+    that's why adaptive merges (tim sort) gallop this way. With `end` the last
+    gap is bisected by the `bisect` module, without any `IndexError` handling.
+
+    Time Complexity: `O(log(i))`, where i is the distance of the result from start.
+
+    :param item: a value to search for
+    :type item: Any
+    :param array: sorted sequence, its length may be unknown
+    :type array: Sequence[Any]
+    :param start: index of the first element of the range, defaults to 0
+    :type start: int, optional
+    :param end: index after the last element of the range, defaults to unknown
+    :type end: int, optional
+    :param right: find the upper bound instead of the lower bound, defaults to False
+    :type right: bool, optional
+    :return: index of the leftmost (or rightmost) insertion point of item
+    :rtype: int
+    """
+    low, probe, step = start, start, 1
+    if end is not None:  # bounded, the fast path
+        while probe < end and (
+            (not item < array[probe]) if right else array[probe] < item
+        ):
+            low, probe, step = probe + 1, probe + step, step * 2
+
+        return (bisect_right if right else bisect_left)(
+            array, item, low, min(probe, end)
+        )
+
+    while True:
+        try:
+            value = array[probe]
+        except IndexError:  # the end of a stream of unknown length
+            break
+
+        if (item < value) if right else not value < item:
+            break
+
+        low, probe, step = probe + 1, probe + step, step * 2
+
+    high = probe
+    while low < high:
+        middle = (low + high) // 2
+        try:
+            value = array[middle]
+        except IndexError:  # past the end of the stream, as if greater
+            high = middle
+            continue
+
+        if (item < value) if right else not value < item:
+            high = middle
+        else:
+            low = middle + 1
+
+    return low
@@ -0,0 +1,55 @@
+from typing import Optional, List, Union
+
+
+def interpolation_search(
+    item: Union[int, float],
+    array: List[Union[int, float]],
+    *,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> int:
+    """
+    Interpolation Search is an improvement over binary search for the sorted
+    arrays of uniformly distributed numbers. Instead of the middle, it probes
+    where the item would be if the values grow linearly between the bounds:
+
+        `low + (item - array[low]) * (high - low) / (array[high] - array[low])`
+
+    As a safeguard for the skewed data, a probe which doesn't halve the range
+    is followed by a bisection step; so the worst case stays logarithmic.
+
+    ### Time Complexity:
+        - Average case for uniform data is `O(log(log(n)))`
+        - Worst case time complexity is `O(log(n))`
+
+    :raises ValueError: if item isn't present in the array
+    :param item: a number to search for
+    :type item: int | float
+    :param array: array of sorted numbers to search in
+    :type array: list[int | float]
+    :param start: index of the first element of the range, defaults to 0
+    :type start: int, optional
+    :param end: index after the last element of the range, defaults to the length
+    :type end: int, optional
+    :return: index of item in array
+    :rtype: int
+    """
+    low, high = start, (len(array) if end is None else end) - 1
+    bisection = False
+    while low <= high and array[low] <= item <= array[high]:
+        size = high - low
+        if bisection or array[low] == array[high]:
+            middle = (low + high) // 2
+        else:
+            middle = low + int((item - array[low]) * size // (array[high] - array[low]))
+
+        if array[middle] < item:
+            low = middle + 1
+        elif item < array[middle]:
+            high = middle - 1
+        else:
+            return middle
+
+        bisection = not bisection and high - low > size // 2
+
+    raise ValueError("Item isn't present in the array.")
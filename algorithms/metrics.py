@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from typing import Dict, List
+
+# upper bounds of the latency buckets in seconds, powers of two from 1 μs to ~67 s
+BOUNDS = tuple(2**i / 1_000_000 for i in range(27))
+
+
+class Histogram:
+    """
+    # Histogram
+    Latency histogram on the fixed exponential `BOUNDS`, one counter per bucket
+    and the last one for the greater values; it's the layout of Prometheus.
+    """
+
+    __slots__ = ("calls", "counts", "count", "total")
+
+    def __init__(self):
+        """
+        Initialize an empty histogram without calls.
+        """
+        self.calls = 0  # every call, the sampled ones are in count
+        self.counts = [0] * (len(BOUNDS) + 1)
+        self.count, self.total = 0, 0.0
+
+    def observe(self, value: float):
+        """
+        Record a sampled latency.
+
+        :param value: elapsed time in seconds
+        :type value: float
+        """
+        self.counts[bisect_left(BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict:
+        """
+        Plain copy of the histogram with the cumulative bucket counts.
+
+        :return: dictionary of calls, sampled count, sum and buckets
+        :rtype: dict
+        """
+        cumulative, buckets = 0, []
+        for bound, count in zip(BOUNDS + ("+Inf",), self.counts):
+            cumulative += count
+            buckets.append([bound, cumulative])
+
+        return {
+            "calls": self.calls,
+            "count": self.count,
+            "sum": self.total,
+            "buckets": buckets,
+        }
+
+
+class Registry:
+    """
+    # Registry
+    In-process registry of the call counts and latency histograms of the
+    functions decorated with `process_timer`. It's disabled by default and then
+    a decorated call costs a single attribute check; when enabled every call is
+    counted and the latency of one in `sample` calls is timed.
+
+    ## Example:
+        >>> registry.enable(sample=10)
+        >>> merge_sort(array)
+        >>> print(registry.to_prometheus())
+    """
+
+    def __init__(self):
+        """
+        Initialize a disabled registry without metrics.
+        """
+        self.enabled, self.sample = False, 1
+        self.__metrics: Dict[str, Histogram] = {}
+
+    def enable(self, *, sample: int = 1):
+        """
+        Start recording the decorated calls.
+
+        :raises ValueError: if sample is less than one
+        :param sample: time one in sample calls of each function, defaults to 1
+        :type sample: int, optional
+        """
+        if sample < 1:
+            raise ValueError("Sample must be a positive integer.")
+
+        self.enabled, self.sample = True, sample
+
+    def disable(self):
+        """
+        Stop recording, the recorded metrics are kept.
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Remove all of the recorded metrics.
+        """
+        self.__metrics.clear()
+
+    def histogram(self, name: str) -> Histogram:
+        """
+        Histogram of the function, it's created on the first call.
+
+        :param name: name of the decorated function
+        :type name: str
+        :return: histogram of the function
+        :rtype: Histogram
+        """
+        histogram = self.__metrics.get(name)
+        if histogram is None:
+            histogram = self.__metrics[name] = Histogram()
+
+        return histogram
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Plain copy of every recorded metric by the function name.
+
+        :return: dictionary of function names to histogram snapshots
+        :rtype: dict[str, dict]
+        """
+        return {
+            name: self.__metrics[name].snapshot() for name in sorted(self.__metrics)
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Export the snapshot as a JSON document.
+
+        :param kwargs: keyword arguments of `json.dumps`, e.g. `indent`
+        :return: JSON string
+        :rtype: str
+        """
+        import json  # deferred, only the exports need it
+
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, *, prefix: str = "pydsa") -> str:
+        """
+        Export the snapshot in the Prometheus text exposition format;
+        a `calls_total` counter and a `latency_seconds` histogram
+        labeled by the function name.
+
+        :param prefix: prefix of the metric names, defaults to "pydsa"
+        :type prefix: str, optional
+        :return: Prometheus text format
+        :rtype: str
+        """
+        calls, latency = f"{prefix}_calls_total", f"{prefix}_latency_seconds"
+        lines: List[str] = [
+            f"# HELP {calls} Calls of the instrumented functions.",
+            f"# TYPE {calls} counter",
+        ]
+        snapshot = self.snapshot()
+        for name, metric in snapshot.items():
+            lines.append(f'{calls}{{function="{name}"}} {metric["calls"]}')
+
+        lines.append(f"# HELP {latency} Sampled latency of the instrumented functions.")
+        lines.append(f"# TYPE {latency} histogram")
+        for name, metric in snapshot.items():
+            for bound, count in metric["buckets"]:
+                label = f'function="{name}",le="{bound}"'
+                lines.append(f"{latency}_bucket{{{label}}} {count}")
+
+            lines.append(f'{latency}_sum{{function="{name}"}} {metric["sum"]}')
+            lines.append(f'{latency}_count{{function="{name}"}} {metric["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
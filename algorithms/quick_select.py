@@ -1,8 +1,13 @@
+from bisect import bisect_left
 from random import randint
-from typing import List
+from typing import Iterable, List, Optional
 
+from .counters import count_moves
 
-def quick_select(k: int, /, array: List[int]) -> int:
+_SORT_CUTOFF = 16
+
+
+def quick_select(k: int, /, array: List[int], *, in_place: bool = False) -> int:
     """
     Quick Select is a selection algorithm to find the `k-th` smallest element
     in an unordered list. It is related to the quick sort sorting algorithm.
@@ -10,32 +15,142 @@ def quick_select(k: int, /, array: List[int]) -> int:
     The algorithm is similar to QuickSort.
     The difference is, instead of recurring for both sides (after finding pivot),
     it recurs only for the part that contains the `k-th` smallest element.
-    The logic is simple, if index of the partitioned element is more than `k`,
-    then we recur for the left part. If index is the same as `k`,
-    we have found the `k-th` smallest element and we return.
-    If index is less than `k`, then we recur for the right part.
-    This reduces the expected complexity from `O(n*(log n))` to `O(n)`,
-    with a worst-case of `O(n^2)`.
+    This reduces the expected complexity from `O(n*(log n))` to `O(n)`.
+
+    This one is an `Introselect`: iterative and in place on a single copy
+    (or on the array itself with `in_place`), and when the random pivots
+    don't shrink the range fast enough it switches to median of medians
+    pivots, so the worst-case is linear too.
 
     :raises ValueError: if the `k-th` number not valid between 1 and length array
     :param k: integer number to find the `k-th` smallest element
     :type k: int
     :param array: list of integer numbers that to selected `k-th` smallest element
     :type array: list[int]
+    :param in_place: partition the array itself instead of a copy, defaults to False
+    :type in_place: bool, optional
     :return: integer value of `k-th` smallest element
     :rtype: int
     """
-    length = len(array)
-    if not 0 < k <= length:
+    return select_many((k,), array, in_place=in_place)[0]
+
+
+def select_many(
+    ks: Iterable[int], /, array: List[int], *, in_place: bool = False
+) -> List[int]:
+    """
+    Find several order statistics (e.g. p50, p90 and p99 of latencies) in one
+    partitioning pass; after each partition only the sides that still hold
+    some of the wanted ranks are visited, so it's much cheaper than a
+    `quick_select` per rank or sorting the whole array.
+
+    Time Complexity: `O(n*log(m))` for m distinct ranks, worst-case included.
+
+    :raises ValueError: if a `k-th` number not valid between 1 and length array
+    :param ks: integer numbers to find the `k-th` smallest elements
+    :type ks: Iterable[int]
+    :param array: list of integer numbers that to selected elements
+    :type array: list[int]
+    :param in_place: partition the array itself instead of a copy, defaults to False
+    :type in_place: bool, optional
+    :return: the `k-th` smallest elements in the order of `ks`
+    :rtype: list[int]
+    """
+    ks, length = list(ks), len(array)
+    if not all(0 < k <= length for k in ks):
         raise ValueError("K-th Must be between one and length of array.")
 
-    pivot = partition(array, start=0, end=length - 1)
-    if k - 1 < pivot:
-        return quick_select(k, array=array[:pivot])
-    elif k - 1 > pivot:
-        return quick_select(k - (pivot + 1), array=array[pivot + 1 :])
+    array = array if in_place else list(array)
+    _introselect(array, sorted({k - 1 for k in ks}), 0, length)
+    return [array[k - 1] for k in ks]
+
+
+def _introselect(
+    array: List[int],
+    indexes: List[int],
+    low: int,
+    high: int,
+    *,
+    depth: Optional[int] = None,
+):
+    """
+    Partition `array[low:high]` in place until every one of the sorted
+    `indexes` holds the element it would hold in the sorted array.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :param indexes: sorted distinct indexes to put in their place
+    :type indexes: list[int]
+    :param low: index of the first element of the range
+    :type low: int
+    :param high: index after the last element of the range
+    :type high: int
+    :param depth: random pivots to try before median of medians, defaults to
+        twice the number of bits of the length
+    :type depth: int, optional
+    """
+    depth = 2 * (high - low).bit_length() if depth is None else depth
+    stack = [(low, high, 0, len(indexes), depth)]
+    while stack:
+        low, high, first, last, depth = stack.pop()
+        if high - low <= _SORT_CUTOFF:
+            array[low:high] = sorted(array[low:high])
+            continue
+
+        if depth:
+            value, depth = array[randint(low, high - 1)], depth - 1
+        else:
+            value = _median_of_medians(array, low, high)
+
+        less, greater = _three_way_partition(array, low, high, value)
+        split_less = bisect_left(indexes, less, first, last)
+        split_greater = bisect_left(indexes, greater, split_less, last)
+        if first < split_less:
+            stack.append((low, less, first, split_less, depth))
+        if split_greater < last:
+            stack.append((greater, high, split_greater, last, depth))
+
+
+def _median_of_medians(array: List[int], low: int, high: int) -> int:
+    """
+    Median of the medians of groups of five in `array[low:high]`, it's
+    guaranteed to have at least 30% of the elements on each side.
+
+    :return: value of the pivot
+    :rtype: int
+    """
+    medians = [
+        sorted(array[i : min(i + 5, high)])[(min(i + 5, high) - i - 1) // 2]
+        for i in range(low, high, 5)
+    ]
+    middle = (len(medians) - 1) // 2
+    _introselect(medians, [middle], 0, len(medians), depth=0)
+    return medians[middle]
+
+
+def _three_way_partition(array: List[int], low: int, high: int, value: int) -> tuple:
+    """
+    Dutch national flag partition of `array[low:high]` around the value;
+    afterwards `[low, less)` are smaller, `[less, greater)` are equal
+    and `[greater, high)` are greater than the value.
+
+    :return: tuple of `less` and `greater` boundaries
+    :rtype: tuple[int, int]
+    """
+    less, index, greater = low, low, high
+    while index < greater:
+        item = array[index]
+        if item < value:
+            array[index], array[less] = array[less], item
+            less += 1
+            index += 1
+        elif value < item:
+            greater -= 1
+            array[index], array[greater] = array[greater], item
+        else:
+            index += 1
 
-    return array[pivot]  # base case
+    return less, greater
 
 
 def partition(array: List[int], *, start: int, end: int) -> int:
@@ -47,6 +162,7 @@ def partition(array: List[int], *, start: int, end: int) -> int:
         2- and put all greater elements (greater than x) after x.
 
     All this should be done in linear time.
+    The swaps are counted as moves inside `count_operations`.
 
     :param array: list of integer numbers that we want applied pivot partition
     :type array: list[int]
@@ -60,7 +176,7 @@ def partition(array: List[int], *, start: int, end: int) -> int:
     random = randint(start, end)
     array[random], array[end] = array[end], array[random]  # swap random pivot
 
-    pivot, left, right = array[end], start, end - 1
+    pivot, left, right, swaps = array[end], start, end - 1, 2
     while left <= right:
         while left < end and array[left] <= pivot:
             left += 1
@@ -69,6 +185,8 @@ def partition(array: List[int], *, start: int, end: int) -> int:
 
         if left < right:
             array[left], array[right] = array[right], array[left]  # swap bubble
+            swaps += 1
 
     array[left], array[end] = array[end], array[left]  # swap pivot
+    count_moves(array, 2 * swaps)
     return left
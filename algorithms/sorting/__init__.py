@@ -1,23 +1,53 @@
 """
 Functions of the Sorting Algorithms are implemented
-"""
-from .counting_sort import counting_sort
-from .insertion_sort import insertion_sort
-from .bubble_sort import bubble_sort
-from .selection_sort import selection_sort
-from .merge_sort import merge_sort
-from .bucket_sort import bucket_sort
-from .heap_sort import heap_sort
-from .quick_sort import quick_sort
 
+Every function is imported from its module on the first access.
+"""
+from _lazy import lazy_package
 
 __all__ = (
     "counting_sort",
     "insertion_sort",
+    "binary_insertion_sort",
     "bubble_sort",
     "selection_sort",
     "merge_sort",
+    "tim_sort",
     "bucket_sort",
+    "string_sort",
     "heap_sort",
     "quick_sort",
+    "radix_sort",
+    "parallel_sort",
+    "external_sort",
+    "partial_sort",
+    "nsmallest",
+    "nlargest",
+    "sort",
+    "choose_sort",
+)
+
+lazy_package(
+    __name__,
+    {
+        "counting_sort": ".counting_sort",
+        "insertion_sort": ".insertion_sort",
+        "binary_insertion_sort": ".insertion_sort",
+        "bubble_sort": ".bubble_sort",
+        "selection_sort": ".selection_sort",
+        "merge_sort": ".merge_sort",
+        "tim_sort": ".tim_sort",
+        "bucket_sort": ".bucket_sort",
+        "string_sort": ".string_sort",
+        "heap_sort": ".heap_sort",
+        "quick_sort": ".quick_sort",
+        "radix_sort": ".radix_sort",
+        "parallel_sort": ".parallel_sort",
+        "external_sort": ".external_sort",
+        "partial_sort": ".partial_sort",
+        "nsmallest": ".partial_sort",
+        "nlargest": ".partial_sort",
+        "sort": ".auto_sort",
+        "choose_sort": ".auto_sort",
+    },
 )
@@ -0,0 +1,32 @@
+from typing import Any, Iterable, Iterator
+
+from data_structures import MinHeap
+
+_EMPTY = object()  # sentinel of an exhausted iterator
+
+
+def k_way_merge(iterables: Iterable[Iterable[Any]]) -> Iterator[Any]:
+    """Stable lazy merge of the sorted iterables with a `MinHeap` of their heads;
+    the head of an iterator is replaced with its next element in one bubble down.
+    It's shared by the parallel and the external sorts.
+
+    :param iterables: sorted iterables (lists, files, ...) of the elements
+    :type iterables: Iterable[Iterable[Any]]
+    :return: iterator over all the elements in sorted order
+    :rtype: Iterator[Any]
+    """
+    iterators, heap = [iter(iterable) for iterable in iterables], MinHeap()
+    for index, iterator in enumerate(iterators):
+        value = next(iterator, _EMPTY)
+        if value is not _EMPTY:
+            heap.insert((value, index))
+
+    while not heap.is_empty:
+        value, index = heap.top
+        yield value
+
+        value = next(iterators[index], _EMPTY)
+        if value is _EMPTY:
+            heap.delete()
+        else:
+            heap.replace((value, index))
@@ -0,0 +1,232 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional, Callable, List, Tuple
+
+from .counting_sort import counting_sort, _BUDGET
+from .insertion_sort import insertion_sort
+from .merge_sort import merge_sort
+from .tim_sort import tim_sort
+from .string_sort import string_sort
+from .heap_sort import heap_sort
+from .quick_sort import quick_sort
+from .radix_sort import radix_sort
+
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())  # the application configures logging
+
+ENGINES = {
+    "insertion_sort": (insertion_sort, {"binary": True}),
+    "counting_sort": (counting_sort, {}),
+    "radix_sort": (radix_sort, {}),
+    "string_sort": (string_sort, {}),
+    "tim_sort": (tim_sort, {}),
+    "merge_sort": (merge_sort, {"bottom_up": True}),
+    "quick_sort": (quick_sort, {"intro": True}),
+    "heap_sort": (heap_sort, {"in_place": True}),
+}
+
+
+@dataclass
+class Thresholds:
+    """Tunable limits of the dispatcher, `benchmarks.auto_sort` calibrates them."""
+
+    insertion: int = 32  # arrays up to this size go to insertion sort
+    counting: float = 2.0  # counting sort while range <= counting * size
+    radix: Optional[int] = None  # integer arrays from this size go to radix sort
+    presorted: float = 0.9  # ordered pairs ratio of the sample to use tim sort
+    duplicates: float = 0.5  # repeated values ratio of the sample for 3-way quick
+    default: str = "quick_sort"  # fastest engine on random data
+
+
+@dataclass
+class Decision:
+    """The chosen engine with the sampled statistics which led to it."""
+
+    algorithm: str
+    reason: str
+    size: int
+    kind: str = "any"
+    presorted: float = 0.0
+    duplicates: float = 0.0
+    value_range: Optional[int] = None
+    options: dict = field(default_factory=dict)
+
+
+def choose_sort(
+    array: List[Any],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    thresholds: Optional[Thresholds] = None,
+    sample: int = 256,
+) -> Decision:
+    """
+    Sample the array and choose the best sorting engine for it:
+
+        1- tiny arrays go to insertion sort.\n
+        2- integer numbers of a narrow range go to counting sort,
+        large ones of a wide range go to radix sort.\n
+        3- strings and bytes go to three-way radix quick sort.\n
+        4- nearly sorted (or reversed) arrays go to tim sort.\n
+        5- many duplicates go to three-way introsort.\n
+        6- others go to the calibrated default engine.
+
+    :param array: list of items that we want sort
+    :type array: list[Any]
+    :param key: function to extract the comparison key of items, defaults to None
+    :type key: Callable[[Any], Any], optional
+    :param thresholds: tunable limits of the choice, defaults to Thresholds()
+    :type thresholds: Thresholds, optional
+    :param sample: number of sampled items, defaults to 256
+    :type sample: int, optional
+    :return: decision of the algorithm with the sampled statistics
+    :rtype: Decision
+    """
+    thresholds, size = thresholds or Thresholds(), len(array)
+    if size <= thresholds.insertion:
+        return Decision("insertion_sort", "small array", size)
+
+    items = _sample(array, sample)
+    keys = items if key is None else [key(item) for item in items]
+    kind = _kind(keys)
+    presorted, duplicates = _presorted(keys), _duplicates(keys)
+    decision = Decision(
+        thresholds.default, "default engine", size, kind, presorted, duplicates
+    )
+
+    if kind == "int" and key is None:
+        decision.value_range = _int_range(array)
+
+    if decision.value_range is not None:
+        if decision.value_range <= min(thresholds.counting * size, _BUDGET):
+            decision.algorithm, decision.reason = "counting_sort", "narrow range"
+            return decision
+        if thresholds.radix is not None and size >= thresholds.radix:
+            decision.algorithm, decision.reason = "radix_sort", "large integers"
+            return decision
+
+    if kind == "str":
+        decision.algorithm, decision.reason = "string_sort", "strings"
+    elif presorted >= thresholds.presorted:
+        decision.algorithm, decision.reason = "tim_sort", "nearly sorted"
+    elif duplicates >= thresholds.duplicates:
+        decision.algorithm, decision.reason = "quick_sort", "many duplicates"
+
+    decision.options = ENGINES[decision.algorithm][1]
+    return decision
+
+
+def sort(
+    array: List[Any],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    thresholds: Optional[Thresholds] = None,
+) -> List[Any]:
+    """
+    ## Sort
+    Sort the array with the engine chosen by `choose_sort` from the sampled input;
+    the decision is logged in debug level.
+
+    :param array: list of items that we want sort
+    :type array: list[Any]
+    :param key: function to extract the comparison key of items, defaults to None
+    :type key: Callable[[Any], Any], optional
+    :param reverse: sort in descending order, defaults to False
+    :type reverse: bool, optional
+    :param thresholds: tunable limits of the choice, defaults to Thresholds()
+    :type thresholds: Thresholds, optional
+    :return: list of sorted items
+    :rtype: list[Any]
+    """
+    decision = choose_sort(array, key=key, thresholds=thresholds)
+    logger.debug(decision)
+
+    function, options = ENGINES[decision.algorithm]
+    return function(array, key=key, reverse=reverse, **options)
+
+
+def _sample(array: List[Any], count: int) -> List[Any]:
+    """Windows of 16 consecutive items evenly spread over the array.
+
+    :param array: list of items
+    :type array: list[Any]
+    :param count: the total number of sampled items
+    :type count: int
+    :return: list of the sampled items
+    :rtype: list[Any]
+    """
+    size, window = len(array), 16
+    if size <= count:
+        return list(array)
+
+    step, result = (size - window) // max(1, count // window - 1), []
+    for start in range(0, size - window + 1, step):
+        result += array[start : start + window]
+    return result
+
+
+def _int_range(array: List[Any]) -> Optional[int]:
+    """Range of the values if every item is an `int`, checked in a single pass.
+
+    :param array: non-empty list of items
+    :type array: list[Any]
+    :return: the number of values between the minimum and the maximum, or None
+    :rtype: int, optional
+    """
+    low = high = array[0]
+    for item in array:
+        if type(item) is not int:
+            return None
+        if item < low:
+            low = item
+        elif high < item:
+            high = item
+
+    return high - low + 1
+
+
+def _kind(keys: List[Any]) -> str:
+    """Kind of the sampled keys; `int`, `str` (or bytes) or `any`."""
+    if all(type(item) is int for item in keys):
+        return "int"
+    if all(type(item) is str for item in keys) or all(
+        type(item) is bytes for item in keys
+    ):
+        return "str"
+    return "any"
+
+
+def _presorted(keys: List[Any]) -> float:
+    """Ratio of the adjacent pairs of the sample in one direction, the major one.
+
+    :param keys: sampled keys in windows of 16 consecutive items
+    :type keys: list[Any]
+    :return: float number between `0.5` and `1`
+    :rtype: float
+    """
+    pairs: List[Tuple[Any, Any]] = [
+        (keys[index], keys[index + 1])
+        for index in range(len(keys) - 1)
+        if (index + 1) % 16  # pairs inside of a window
+    ]
+    descending = sum(1 for first, second in pairs if second < first)
+    ascending = sum(1 for first, second in pairs if first < second)
+    equal = len(pairs) - ascending - descending
+    return (max(ascending, descending) + equal) / max(1, len(pairs))
+
+
+def _duplicates(keys: List[Any]) -> float:
+    """Ratio of the repeated keys of the sample, without hashing them;
+    the equal neighbours of the sorted sample are counted.
+
+    :param keys: sampled keys
+    :type keys: list[Any]
+    :return: float number between `0` and `1`
+    :rtype: float
+    """
+    keys = sorted(keys)
+    repeated = sum(
+        1 for index in range(1, len(keys)) if not keys[index - 1] < keys[index]
+    )
+    return repeated / len(keys)
@@ -1,5 +1,4 @@
-from typing import List, Callable
-from string import ascii_lowercase
+from typing import Any, Dict, List, Callable, Optional
 
 from ..decorators import process_timer
 from .insertion_sort import insertion_sort
@@ -9,6 +8,8 @@ from .insertion_sort import insertion_sort
 def bucket_sort(
     array: List[str],
     *,
+    key: Optional[Callable[[Any], str]] = None,
+    reverse: bool = False,
     function: Callable[[list], list] = insertion_sort,
 ) -> List[str]:
     """
@@ -18,19 +19,43 @@ def bucket_sort(
     `Counting Sort` can not be applied here as we use keys as index in counting sort;
     Here keys are floating point numbers.
 
+    The strings are distributed by their first character into buckets, which are
+    created on demand; so any unicode character works and empty strings come first.
+    For big or skewed inputs pass `function=string_sort` to sort the buckets.
+
+    With a `key` function the records are distributed by the first character of
+    their keys, computed once; the buckets hold `(key, index)` tuples so equal
+    keys keep the order of their records.
+
     :param array: list of string characters that we want sort
     :type array: list[str]
+    :param key: function to extract the string key of records, defaults to None
+    :type key: Callable[[Any], str], optional
+    :param reverse: sort in descending order, defaults to False
+    :type reverse: bool, optional
     :param function: keyword argument sorting function, defaults to insertion_sort
     :type function: Callable[[list], list], optional
     :return: list of sorted string characters with bucket sort algorithm
     :rtype: list[str]
     """
-    buckets = {char: [] for char in ascii_lowercase}  # dictionary comprehension
-    for element in array:
-        buckets[element[0]].append(element)
+    if reverse:  # reversed, sorted and reversed back keeps the equal keys order
+        array = array[::-1]
+
+    buckets: Dict[str, list] = {}
+    if key is None:
+        for element in array:
+            buckets.setdefault(element[:1], []).append(element)
+    else:
+        for index, element in enumerate(array):
+            value = key(element)
+            buckets.setdefault(value[:1], []).append((value, index))
 
     result = []
-    for bucket in buckets.values():
-        result += function(bucket)
+    for char in sorted(buckets):
+        result += function(buckets[char])
 
+    if key is not None:
+        result = [array[index] for _, index in result]
+    if reverse:
+        result.reverse()
     return result
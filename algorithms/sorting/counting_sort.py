@@ -1,12 +1,21 @@
-from collections import Counter
-from typing import List, Tuple
-from functools import reduce
+from typing import Any, Optional, Callable, List
 
 from ..decorators import process_timer
 
 
+_BUDGET = 1 << 22  # number of counters, about 32 MB of list slots
+
+
 @process_timer
-def counting_sort(array: List[int]) -> List[int]:
+def counting_sort(
+    array: List[Any],
+    *,
+    key: Optional[Callable[[Any], int]] = None,
+    reverse: bool = False,
+    permutation: bool = False,
+    budget: int = _BUDGET,
+    fallback: bool = True,
+) -> List[Any]:
     """
     ## Counting Sort
     Counting sort is efficient if the range of input data
@@ -14,36 +23,72 @@ def counting_sort(array: List[int]) -> List[int]:
 
     for example the input sequence is between range 1 to 10 and the data is 1, 2, 5, 10.
 
-    Time complexity: `O(n)`, where n is total number of elements
-    Auxiliary Space: `O(n)`, It uses a temp array making it a non In Place algorithm.
+    Time complexity: `O(n + k)`, where n is total number of elements and k the range
+    Auxiliary Space: `O(n + k)`, It uses temp arrays; a non In Place algorithm.
+
+    ### Key-Indexed Counting
+    With a `key` function the records are sorted by their small integer keys;
+    the counts are turned into start positions with prefix sums and every record
+    is placed once, so the sort is stable; in `reverse` the slots are counted
+    down from the maximum to stay stable. With `permutation` the indexes of the
+    records in sorted order are returned instead of the records themselves.
 
-    :param array: list of integer numbers that we want sort
+    When the range of the keys needs more counters than `budget`,
+    it falls back to a stable comparison sort or raises if `fallback` is disabled.
+
+    :raises ValueError: if the range exceeds the budget and fallback is disabled
+    :param array: list of integer numbers (or records with key) that we want sort
     :type array: list[int]
+    :param key: function to extract the integer key of records, defaults to None
+    :type key: Callable[[Any], int], optional
+    :param reverse: sort in descending order of keys, defaults to False
+    :type reverse: bool, optional
+    :param permutation: return the sorted order of indexes, defaults to False
+    :type permutation: bool, optional
+    :param budget: maximum number of counters to allocate, defaults to `2^22`
+    :type budget: int, optional
+    :param fallback: use a comparison sort when over budget, defaults to True
+    :type fallback: bool, optional
     :return: list of sorted integer number with counting sort algorithm
     :rtype: list[int]
     """
-    minimum, maximum = reduce(_minimum_maximum, array, (array[0], array[0]))
-    counter = {i: 0 for i in range(minimum, maximum + 1)}  # dictionary comprehension
-    counter.update(Counter(array))
+    length = len(array)
+    if length == 0:
+        return []
 
-    result = []
-    for key, value in counter.items():
-        result += [key] * value
-    return result
+    keys = array if key is None else [key(element) for element in array]
+    minimum, maximum = min(keys), max(keys)
+    size = maximum - minimum + 1
+    if size > budget:
+        if not fallback:
+            raise ValueError("Range of keys exceeds the counting sort budget.")
 
+        order = sorted(range(length), key=keys.__getitem__, reverse=reverse)
+        return order if permutation else [array[index] for index in order]
 
-def _minimum_maximum(accumulator: Tuple[int, int], element: int) -> Tuple[int, int]:
-    """Used in reduce function to find minimum and maximum number in one loop.
+    # slot of a key is its distance from minimum, or from maximum in reverse
+    origin, sign = (maximum, -1) if reverse else (minimum, 1)
+    counts = [0] * size
+    for element in keys:
+        counts[(element - origin) * sign] += 1
 
-    :param accumulator: tuple of minimum and maximum number
-    :type accumulator: tuple[int, int]
-    :param element: an integer number to compare with min and max
-    :type element: int
-    :return: returned the tuple of two integer number min and max
-    :rtype: tuple[int, int]
-    """
-    minimum, maximum = accumulator
-    return (
-        element if element < minimum else minimum,
-        element if element > maximum else maximum,
-    )
+    result: List[Any] = [None] * length
+    if key is None and not permutation:  # plain integers; write blocks of values
+        position = 0
+        for slot, count in enumerate(counts):
+            if count:
+                result[position : position + count] = [origin + slot * sign] * count
+                position += count
+
+        return result
+
+    total = 0
+    for index, count in enumerate(counts):  # prefix sums of the start positions
+        counts[index], total = total, total + count
+
+    for index, element in enumerate(keys):
+        slot = (element - origin) * sign
+        result[counts[slot]] = index if permutation else array[index]
+        counts[slot] += 1
+
+    return result
@@ -0,0 +1,269 @@
+import mmap
+import os
+import sys
+from argparse import ArgumentParser
+from array import array as ArrayType
+from tempfile import TemporaryDirectory
+from typing import Optional, Callable, Iterable, Iterator, List, Sequence
+
+from ._merge import k_way_merge
+from .tim_sort import tim_sort
+
+
+def external_sort(
+    source: str,
+    target: str,
+    *,
+    typecode: Optional[str] = None,
+    memory: int = 64 * 2**20,
+    fan_in: int = 16,
+    algorithm: Callable[[list], list] = tim_sort,
+    temp_dir: Optional[str] = None,
+) -> int:
+    """
+    ## External Sort
+    External sorting is required when the data doesn't fit into the main memory.
+    It's a sort-merge strategy in two phases:
+
+        1- The file is read in chunks of `memory` bytes, every chunk is sorted in
+        memory with `algorithm` and spilled to a temporary binary run file.\n
+        2- The runs are merged with a k-way merge on a `MinHeap`, at most `fan_in`
+        at a time; the runs are read through memory maps in buffered blocks.
+
+    The records are fixed-width integer numbers of the `array` module `typecode`,
+    or newline separated byte lines if no typecode is given. The chunks and the
+    merge buffers are sized by the footprint of the records as Python objects
+    (an `int` of 8 bytes takes about 44 bytes in a list), not by their raw bytes.
+
+    ### Time Complexity: `O(n*log(n))` with `O(log_f(n/m))` merge passes on disk
+    ### Auxiliary Space: `O(m)` of memory and `O(n)` of disk
+
+    :raises ValueError: if the fan-in is less than two or the size of the source
+        isn't a multiple of the typecode item size
+    :param source: path of the input file to sort
+    :type source: str
+    :param target: path of the output file to write the sorted records
+    :type target: str
+    :param typecode: `array` typecode of fixed-width numbers, defaults to lines
+    :type typecode: str, optional
+    :param memory: memory budget in bytes, defaults to 64 MB
+    :type memory: int, optional
+    :param fan_in: maximum number of runs merged at once, defaults to 16
+    :type fan_in: int, optional
+    :param algorithm: in memory sorting function of the chunks, defaults to tim_sort
+    :type algorithm: Callable[[list], list], optional
+    :param temp_dir: directory to spill the runs, defaults to the system one
+    :type temp_dir: str, optional
+    :return: the number of records written into the target file
+    :rtype: int
+    """
+    if fan_in < 2:
+        raise ValueError("Fan-in must be at least two.")
+
+    size = os.path.getsize(source)
+    if typecode and size % ArrayType(typecode).itemsize:
+        raise ValueError(f"Source size isn't a multiple of {typecode!r} item size.")
+
+    # numbers per read buffer, lines are buffered by the memory maps
+    block = max(1, memory // ((fan_in + 1) * _footprint(typecode))) if typecode else 1
+    with TemporaryDirectory(dir=temp_dir) as directory:
+        runs, count = [], 0
+        for chunk in _read_chunks(source, typecode, memory):
+            runs.append(os.path.join(directory, f"run-{len(runs)}"))
+            _write_run(runs[-1], typecode, algorithm(chunk), block)
+            count += len(chunk)
+
+        passes = 0
+        while len(runs) > fan_in:  # intermediate merge passes
+            merged, passes = [], passes + 1
+            for start in range(0, len(runs), fan_in):
+                merged.append(os.path.join(directory, f"merge-{passes}-{start}"))
+                _merge_files(runs[start : start + fan_in], merged[-1], typecode, block)
+                for path in runs[start : start + fan_in]:
+                    os.remove(path)
+
+            runs = merged
+
+        _merge_files(runs, target, typecode, block)
+
+    if typecode is None and count and not _ends_with_newline(source, size):
+        os.truncate(target, size)  # the newline added to the last line of the input
+    return count
+
+
+def _footprint(typecode: str) -> int:
+    """Bytes of a number of the typecode in a list; the object and its pointer.
+
+    :param typecode: `array` typecode of numbers
+    :type typecode: str
+    :return: number of bytes of every record in memory
+    :rtype: int
+    """
+    numbers = ArrayType(typecode)
+    wide = ArrayType(typecode, b"\x7f" * numbers.itemsize)[0]  # a large value
+    return sys.getsizeof(wide) + 8
+
+
+def _ends_with_newline(path: str, size: int) -> bool:
+    """Whether the file ends with a newline, or is empty.
+
+    :param path: path of the file
+    :type path: str
+    :param size: size of the file in bytes
+    :type size: int
+    :return: flag of the last byte being a newline
+    :rtype: bool
+    """
+    with open(path, "rb") as file:
+        file.seek(max(0, size - 1))
+        return file.read(1) in (b"\n", b"")
+
+
+def _read_chunks(path: str, typecode: Optional[str], memory: int) -> Iterator[list]:
+    """Read the input file in chunks of records taking about `memory` bytes.
+
+    :param path: path of the input file
+    :type path: str
+    :param typecode: `array` typecode of numbers or None for lines
+    :type typecode: str, optional
+    :param memory: number of bytes of every chunk as Python objects
+    :type memory: int
+    :return: iterator over the list of records of every chunk
+    :rtype: Iterator[list]
+    """
+    with open(path, "rb") as file:
+        if typecode is None:
+            lines, used, overhead = [], 0, sys.getsizeof(b"") + 8
+            for line in file:
+                if not line.endswith(b"\n"):  # the last one, removed after the merge
+                    line += b"\n"
+                lines.append(line)
+                used += len(line) + overhead
+                if used >= memory:
+                    yield lines
+                    lines, used = [], 0
+
+            if lines:
+                yield lines
+            return
+
+        numbers = ArrayType(typecode)
+        size = max(1, memory // _footprint(typecode)) * numbers.itemsize
+        while data := file.read(size):
+            numbers.frombytes(data)
+            yield numbers.tolist()
+            del numbers[:]
+
+
+def _write_run(
+    path: str,
+    typecode: Optional[str],
+    records: Iterable,
+    block: int,
+):
+    """Write the sorted records into a binary run file with buffered blocks.
+
+    :param path: path of the run file
+    :type path: str
+    :param typecode: `array` typecode of numbers or None for lines
+    :type typecode: str, optional
+    :param records: iterable of sorted records
+    :type records: Iterable
+    :param block: number of numbers written at once
+    :type block: int
+    """
+    with open(path, "wb") as file:
+        if typecode is None:
+            file.writelines(records)
+            return
+
+        buffer = ArrayType(typecode)
+        for record in records:
+            buffer.append(record)
+            if len(buffer) == block:
+                buffer.tofile(file)
+                del buffer[:]
+
+        buffer.tofile(file)
+
+
+def _read_run(path: str, typecode: Optional[str], block: int) -> Iterator:
+    """Iterate over the records of a run file through a memory map.
+
+    :param path: path of the run file
+    :type path: str
+    :param typecode: `array` typecode of numbers or None for lines
+    :type typecode: str, optional
+    :param block: number of numbers decoded at once
+    :type block: int
+    :return: iterator over the records of the run
+    :rtype: Iterator
+    """
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if typecode is None:
+                yield from iter(mapped.readline, b"")
+                return
+
+            view = memoryview(mapped).cast(typecode)
+            try:
+                for start in range(0, len(view), block):
+                    yield from view[start : start + block].tolist()
+            finally:
+                view.release()
+
+
+def _merge_files(
+    paths: List[str],
+    target: str,
+    typecode: Optional[str],
+    block: int,
+):
+    """K-way merge of the sorted run files into the target file.
+
+    :param paths: paths of the sorted run files
+    :type paths: list[str]
+    :param target: path of the merged output file
+    :type target: str
+    :param typecode: `array` typecode of numbers or None for lines
+    :type typecode: str, optional
+    :param block: number of numbers read and written at once
+    :type block: int
+    """
+    readers = [_read_run(path, typecode, block) for path in paths]
+    _write_run(target, typecode, k_way_merge(readers), block)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    Command line entry point to sort a file into an output file:
+
+        python -m algorithms.sorting.external_sort input output --typecode q
+    """
+    parser = ArgumentParser(description="Sort a file larger than the memory.")
+    parser.add_argument("source", help="path of the input file")
+    parser.add_argument("target", help="path of the sorted output file")
+    parser.add_argument(
+        "--typecode",
+        help="array typecode of fixed-width numbers, default newline records",
+    )
+    parser.add_argument(
+        "--memory", type=int, default=64 * 2**20, help="memory budget in bytes"
+    )
+    parser.add_argument("--fan-in", type=int, default=16, help="runs merged at once")
+    parser.add_argument("--temp-dir", help="directory of the temporary runs")
+    arguments = parser.parse_args(argv)
+
+    count = external_sort(
+        arguments.source,
+        arguments.target,
+        typecode=arguments.typecode,
+        memory=arguments.memory,
+        fan_in=arguments.fan_in,
+        temp_dir=arguments.temp_dir,
+    )
+    print(f"{count} records sorted into {arguments.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 from typing import List
 
 from data_structures import MinHeap, MaxHeap
-from ..decorators import process_timer
+from ..decorators import process_timer, keyed_sort
 
 
 @process_timer
-def heap_sort(array: List[int], reverse: bool = False) -> List[int]:
+@keyed_sort
+def heap_sort(
+    array: List[int],
+    reverse: bool = False,
+    *,
+    in_place: bool = False,
+) -> List[int]:
     """
     ## Heap Sort
     Is a comparison-based sorting technique based on a Binary Heap data structure.
@@ -20,13 +26,28 @@ def heap_sort(array: List[int], reverse: bool = False) -> List[int]:
 
     ### Auxiliary Space: `O(n)`
 
+    ### In Place Mode
+    With `in_place` the array itself is heapified as a max heap and the maximum
+    is swapped to the end repeatedly; no heap object nor result list is built,
+    so the auxiliary space is `O(1)`. The sift down is Floyd's bottom-up one:
+    the hole goes down to a leaf by the greater child and the item bubbles up,
+    which saves about half of the comparisons.
+
     :param array: list of integer numbers that we want sort
     :type array: list[int]
     :param reverse: set reverse or normal sorting, defaults to False
     :type reverse: bool, optional
+    :param in_place: sort the array in place without a heap object, defaults to False
+    :type in_place: bool, optional
     :return: list of sorted integer number with heap sort algorithm
     :rtype: list[int]
     """
+    if in_place:
+        _heap_sort_range(array, 0, len(array))
+        if reverse:
+            array.reverse()
+        return array
+
     Heap = MaxHeap if reverse else MinHeap
     heap, length = Heap(*array), len(array)
 
@@ -35,3 +56,52 @@ def heap_sort(array: List[int], reverse: bool = False) -> List[int]:
         result[i] = heap.delete()
 
     return result
+
+
+def _heap_sort_range(array: List[int], low: int, high: int):
+    """In place heap sort of the range `array[low:high]` with a max heap.
+
+    :param array: list of integer numbers that we want sort
+    :type array: list[int]
+    :param low: index of the first element of the range
+    :type low: int
+    :param high: index after the last element of the range
+    :type high: int
+    """
+    length = high - low
+    for index in range(length // 2 - 1, -1, -1):  # Floyd's build heap
+        _sift_down(array, low, index, length)
+
+    for last in range(high - 1, low, -1):
+        array[low], array[last] = array[last], array[low]
+        _sift_down(array, low, 0, last - low)
+
+
+def _sift_down(array: List[int], offset: int, index: int, length: int):
+    """
+    Bottom-up bubble down of a node of the max heap in `array[offset:offset+length]`;
+    the hole walks down to a leaf by the greater child and the item bubbles up.
+
+    :param array: list of integer numbers holding the heap
+    :type array: list[int]
+    :param offset: index of the heap root into the array
+    :type offset: int
+    :param index: heap index of the node to bubble down
+    :type index: int
+    :param length: number of nodes in the heap
+    :type length: int
+    """
+    start, item, child = index, array[offset + index], 2 * index + 1
+    while child < length:
+        if child + 1 < length and not array[offset + child + 1] < array[offset + child]:
+            child += 1
+
+        array[offset + index] = array[offset + child]
+        index, child = child, 2 * child + 1
+
+    parent = (index - 1) // 2
+    while start < index and array[offset + parent] < item:
+        array[offset + index] = array[offset + parent]
+        index, parent = parent, (parent - 1) // 2
+
+    array[offset + index] = item
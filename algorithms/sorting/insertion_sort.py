@@ -1,10 +1,12 @@
-from typing import List
+from bisect import bisect_right
+from typing import Optional, List
 
-from ..decorators import process_timer
+from ..decorators import process_timer, keyed_sort
 
 
 @process_timer
-def insertion_sort(array: List[int]) -> List[int]:
+@keyed_sort
+def insertion_sort(array: List[int], *, binary: bool = False) -> List[int]:
     """
     ## Insertion Sort
     Insertion sort is used when number of elements is small.
@@ -15,12 +17,20 @@ def insertion_sort(array: List[int]) -> List[int]:
     Time Complexity: `O(N^2)`, If items are reverse order, worst case complexity occurs.
     Auxiliary Space: `O(1)`, insertion sort is an in-place sorting algorithm.
 
+    With `binary` it runs the `binary_insertion_sort` kernel.
+
     :param array: list of integer numbers that we want sort
     :type array: list[int]
+    :param binary: find positions with bisection and move blocks, defaults to False
+    :type binary: bool, optional
     :return: list of sorted integer number with insertion sort algorithm
     :rtype: list[int]
     """
-    for index, item in enumerate(array[1:], start=1):
+    if binary:
+        return binary_insertion_sort(array)
+
+    for index in range(1, len(array)):
+        item = array[index]
         while 0 < index and item < array[index - 1]:
             array[index] = array[index - 1]
             index -= 1
@@ -28,3 +38,51 @@ def insertion_sort(array: List[int]) -> List[int]:
         array[index] = item
 
     return array
+
+
+def binary_insertion_sort(
+    array: List[int],
+    low: int = 0,
+    high: Optional[int] = None,
+    *,
+    start: Optional[int] = None,
+) -> List[int]:
+    """
+    ## Binary Insertion Sort
+    Insertion sort of `array[low:high]` in place, the insertion point is located
+    with bisection (`O(log(n))` comparisons) and the greater elements are moved
+    as one block with slice assignment instead of one at a time.
+    The already sorted prefix is skipped in one linear scan,
+    so a sorted range costs `n - 1` comparisons and no moves.
+
+    It isn't wrapped with the process timer;
+    the small range kernel of the other sorting algorithms.
+
+    Time Complexity: `O(n*log(n))` comparisons and `O(N^2)` moves in the worst case.
+    Auxiliary Space: `O(1)`, binary insertion sort is an in-place sorting algorithm.
+
+    :param array: list of integer numbers that we want sort
+    :type array: list[int]
+    :param low: index of the first element of the range, defaults to 0
+    :type low: int, optional
+    :param high: index after the last element of the range, defaults to the length
+    :type high: int, optional
+    :param start: index of the first element after a known sorted prefix
+    :type start: int, optional
+    :return: list of sorted integer number with binary insertion sort algorithm
+    :rtype: list[int]
+    """
+    high = len(array) if high is None else high
+    if start is None:  # skip the sorted prefix
+        start = low + 1
+        while start < high and not array[start] < array[start - 1]:
+            start += 1
+
+    for index in range(start, high):
+        item = array[index]
+        position = bisect_right(array, item, low, index)
+        if position < index:
+            array[position + 1 : index + 1] = array[position:index]
+            array[position] = item
+
+    return array
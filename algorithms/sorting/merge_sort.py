@@ -1,10 +1,12 @@
-from typing import List, Tuple
+from typing import Optional, List, Tuple
 
-from ..decorators import process_timer
+from ..counters import count_moves
+from ..decorators import process_timer, keyed_sort
 
 
 @process_timer
-def merge_sort(array: List[int]) -> List[int]:
+@keyed_sort
+def merge_sort(array: List[int], *, bottom_up: bool = False) -> List[int]:
     """
     ## Merge Sort
     Merge Sort is a Divide and Conquer algorithm. It divides input array in two halves,
@@ -17,11 +19,21 @@ def merge_sort(array: List[int]) -> List[int]:
         * In merge sort all elements are copied into an auxiliary array .
         * so N auxiliary space is required for merge sort.
 
+    ### Bottom-Up Mode
+    With `bottom_up` the array is sorted iteratively: runs of width 1, 2, 4, ...
+    are merged back and forth between the input and one preallocated buffer,
+    so there is no recursion, no slicing per level and only one timed call.
+
     :param array: list of integer numbers that we want sort
     :type array: list[int]
+    :param bottom_up: use iterative bottom-up merging, defaults to False
+    :type bottom_up: bool, optional
     :return: list of sorted integer number with merge sort algorithm
     :rtype: list[int]
     """
+    if bottom_up:
+        return _bottom_up_merge_sort(array)
+
     length = len(array)
     if length <= 1:  # base case
         return array
@@ -44,6 +56,7 @@ def _merge_arrays(one: Tuple[List[int], int], two: Tuple[List[int], int]) -> Lis
     :rtype: list[int]
     """
     result, i, j = [], 0, 0
+    count_moves(result, one[1] + two[1])
     while i < one[1] and j < two[1]:
         if one[0][i] < two[0][j]:
             result.append(one[0][i])
@@ -53,3 +66,67 @@ def _merge_arrays(one: Tuple[List[int], int], two: Tuple[List[int], int]) -> Lis
             j += 1
 
     return result + one[0][i:] + two[0][j:]
+
+
+def _bottom_up_merge_sort(array: List[int]) -> List[int]:
+    """Iterative merge sort that ping-pongs between the array and a single buffer.
+
+    :param array: list of integer numbers that we want sort in place
+    :type array: list[int]
+    :return: the same list object sorted in ascending order
+    :rtype: list[int]
+    """
+    length = len(array)
+    source: List[Optional[int]] = array
+    target: List[Optional[int]] = [None] * length
+
+    width = 1
+    while width < length:
+        for start in range(0, length, 2 * width):
+            middle = min(start + width, length)
+            _merge_runs(source, target, start, middle, min(middle + width, length))
+
+        count_moves(target, length)
+        source, target = target, source
+        width *= 2
+
+    if source is not array:
+        array[:] = source
+
+    return array
+
+
+def _merge_runs(
+    source: List[int],
+    target: List[int],
+    start: int,
+    middle: int,
+    end: int,
+):
+    """Stable merge of `source[start:middle]` and `source[middle:end]` into target.
+
+    :param source: list holding the two adjacent sorted runs
+    :type source: list[int]
+    :param target: list receiving the merged run at the same positions
+    :type target: list[int]
+    :param start: index of the first element of the left run
+    :type start: int
+    :param middle: index of the first element of the right run
+    :type middle: int
+    :param end: index after the last element of the right run
+    :type end: int
+    """
+    i, j, k = start, middle, start
+    while i < middle and j < end:
+        if source[j] < source[i]:
+            target[k] = source[j]
+            j += 1
+        else:
+            target[k] = source[i]
+            i += 1
+        k += 1
+
+    if i < middle:
+        target[k:end] = source[i:middle]
+    else:
+        target[k:end] = source[j:end]
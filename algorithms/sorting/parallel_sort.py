@@ -0,0 +1,109 @@
+import os
+from array import array as ArrayType
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Callable, List
+
+from ..decorators import process_timer, keyed_sort
+from ._merge import k_way_merge
+from .merge_sort import merge_sort
+
+
+@process_timer
+@keyed_sort
+def parallel_sort(
+    array: List[int],
+    *,
+    workers: Optional[int] = None,
+    algorithm: Callable[[list], list] = merge_sort,
+    typecode: str = "q",
+) -> List[int]:
+    """
+    ## Parallel Sort
+    The array is split into one chunk per worker, every chunk is sorted in its own
+    process with any of the sorting algorithms and the sorted chunks are merged
+    with a k-way merge on a `MinHeap` of the chunk heads.
+
+    The integer numbers are moved to the workers through a block of shared memory
+    packed with the `typecode` of `array` module, so nothing is pickled but the
+    offsets; other elements fall back to pickling the chunks.
+
+    ### Time Complexity: `O(n/p*log(n/p) + n*log(p))`, for `p` workers
+    ### Auxiliary Space: `O(n)`
+
+    :param array: list of integer numbers that we want sort
+    :type array: list[int]
+    :param workers: number of worker processes, defaults to the number of CPUs
+    :type workers: int, optional
+    :param algorithm: sorting function of every chunk, defaults to merge_sort
+    :type algorithm: Callable[[list], list], optional
+    :param typecode: `array` typecode of elements in shared memory, defaults to "q"
+    :type typecode: str, optional
+    :return: list of sorted integer number with parallel sort algorithm
+    :rtype: list[int]
+    """
+    length, workers = len(array), workers or os.cpu_count() or 1
+    if workers < 2 or length < 2 * workers:
+        return algorithm(list(array))
+
+    step = -(-length // workers)  # ceil division
+    bounds = [(start, min(start + step, length)) for start in range(0, length, step)]
+    try:
+        packed = ArrayType(typecode, array)
+    except (TypeError, OverflowError):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(
+                executor.map(algorithm, (array[start:end] for start, end in bounds))
+            )
+        return list(k_way_merge(chunks))
+
+    memory = SharedMemory(create=True, size=len(packed) * packed.itemsize)
+    view = memory.buf.cast(typecode)
+    try:
+        view[:length] = packed
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _sort_shared_chunk, memory.name, typecode, start, end, algorithm
+                )
+                for start, end in bounds
+            ]
+            for future in futures:
+                future.result()
+
+        chunks = [view[start:end].tolist() for start, end in bounds]
+    finally:
+        view.release()
+        memory.close()
+        memory.unlink()
+
+    return list(k_way_merge(chunks))
+
+
+def _sort_shared_chunk(
+    name: str,
+    typecode: str,
+    start: int,
+    end: int,
+    algorithm: Callable[[list], list],
+):
+    """Worker task; sort the `[start:end]` slots of the shared memory block in place.
+
+    :param name: name of the shared memory block
+    :type name: str
+    :param typecode: `array` typecode of the elements
+    :type typecode: str
+    :param start: index of the first element of the chunk
+    :type start: int
+    :param end: index after the last element of the chunk
+    :type end: int
+    :param algorithm: sorting function of the chunk
+    :type algorithm: Callable[[list], list]
+    """
+    memory = SharedMemory(name=name)
+    view = memory.buf.cast(typecode)
+    try:
+        view[start:end] = ArrayType(typecode, algorithm(view[start:end].tolist()))
+    finally:
+        view.release()
+        memory.close()
@@ -0,0 +1,136 @@
+from itertools import islice
+from typing import Any, Optional, Callable, Iterable, List
+
+from data_structures import MinHeap, MaxHeap
+from ..decorators import process_timer
+
+
+def nsmallest(
+    k: int,
+    /,
+    iterable: Iterable[Any],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    The `k` smallest items of the iterable in ascending order, it is equivalent
+    to `sorted(iterable, key=key)[:k]`; but only a bounded `MaxHeap` of the best
+    `k` items is kept, the top is the worst one and gets replaced by a better item.
+    So generators are streamed and never held in memory.
+
+    ### Time Complexity: `O(n*log(k))`
+    ### Auxiliary Space: `O(k)`
+
+    :param k: number of items to select
+    :type k: int
+    :param iterable: iterable of items, e.g. a list or a generator
+    :type iterable: Iterable[Any]
+    :param key: function to extract the comparison key of items, defaults to None
+    :type key: Callable[[Any], Any], optional
+    :return: list of the `k` smallest items in ascending order
+    :rtype: list[Any]
+    """
+    if k <= 0:
+        return []
+
+    # entries of (key, index, item); the index keeps equal keys in order
+    iterator = enumerate(iterable)
+    heap = MaxHeap(*_entries(islice(iterator, k), key=key, sign=1))
+    for entry in _entries(iterator, key=key, sign=1):
+        if entry < heap.top:
+            heap.replace(entry)
+
+    result = [heap.delete()[2] for _ in range(len(heap))]
+    result.reverse()
+    return result
+
+
+def nlargest(
+    k: int,
+    /,
+    iterable: Iterable[Any],
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    The `k` largest items of the iterable in descending order, it is equivalent
+    to `sorted(iterable, key=key, reverse=True)[:k]`; with a bounded `MinHeap`.
+
+    ### Time Complexity: `O(n*log(k))`
+    ### Auxiliary Space: `O(k)`
+
+    :param k: number of items to select
+    :type k: int
+    :param iterable: iterable of items, e.g. a list or a generator
+    :type iterable: Iterable[Any]
+    :param key: function to extract the comparison key of items, defaults to None
+    :type key: Callable[[Any], Any], optional
+    :return: list of the `k` largest items in descending order
+    :rtype: list[Any]
+    """
+    if k <= 0:
+        return []
+
+    # entries of (key, -index, item); earlier items win the ties
+    iterator = enumerate(iterable)
+    heap = MinHeap(*_entries(islice(iterator, k), key=key, sign=-1))
+    for entry in _entries(iterator, key=key, sign=-1):
+        if heap.top < entry:
+            heap.replace(entry)
+
+    result = [heap.delete()[2] for _ in range(len(heap))]
+    result.reverse()
+    return result
+
+
+@process_timer
+def partial_sort(
+    array: Iterable[Any],
+    k: int,
+    *,
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+) -> List[Any]:
+    """
+    ## Partial Sort
+    Sort only the first `k` items of the sorted order, the rest isn't sorted nor
+    materialised; it's `nsmallest` or in reverse `nlargest` of the array.
+
+    ### Time Complexity: `O(n*log(k))`
+    ### Auxiliary Space: `O(k)`
+
+    :param array: iterable of items that we want sort partially
+    :type array: Iterable[Any]
+    :param k: number of items of the sorted order
+    :type k: int
+    :param key: function to extract the comparison key of items, defaults to None
+    :type key: Callable[[Any], Any], optional
+    :param reverse: select the largest items in descending order, defaults to False
+    :type reverse: bool, optional
+    :return: list of the first `k` items in sorted order
+    :rtype: list[Any]
+    """
+    select = nlargest if reverse else nsmallest
+    return select(k, array, key=key)
+
+
+def _entries(
+    iterator: Iterable[tuple],
+    *,
+    key: Optional[Callable[[Any], Any]],
+    sign: int,
+) -> Iterable[tuple]:
+    """Decorate the enumerated items to `(key, sign * index, item)` heap entries.
+
+    :param iterator: iterable of `(index, item)` tuples
+    :type iterator: Iterable[tuple]
+    :param key: function to extract the comparison key of items
+    :type key: Callable[[Any], Any], optional
+    :param sign: sign of the index, negative to prefer earlier items in max order
+    :type sign: int
+    :return: iterable of heap entries
+    :rtype: Iterable[tuple]
+    """
+    if key is None:
+        return ((item, sign * index, item) for index, item in iterator)
+    return ((key(item), sign * index, item) for index, item in iterator)
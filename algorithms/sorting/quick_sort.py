@@ -1,15 +1,23 @@
 from typing import Optional, List
 
-from ..decorators import process_timer
+from ..decorators import process_timer, keyed_sort
 from ..quick_select import partition
+from .heap_sort import _heap_sort_range
+from .insertion_sort import binary_insertion_sort
+
+
+_INSERTION_CUTOFF = 16
+_NINTHER_CUTOFF = 128
 
 
 @process_timer
+@keyed_sort
 def quick_sort(
     array: List[int],
     *,
     start: int = 0,
     end: Optional[int] = None,
+    intro: bool = False,
 ) -> List[int]:
     """
     ## Quick Sort
@@ -30,12 +38,21 @@ def quick_sort(
 
     ### Auxiliary Space: `O(1)`
 
+    ### Introsort Mode
+    With `intro` the array is sorted by an introspective sort: an explicit stack
+    instead of recursion, median-of-three (ninther for big ranges) pivots,
+    three-way partitioning for duplicates, insertion sort for small ranges and
+    a heap sort fallback once the depth exceeds `2*log2(n)`;
+    so the worst case time complexity is `O(n*log(n))`.
+
     :param array: list of integer numbers that we want sort
     :type array: list[int]
     :param start: start point of the array in left direction, defaults to 0
     :type start: int
     :param end: end point of the array in right direction, defaults to None
     :type end: int, optional
+    :param intro: use the introsort engine, defaults to False
+    :type intro: bool, optional
     :return: list of sorted integer number with quick sort algorithm
     :rtype: list[int]
     """
@@ -44,7 +61,114 @@ def quick_sort(
     if length == 1 or end <= start:
         return array
 
+    if intro:
+        _introsort(array, start=start, end=end + 1)
+        return array
+
     pivot = partition(array, start=start, end=end)
     quick_sort(array, start=start, end=pivot - 1)
     quick_sort(array, start=pivot + 1, end=end)
     return array
+
+
+def _introsort(
+    array: List[int],
+    *,
+    start: int,
+    end: int,
+    depth_limit: Optional[int] = None,
+):
+    """Sort `array[start:end]` in place with an iterative introspective sort.
+
+    :param array: list of integer numbers that we want sort
+    :type array: list[int]
+    :param start: index of the first element of the range
+    :type start: int
+    :param end: index after the last element of the range
+    :type end: int
+    :param depth_limit: partitioning depth before heap sort, defaults to `2*log2(n)`
+    :type depth_limit: int, optional
+    """
+    if depth_limit is None:
+        depth_limit = 2 * ((end - start).bit_length() - 1)
+
+    stack = [(start, end, depth_limit)]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low > _INSERTION_CUTOFF:
+            if depth == 0:
+                _heap_sort_range(array, low, high)
+                break
+
+            depth -= 1
+            less, greater = _three_way_partition(array, low, high)
+            if less - low < high - greater:  # loop on the smaller side
+                stack.append((greater, high, depth))
+                high = less
+            else:
+                stack.append((low, less, depth))
+                low = greater
+        else:
+            binary_insertion_sort(array, low, high)
+
+
+def _median_of_three(array: List[int], i: int, j: int, k: int) -> int:
+    """Index of the median value between three positions of the array.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :return: one of `i`, `j` or `k` holding the median value
+    :rtype: int
+    """
+    a, b, c = array[i], array[j], array[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _three_way_partition(array: List[int], low: int, high: int) -> tuple:
+    """
+    Dutch national flag partition of `array[low:high]` around a sampled pivot;
+    afterwards `[low, less)` are smaller, `[less, greater)` are equal
+    and `[greater, high)` are greater than the pivot.
+
+    :param array: list of integer numbers that we want applied pivot partition
+    :type array: list[int]
+    :param low: index of the first element of the range
+    :type low: int
+    :param high: index after the last element of the range
+    :type high: int
+    :return: tuple of `less` and `greater` boundaries
+    :rtype: tuple[int, int]
+    """
+    last, middle = high - 1, (low + high) // 2
+    if high - low > _NINTHER_CUTOFF:  # Tukey's ninther
+        step = (high - low) // 8
+        pivot = _median_of_three(
+            array,
+            _median_of_three(array, low, low + step, low + 2 * step),
+            _median_of_three(array, middle - step, middle, middle + step),
+            _median_of_three(array, last - 2 * step, last - step, last),
+        )
+    else:
+        pivot = _median_of_three(array, low, middle, last)
+
+    value, less, index, greater = array[pivot], low, low, high
+    while index < greater:
+        item = array[index]
+        if item < value:
+            array[index], array[less] = array[less], item
+            less += 1
+            index += 1
+        elif value < item:
+            greater -= 1
+            array[index], array[greater] = array[greater], item
+        else:
+            index += 1
+
+    return less, greater
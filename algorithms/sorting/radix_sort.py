@@ -0,0 +1,157 @@
+from array import array as ArrayType
+from typing import Any, Optional, Callable, List, Union
+
+from ..decorators import process_timer
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@process_timer
+def radix_sort(
+    array: Union[List[Any], ArrayType],
+    *,
+    key: Optional[Callable[[Any], int]] = None,
+    reverse: bool = False,
+    bits: int = 8,
+) -> Union[List[Any], ArrayType]:
+    """
+    ## Radix Sort
+    Least Significant Digit Radix Sort sorts integer numbers digit by digit,
+    from the least significant to the most significant one,
+    with a stable counting sort of every digit; so it never compares two elements.
+
+    The digits are `bits` wide (8, 11 or 16 are good choices), the numbers are
+    shifted by the minimum to handle negative values and the passes where
+    every element has the same digit are skipped.
+    If the input is an `array.array` or a NumPy `ndarray` and NumPy is installed,
+    every pass is vectorized with a stable `argsort` of the digits.
+
+    With a `key` function the records are sorted by their integer keys; the key
+    and the index of every record are packed into one integer number,
+    so the sort is stable and the keys are computed once.
+
+    ### Time Complexity: `O(w/b * (n + 2^b))`, `w` bits wide keys and `b` bits digits
+    ### Auxiliary Space: `O(n + 2^b)`
+
+    :raises ValueError: if bits is less than one
+    :param array: list of integer numbers that we want sort
+    :type array: list[int] | array.array | numpy.ndarray
+    :param key: function to extract the integer key of records, defaults to None
+    :type key: Callable[[Any], int], optional
+    :param reverse: sort in descending order, defaults to False
+    :type reverse: bool, optional
+    :param bits: number of bits of every digit, defaults to 8
+    :type bits: int, optional
+    :return: sorted integer numbers, in the same container type as the input
+    :rtype: list[int] | array.array | numpy.ndarray
+    """
+    if bits < 1:
+        raise ValueError("Bits must be a positive integer.")
+
+    vectorized = numpy is not None and isinstance(array, (ArrayType, numpy.ndarray))
+    if vectorized and key is None:  # pragma: no cover
+        result = _numpy_radix_sort(array, bits=bits)
+        return result[::-1] if reverse else result
+
+    if key is None:
+        result = _radix_sort(list(array), bits=bits)
+        if reverse:
+            result.reverse()
+    else:  # negated keys in reverse, the index breaks the ties
+        length, sign = len(array), -1 if reverse else 1
+        keys = [key(element) * sign for element in array]
+        minimum = min(keys, default=0)
+        packed = [
+            (value - minimum) * length + index for index, value in enumerate(keys)
+        ]
+        order = [value % length for value in _radix_sort(packed, bits=bits)]
+        if numpy is not None and isinstance(array, numpy.ndarray):  # pragma: no cover
+            return array[order]
+        result = [array[index] for index in order]
+
+    return ArrayType(array.typecode, result) if isinstance(array, ArrayType) else result
+
+
+def _radix_sort(values: List[int], *, bits: int) -> List[int]:
+    """Pure Python LSD radix sort of a list of integers, it reuses the given list.
+
+    :param values: list of integer numbers that we want sort
+    :type values: list[int]
+    :param bits: number of bits of every digit
+    :type bits: int
+    :return: list of sorted integer numbers
+    :rtype: list[int]
+    """
+    length = len(values)
+    if length < 2:
+        return values
+
+    minimum = min(values)
+    span = max(values) - minimum
+    if minimum:
+        values = [value - minimum for value in values]
+
+    mask, shift, buffer = (1 << bits) - 1, 0, [0] * length
+    while span >> shift:
+        counts = [0] * (mask + 1)
+        for value in values:
+            counts[(value >> shift) & mask] += 1
+
+        if counts[(values[0] >> shift) & mask] == length:  # constant digit
+            shift += bits
+            continue
+
+        total = 0
+        for digit, count in enumerate(counts):  # prefix sums of the start positions
+            counts[digit], total = total, total + count
+
+        for value in values:
+            digit = (value >> shift) & mask
+            buffer[counts[digit]] = value
+            counts[digit] += 1
+
+        values, buffer = buffer, values
+        shift += bits
+
+    return [value + minimum for value in values] if minimum else values
+
+
+def _numpy_radix_sort(array, *, bits: int):  # pragma: no cover
+    """Vectorized LSD radix sort of an integer `array.array` or NumPy `ndarray`.
+
+    :raises TypeError: if the elements of the array aren't integer numbers
+    :param array: integer array that we want sort
+    :type array: array.array | numpy.ndarray
+    :param bits: number of bits of every digit
+    :type bits: int
+    :return: sorted array with the same type of the input
+    :rtype: array.array | numpy.ndarray
+    """
+    values = numpy.asarray(array)
+    if values.dtype.kind not in "iu":
+        raise TypeError("Radix sort supports integer numbers only.")
+
+    if values.dtype.kind == "i":  # flip the sign bit to order as unsigned
+        keys = values.astype(numpy.int64).view(numpy.uint64) ^ numpy.uint64(1 << 63)
+    else:
+        keys = values.astype(numpy.uint64)
+
+    order = numpy.arange(len(keys))
+    span = int(keys.max() ^ keys.min()) if len(keys) else 0  # common high bits
+    mask, shift = numpy.uint64((1 << bits) - 1), 0
+    while span >> shift:
+        digits = (keys >> numpy.uint64(shift)) & mask
+        shift += bits
+        if (digits == digits[0]).all():  # constant digit
+            continue
+
+        permutation = numpy.argsort(digits, kind="stable")
+        keys, order = keys[permutation], order[permutation]
+
+    result = values[order]
+    if isinstance(array, ArrayType):
+        return ArrayType(array.typecode, result.tolist())
+    return result
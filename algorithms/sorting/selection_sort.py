@@ -1,9 +1,10 @@
 from typing import List
 
-from ..decorators import process_timer
+from ..decorators import process_timer, keyed_sort
 
 
 @process_timer
+@keyed_sort
 def selection_sort(array: List[int]) -> List[int]:
     """
     ## Selection Sort
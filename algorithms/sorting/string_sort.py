@@ -0,0 +1,142 @@
+from typing import Any, Optional, Callable, List, Union
+
+from ..decorators import process_timer
+from .insertion_sort import binary_insertion_sort
+
+
+_INSERTION_CUTOFF = 16
+
+
+@process_timer
+def string_sort(
+    array: List[Union[str, bytes]],
+    *,
+    key: Optional[Callable[[Any], Union[str, bytes]]] = None,
+    reverse: bool = False,
+) -> List[Union[str, bytes]]:
+    """
+    ## String Sort
+    Three-Way Radix Quick Sort (Multikey Quick Sort) of Bentley and Sedgewick.
+    It partitions the strings into less, equal and greater parts by the character
+    at the current depth, only the equal part moves on to the next character;
+    so common prefixes are compared once instead of again in every comparison.
+
+    It works for any unicode `str` or `bytes` (mixed case, digits, empty ones),
+    the end of a string is ordered before every character.
+    Small ranges are finished by insertion sort.
+
+    With a `key` function the keys are computed once and sorted together with
+    the indexes of the records, equal keys keep the order of their records.
+
+    ### Time Complexity: `O(n*log(n) + D)`, D is length of the distinguishing prefixes
+    ### Auxiliary Space: `O(log(n) + w)`, an explicit stack instead of recursion
+
+    :param array: list of strings or bytes that we want sort
+    :type array: list[str] | list[bytes]
+    :param key: function to extract the string key of records, defaults to None
+    :type key: Callable[[Any], str | bytes], optional
+    :param reverse: sort in descending order, defaults to False
+    :type reverse: bool, optional
+    :return: list of sorted strings with three-way radix quick sort algorithm
+    :rtype: list[str] | list[bytes]
+    """
+    if reverse:  # reversed, sorted and reversed back keeps the equal keys order
+        array = array[::-1]
+
+    if key is None:
+        _multikey_quick_sort(array, None)
+        result = array
+    else:
+        keys, order = [key(element) for element in array], list(range(len(array)))
+        _multikey_quick_sort(keys, order)
+        result = [array[index] for index in order]
+
+    if reverse:
+        result.reverse()
+    return result
+
+
+def _multikey_quick_sort(keys: List[str], order: Optional[List[int]]):
+    """
+    Sort the keys in place with an explicit stack of `(low, high, depth)` ranges;
+    the larger parts are pushed and it loops on the smallest one, so the stack
+    holds `O(log(n))` ranges. The order list of indexes, if given, is permuted
+    together with the keys and the indexes of equal keys are sorted at the end
+    to stay stable.
+
+    :param keys: list of strings that we want sort
+    :type keys: list[str]
+    :param order: list of indexes moved along with the keys
+    :type order: list[int], optional
+    """
+    stack = [(0, len(keys), 0)]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low > _INSERTION_CUTOFF:
+            # slicing yields an empty string past the end, less than any char
+            pivot = keys[(low + high) // 2][depth : depth + 1]
+            less, index, greater = low, low, high
+            while index < greater:
+                char = keys[index][depth : depth + 1]
+                if char < pivot:
+                    keys[index], keys[less] = keys[less], keys[index]
+                    if order is not None:
+                        order[index], order[less] = order[less], order[index]
+                    less += 1
+                    index += 1
+                elif pivot < char:
+                    greater -= 1
+                    keys[index], keys[greater] = keys[greater], keys[index]
+                    if order is not None:
+                        order[index], order[greater] = order[greater], order[index]
+                else:
+                    index += 1
+
+            parts = [
+                (less - low, low, less, depth),
+                (high - greater, greater, high, depth),
+            ]
+            if pivot:  # strings ended at this depth are already equal
+                parts.append((greater - less, less, greater, depth + 1))
+            parts.sort(reverse=True)  # the larger first, it loops on the smallest
+            for size, start, end, level in parts[:-1]:
+                if size > 1:
+                    stack.append((start, end, level))
+            _, low, high, depth = parts[-1]
+
+        if high - low > 1:
+            _insertion_sort_range(keys, order, low, high)
+
+    if order is not None:
+        start = 0
+        for index in range(1, len(keys) + 1):
+            if index == len(keys) or keys[index] != keys[start]:
+                order[start:index] = sorted(order[start:index])
+                start = index
+
+
+def _insertion_sort_range(
+    keys: List[str],
+    order: Optional[List[int]],
+    low: int,
+    high: int,
+):
+    """Sort the small range `keys[low:high]` in place with `binary_insertion_sort`,
+    the kernel of quick sort too; the indexes are sorted along with their keys.
+
+    :param keys: list of strings that we want sort
+    :type keys: list[str]
+    :param order: list of indexes moved along with the keys
+    :type order: list[int], optional
+    :param low: index of the first element of the range
+    :type low: int
+    :param high: index after the last element of the range
+    :type high: int
+    """
+    if order is None:
+        binary_insertion_sort(keys, low, high)
+        return
+
+    pairs = binary_insertion_sort(list(zip(keys[low:high], order[low:high])))
+    keys[low:high] = [key for key, _ in pairs]
+    order[low:high] = [index for _, index in pairs]
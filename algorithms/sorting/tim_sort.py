@@ -0,0 +1,192 @@
+from typing import List, Tuple
+
+from ..decorators import process_timer, keyed_sort
+from ..exponential_search import exponential_search
+from .insertion_sort import binary_insertion_sort
+
+
+_MIN_MERGE = 64
+_MIN_GALLOP = 7
+
+
+@process_timer
+@keyed_sort
+def tim_sort(array: List[int]) -> List[int]:
+    """
+    ## Tim Sort
+    Tim Sort is an adaptive, stable merge sort that takes advantage of the order
+    already present in the input. It splits the array into natural runs,
+    ascending ones are kept and strictly descending ones are reversed in place;
+    short runs are extended to a minimum length with binary insertion sort.
+    The runs are pushed on a stack and merged while keeping the stack lengths
+    balanced, merges switch to galloping mode when one run keeps winning;
+    the gallops are bounded `exponential_search` calls.
+
+    ### Time Complexity:
+        - Worst case time complexity is `O(n*log(n))`
+        - Best case time complexity is `O(n)`, when the array is already sorted
+
+    ### Auxiliary Space: `O(n)`
+
+    :param array: list of integer numbers that we want sort
+    :type array: list[int]
+    :return: list of sorted integer number with tim sort algorithm
+    :rtype: list[int]
+    """
+    length = len(array)
+    if length < 2:
+        return array
+
+    min_run, runs, low = _min_run(length), [], 0
+    while low < length:
+        run = _count_run(array, low, length)
+        if run < min_run:
+            force = min(min_run, length - low)
+            binary_insertion_sort(array, low, low + force, start=low + run)
+            run = force
+
+        runs.append((low, run))
+        _merge_collapse(array, runs)
+        low += run
+
+    while len(runs) > 1:  # force collapse, the invariants keep it balanced
+        _merge_at(array, runs, len(runs) - 2)
+
+    return array
+
+
+def _min_run(length: int) -> int:
+    """Minimum run length; the `length / min_run` is a power of two or close to it.
+
+    :param length: number of elements in the array
+    :type length: int
+    :return: integer number between `32` and `64` or length itself for small arrays
+    :rtype: int
+    """
+    remainder = 0
+    while length >= _MIN_MERGE:
+        remainder |= length & 1
+        length >>= 1
+
+    return length + remainder
+
+
+def _count_run(array: List[int], low: int, high: int) -> int:
+    """Length of the natural run starting at `low`, descending runs are reversed.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :param low: index of the first element of the run
+    :type low: int
+    :param high: index after the last element of the array
+    :type high: int
+    :return: length of the ascending run starting at `low`
+    :rtype: int
+    """
+    index = low + 1
+    if index == high:
+        return 1
+
+    if array[index] < array[low]:  # strictly descending to keep the stability
+        index += 1
+        while index < high and array[index] < array[index - 1]:
+            index += 1
+        array[low:index] = reversed(array[low:index])
+    else:
+        index += 1
+        while index < high and not array[index] < array[index - 1]:
+            index += 1
+
+    return index - low
+
+
+def _merge_collapse(array: List[int], runs: List[Tuple[int, int]]):
+    """Merge the runs on top of the stack until the length invariants hold.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :param runs: stack of tuples of start index and length of the runs
+    :type runs: list[tuple[int, int]]
+    """
+    while len(runs) > 1:
+        index = len(runs) - 2
+        if (
+            index > 0 and runs[index - 1][1] <= runs[index][1] + runs[index + 1][1]
+        ) or (index > 1 and runs[index - 2][1] <= runs[index - 1][1] + runs[index][1]):
+            if runs[index - 1][1] < runs[index + 1][1]:
+                index -= 1
+        elif runs[index][1] > runs[index + 1][1]:
+            break
+
+        _merge_at(array, runs, index)
+
+
+def _merge_at(array: List[int], runs: List[Tuple[int, int]], index: int):
+    """Merge the two adjacent runs `index` and `index + 1` of the stack.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :param runs: stack of tuples of start index and length of the runs
+    :type runs: list[tuple[int, int]]
+    :param index: index of the left run in the stack
+    :type index: int
+    """
+    (start_a, length_a), (start_b, length_b) = runs[index], runs[index + 1]
+    runs[index] = (start_a, length_a + length_b)
+    del runs[index + 1]
+
+    # elements of the left run not greater than the first of right are in place
+    start_a = exponential_search(
+        array[start_b], array, start=start_a, end=start_b, right=True
+    )
+    # elements of the right run not less than the last of left are in place too
+    end_b = exponential_search(
+        array[start_b - 1], array, start=start_b, end=start_b + length_b
+    )
+    _merge_low(array, start_a, start_b, end_b)
+
+
+def _merge_low(array: List[int], start: int, middle: int, end: int):
+    """
+    Stable merge of `array[start:middle]` and `array[middle:end]` in place,
+    only the left run is copied to a temporary list.
+
+    :param array: list of integer numbers
+    :type array: list[int]
+    :param start: index of the first element of the left run
+    :type start: int
+    :param middle: index of the first element of the right run
+    :type middle: int
+    :param end: index after the last element of the right run
+    :type end: int
+    """
+    temp = array[start:middle]
+    length, i, j, k = middle - start, 0, middle, start
+    min_gallop, count_a, count_b = _MIN_GALLOP, 0, 0
+    while i < length and j < end:
+        if count_a < min_gallop and count_b < min_gallop:  # one pair at a time
+            if array[j] < temp[i]:
+                array[k], j, count_a, count_b = array[j], j + 1, 0, count_b + 1
+            else:
+                array[k], i, count_a, count_b = temp[i], i + 1, count_a + 1, 0
+            k += 1
+            continue
+
+        # galloping mode; copy whole blocks that win with slice assignment
+        index = exponential_search(array[j], temp, start=i, end=length, right=True)
+        count_a = index - i
+        array[k : k + count_a] = temp[i:index]
+        i, k = index, k + count_a
+
+        index = exponential_search(temp[i], array, start=j, end=end)
+        count_b = index - j
+        array[k : k + count_b] = array[j:index]
+        j, k = index, k + count_b
+
+        if count_a < _MIN_GALLOP and count_b < _MIN_GALLOP:
+            min_gallop, count_a, count_b = min_gallop + 1, 0, 0
+        else:
+            min_gallop = max(1, min_gallop - 1)
+
+    # the last of left run is the greatest, right run was trimmed in `_merge_at`
+    array[k : k + length - i] = temp[i:]
@@ -0,0 +1,76 @@
+"""
+Benchmarks of the Algorithms & Data Structures are implemented
+
+Every module is runnable from the repository root, e.g.
+`python -m benchmarks.merge_sort`.
+"""
+import logging
+import logging.config
+import os
+from random import randint
+from typing import Callable, List
+from timeit import default_timer as timer
+
+# the benchmarks are scripts, so they configure the logging of the library
+logging.config.fileConfig(
+    fname=os.path.join(os.path.dirname(__file__), os.pardir, "logging.ini"),
+    disable_existing_loggers=False,
+)
+
+
+def random_array(length: int, *, low: int = 0, high: int = 2**31) -> List[int]:
+    """
+    Build a list of random integer numbers for benchmarking.
+
+    :param length: number of elements in the list
+    :type length: int
+    :param low: smallest possible value, defaults to 0
+    :type low: int, optional
+    :param high: largest possible value, defaults to 2**31
+    :type high: int, optional
+    :return: list of random integer numbers
+    :rtype: list[int]
+    """
+    return [randint(low, high) for _ in range(length)]
+
+
+def measure(function: Callable[[], object], *, repeat: int = 3) -> float:
+    """
+    Best wall-clock time of calling the function a few times in seconds.
+
+    Logging is silenced while measuring so the terminal isn't flooded,
+    the metrics registry is left as it is (disabled unless enabled).
+
+    :param function: zero argument callable to measure
+    :type function: Callable[[], object]
+    :param repeat: number of measuring rounds, defaults to 3
+    :type repeat: int, optional
+    :return: the minimum elapsed time in seconds
+    :rtype: float
+    """
+    logging.disable(logging.CRITICAL)
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            start_time = timer()
+            function()
+            best = min(best, timer() - start_time)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    return best
+
+
+def report(title: str, results: dict):
+    """
+    Print the benchmark results as a small aligned table.
+
+    :param title: heading of the table
+    :type title: str
+    :param results: mapping of case name to elapsed seconds
+    :type results: dict
+    """
+    print(title)
+    width = max(len(name) for name in results)
+    for name, elapsed in results.items():
+        print(f"    {name:<{width}} : {elapsed * 1000:10.2f} ms")
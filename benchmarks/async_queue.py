@@ -0,0 +1,74 @@
+"""
+`asyncio.Queue` vs `AsyncQueue` with a few producer and consumer tasks,
+the consumers get one item per await or drain batches with `dequeue_batch`.
+
+    python -m benchmarks.async_queue [items] [producers] [consumers]
+"""
+import asyncio
+import sys
+
+from data_structures import AsyncQueue
+from . import measure, report
+
+LENGTH, BATCH = 1024, 256
+
+
+async def standard(items: int, producers: int, consumers: int):
+    queue = asyncio.Queue(LENGTH)
+
+    async def produce():
+        for item in range(items // producers):
+            await queue.put(item)
+
+    async def consume():
+        while await queue.get() is not None:
+            pass
+
+    tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    for _ in range(consumers):
+        await queue.put(None)
+    await asyncio.gather(*tasks)
+
+
+async def ring_buffer(items: int, producers: int, consumers: int, batch: int):
+    queue = AsyncQueue(LENGTH)
+
+    async def produce():
+        for item in range(items // producers):
+            await queue.enqueue(item)
+
+    async def consume():
+        if batch == 1:
+            async for _ in queue:
+                pass
+        else:
+            try:
+                while True:
+                    await queue.dequeue_batch(batch)
+            except Exception:  # UnderflowError, closed and drained
+                pass
+
+    tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    queue.close()
+    await asyncio.gather(*tasks)
+
+
+def main(items: int, producers: int, consumers: int):
+    arguments = items, producers, consumers
+    report(
+        f"{items} items, {producers} producers, {consumers} consumers",
+        {
+            "asyncio.Queue": measure(lambda: asyncio.run(standard(*arguments))),
+            "AsyncQueue": measure(lambda: asyncio.run(ring_buffer(*arguments, 1))),
+            "AsyncQueue dequeue_batch": measure(
+                lambda: asyncio.run(ring_buffer(*arguments, BATCH))
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*arguments + [200_000, 4, 4][len(arguments) :])
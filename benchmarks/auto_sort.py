@@ -0,0 +1,52 @@
+"""
+Calibrate the `Thresholds` of the `sort` dispatcher on this host.
+
+    python -m benchmarks.auto_sort [length]
+
+The printed thresholds can be passed as `sort(array, thresholds=...)`.
+"""
+import sys
+from random import randint
+
+from algorithms.sorting.auto_sort import ENGINES, Thresholds
+from . import random_array, measure
+
+
+def run(name: str, array: list) -> float:
+    """Best time of the engine sorting copies of the array."""
+    function, options = ENGINES[name]
+    return measure(lambda: function(list(array), **options))
+
+
+def calibrate(length: int) -> Thresholds:
+    thresholds = Thresholds()
+    array = random_array(length)
+    timings = {
+        name: run(name, array)
+        for name in ("quick_sort", "merge_sort", "heap_sort", "tim_sort")
+    }
+    thresholds.default = min(timings, key=timings.get)
+
+    for size in (8, 16, 32, 64, 128):  # crossover of insertion sort
+        arrays = [random_array(size) for _ in range(50)]
+        insertion = sum(run("insertion_sort", small) for small in arrays)
+        default = sum(run(thresholds.default, small) for small in arrays)
+        if insertion <= default:
+            thresholds.insertion = size
+
+    for factor in (0.5, 1, 2, 4, 8, 16, 32):  # widest range of counting sort
+        narrow = random_array(length, high=int(factor * length))
+        if run("counting_sort", narrow) <= run(thresholds.default, narrow):
+            thresholds.counting = factor
+
+    for size in (2**10, 2**12, 2**14, 2**16, 2**18):
+        wide = [randint(-(2**62), 2**62) for _ in range(size)]
+        if run("radix_sort", wide) < run(thresholds.default, wide):  # if ever
+            thresholds.radix = size
+            break
+
+    return thresholds
+
+
+if __name__ == "__main__":
+    print(calibrate(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
@@ -0,0 +1,43 @@
+"""
+A loop of `binary_search` lookups vs the batched `search_many`.
+
+    python -m benchmarks.binary_search [length]
+"""
+import sys
+from random import randint
+
+from algorithms import binary_search, search_many
+from . import random_array, measure, report
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def lookups(queries: list, array: list) -> list:
+    result = []
+    for item in queries:
+        try:
+            result.append(binary_search(item, array))
+        except ValueError:
+            result.append(-1)
+    return result
+
+
+def main(length: int):
+    array = sorted(random_array(length, high=2 * length))
+    queries = [randint(0, 2 * length) for _ in range(length)]
+    results = {
+        "binary_search loop": measure(lambda: lookups(queries, array)),
+        "search_many": measure(lambda: search_many(queries, array)),
+    }
+    if numpy is not None:
+        vector = numpy.array(array)
+        results["search_many numpy"] = measure(lambda: search_many(queries, vector))
+
+    report(f"{length} lookups in [{length}]", results)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
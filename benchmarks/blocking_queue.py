@@ -0,0 +1,82 @@
+"""
+`queue.Queue` vs `BlockingQueue` with a few producer and consumer threads,
+the consumers get one item per call or drain batches with `get_batch`.
+
+    python -m benchmarks.blocking_queue [items] [producers] [consumers]
+"""
+import sys
+from queue import Queue
+from threading import Thread
+
+from data_structures import BlockingQueue
+from . import measure, report
+
+LENGTH, BATCH, STOP = 1024, 256, object()
+
+
+def run(items: int, producers: int, consumers: int, put, consume):
+    """Start the threads; every consumer gets items until it gets `STOP`."""
+    share = items // producers
+
+    def produce():
+        for item in range(share):
+            put(item)
+
+    threads = [Thread(target=produce) for _ in range(producers)]
+    threads += [Thread(target=consume) for _ in range(consumers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    for _ in range(consumers):
+        put(STOP)
+    for thread in threads[producers:]:
+        thread.join()
+
+
+def one_by_one(queue):
+    def consume():
+        while queue.get() is not STOP:
+            pass
+
+    return consume
+
+
+def batches(queue: BlockingQueue):
+    def consume():
+        while True:
+            stops = sum(item is STOP for item in queue.get_batch(BATCH))
+            if stops:  # the stops are the last items, give back the others
+                for _ in range(stops - 1):
+                    queue.put(STOP)
+                return
+
+    return consume
+
+
+def main(items: int, producers: int, consumers: int):
+    def standard():
+        queue = Queue(LENGTH)
+        run(items, producers, consumers, queue.put, one_by_one(queue))
+
+    def blocking():
+        queue = BlockingQueue(LENGTH)
+        run(items, producers, consumers, queue.put, one_by_one(queue))
+
+    def blocking_batch():
+        queue = BlockingQueue(LENGTH)
+        run(items, producers, consumers, queue.put, batches(queue))
+
+    report(
+        f"{items} items, {producers} producers, {consumers} consumers",
+        {
+            "queue.Queue": measure(standard),
+            "BlockingQueue": measure(blocking),
+            "BlockingQueue get_batch": measure(blocking_batch),
+        },
+    )
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*arguments + [400_000, 4, 4][len(arguments) :])
@@ -0,0 +1,41 @@
+"""
+Comparisons, moves (swaps) and peak auxiliary bytes of the comparison sorts,
+counted with `count_operations` instead of the wall-clock time.
+
+    python -m benchmarks.counters [length]
+"""
+import sys
+
+from algorithms import (
+    count_operations,
+    insertion_sort,
+    merge_sort,
+    tim_sort,
+    heap_sort,
+    quick_sort,
+)
+from . import random_array
+
+
+def main(length: int):
+    array = random_array(length)
+    print(f"operations of sorting [{length}]")
+    for title, function in (
+        ("insertion_sort", insertion_sort),
+        ("binary insertion", lambda values: insertion_sort(values, binary=True)),
+        ("merge_sort", merge_sort),
+        ("tim_sort", tim_sort),
+        ("heap_sort", heap_sort),
+        ("quick_sort", quick_sort),
+        ("introsort", lambda values: quick_sort(values, intro=True)),
+    ):
+        with count_operations() as operations:
+            function(list(array))
+        print(
+            f"    {title:<16} : {operations.comparisons:>10} comparisons, "
+            f"{operations.swaps:>8} moves, {operations.allocations:>10} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,42 @@
+"""
+`heap_sort` with a heap object vs the `in_place` mode; time and peak memory.
+
+    python -m benchmarks.heap_sort [length]
+"""
+import logging
+import sys
+import tracemalloc
+
+from algorithms import heap_sort
+from . import random_array, measure, report
+
+
+def peak_memory(function, array: list) -> int:
+    """Peak of the memory allocated while sorting a copy of the array, in bytes."""
+    copied = list(array)
+    logging.disable(logging.CRITICAL)
+    tracemalloc.start()
+    try:
+        function(copied)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        logging.disable(logging.NOTSET)
+
+
+def main(length: int):
+    array = random_array(length)
+    cases = {
+        "heap object": lambda copied: heap_sort(copied),
+        "in_place": lambda copied: heap_sort(copied, in_place=True),
+    }
+    report(
+        f"heap_sort[{length}]",
+        {name: measure(lambda: case(list(array))) for name, case in cases.items()},
+    )
+    for name, case in cases.items():
+        print(f"    {name} peak memory: {peak_memory(case, array) / 2**20:.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
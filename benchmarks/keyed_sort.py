@@ -0,0 +1,44 @@
+"""
+`key=` argument of the sorts vs decorating the records with tuples by hand.
+
+    python -m benchmarks.keyed_sort [length]
+"""
+import sys
+from operator import attrgetter
+from random import randint
+
+from algorithms import merge_sort, tim_sort, quick_sort
+from . import measure, report
+
+
+class Record:
+    __slots__ = ("identifier", "score")
+
+    def __init__(self, identifier: int, score: int):
+        self.identifier, self.score = identifier, score
+
+
+def main(length: int):
+    records = [Record(index, randint(0, length)) for index in range(length)]
+    key = attrgetter("score")
+    for name, function, options in [
+        ("tim_sort", tim_sort, {}),
+        ("merge_sort", merge_sort, {"bottom_up": True}),
+        ("quick_sort", quick_sort, {"intro": True}),
+    ]:
+
+        def manual():
+            decorated = [(key(item), index, item) for index, item in enumerate(records)]
+            return [item for _, _, item in function(decorated, **options)]
+
+        report(
+            f"{name}[{length}]",
+            {
+                "manual tuples": measure(manual),
+                "key=": measure(lambda: function(records, key=key, **options)),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
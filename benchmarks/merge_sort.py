@@ -0,0 +1,24 @@
+"""
+Recursive `merge_sort` vs the iterative `bottom_up` mode.
+
+    python -m benchmarks.merge_sort [length]
+"""
+import sys
+
+from algorithms import merge_sort
+from . import random_array, measure, report
+
+
+def main(length: int):
+    array = random_array(length)
+    report(
+        f"merge_sort[{length}]",
+        {
+            "recursive": measure(lambda: merge_sort(list(array))),
+            "bottom_up": measure(lambda: merge_sort(list(array), bottom_up=True)),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
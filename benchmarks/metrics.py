@@ -0,0 +1,28 @@
+"""
+Overhead of `process_timer` on the recursive `merge_sort` (a decorated call
+per recursion, only the outermost one is recorded): metrics registry disabled
+vs enabled vs sampled.
+
+    python -m benchmarks.metrics [length]
+"""
+import sys
+
+from algorithms import merge_sort, registry
+from . import random_array, measure, report
+
+
+def main(length: int):
+    array = random_array(length)
+    results = {"disabled": measure(lambda: merge_sort(array))}
+    for title, sample in (("enabled", 1), ("sample=100", 100)):
+        registry.enable(sample=sample)
+        results[title] = measure(lambda: merge_sort(array))
+        registry.disable()
+
+    calls = registry.snapshot()["merge_sort"]["calls"]
+    registry.reset()
+    report(f"merge_sort[{length}], {calls} recorded calls", results)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,38 @@
+"""
+Percentiles of a stream with the `QuantileSketch` vs keeping every value
+and selecting exactly, with the observed rank error of the sketch.
+
+    python -m benchmarks.quantile_sketch [length] [k]
+"""
+import sys
+from bisect import bisect_left
+
+from algorithms import select_many
+from data_structures import QuantileSketch
+from . import random_array, measure, report
+
+QS = (0.5, 0.9, 0.99)
+
+
+def main(length: int, k: int):
+    array = random_array(length)
+    sketch = QuantileSketch(k)
+    ranks = [round(q * length) for q in QS]
+    results = {
+        "QuantileSketch.extend": measure(lambda: QuantileSketch(k).extend(array)),
+        "select_many": measure(lambda: select_many(ranks, array)),
+    }
+    report(f"p50/p90/p99 of [{length}]", results)
+
+    sketch.extend(array)
+    ordered = sorted(array)
+    for q, value in zip(QS, sketch.quantiles(QS)):
+        error = abs(bisect_left(ordered, value) - q * length) / length
+        print(f"    p{q * 100:g}: rank error {error:.4%} (bound {sketch.error:.4%})")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,25 @@
+"""
+Percentiles of a window: a `quick_select` per rank vs one `select_many`
+pass vs sorting the whole window.
+
+    python -m benchmarks.quick_select [length]
+"""
+import sys
+
+from algorithms import quick_select, select_many
+from . import random_array, measure, report
+
+
+def main(length: int):
+    array = random_array(length)
+    ks = [length * percent // 100 for percent in (50, 90, 99)]
+    results = {
+        "quick_select per rank": measure(lambda: [quick_select(k, array) for k in ks]),
+        "select_many": measure(lambda: select_many(ks, array)),
+        "sorted": measure(lambda: sorted(array)),
+    }
+    report(f"p50/p90/p99 of [{length}]", results)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,92 @@
+"""
+`multiprocessing.Queue` vs `SharedQueue` between a producer process and the
+consumer, with one record per call or with `enqueue_many` and `dequeue_batch`;
+it prints the messages per second too.
+
+    python -m benchmarks.shared_queue [items]
+"""
+import sys
+from multiprocessing import Process, Queue
+from time import sleep
+
+from data_structures import SharedQueue
+from . import measure, report
+
+LENGTH, BATCH, RECORD = 1024, 256, "qd"
+
+
+def produce_standard(queue: Queue, items: int):
+    for item in range(items):
+        queue.put((item, item / 2))
+
+
+def produce_shared(queue: SharedQueue, items: int):
+    for item in range(items):
+        while True:
+            try:
+                queue.enqueue((item, item / 2))
+                break
+            except OverflowError:
+                sleep(0)  # yield to the consumer
+    queue.close()
+
+
+def produce_batches(queue: SharedQueue, items: int):
+    for start in range(0, items, BATCH):
+        batch = [(item, item / 2) for item in range(start, min(start + BATCH, items))]
+        while True:
+            try:
+                queue.enqueue_many(batch)
+                break
+            except OverflowError:
+                sleep(0)
+    queue.close()
+
+
+def main(items: int):
+    def standard():
+        queue = Queue(LENGTH)
+        producer = Process(target=produce_standard, args=(queue, items))
+        producer.start()
+        for _ in range(items):
+            queue.get()
+        producer.join()
+
+    def shared():
+        with SharedQueue(LENGTH, RECORD) as queue:
+            producer = Process(target=produce_shared, args=(queue, items))
+            producer.start()
+            received = 0
+            while received < items:
+                if queue.is_empty:
+                    sleep(0)
+                else:
+                    queue.dequeue()
+                    received += 1
+            producer.join()
+
+    def shared_batch():
+        with SharedQueue(LENGTH, RECORD) as queue:
+            producer = Process(target=produce_batches, args=(queue, items))
+            producer.start()
+            received = 0
+            while received < items:
+                batch = queue.dequeue_batch(BATCH)
+                if not batch:
+                    sleep(0)
+                received += len(batch)
+            producer.join()
+
+    results = {
+        "multiprocessing.Queue": measure(standard),
+        "SharedQueue": measure(shared),
+        "SharedQueue batches": measure(shared_batch),
+    }
+    report(f"{items} records of {RECORD!r}, 1 producer process", results)
+    for name, elapsed in results.items():
+        print(f"    {name:<21} : {items / elapsed:12,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*arguments + [200_000][len(arguments) :])
@@ -0,0 +1,48 @@
+"""
+Lookups in the Eytzinger `SortedIndex` vs `binary_search` on the sorted list.
+
+    python -m benchmarks.sorted_index [length] [queries]
+"""
+import sys
+from random import randint
+
+from algorithms import binary_search, lower_bound
+from data_structures import SortedIndex
+from . import measure, report
+
+
+def searches(queries: list, array: list) -> int:
+    found = 0
+    for item in queries:
+        try:
+            binary_search(item, array)
+            found += 1
+        except ValueError:
+            pass
+    return found
+
+
+def main(length: int, count: int):
+    array = list(range(0, 2 * length, 2))
+    queries = [randint(0, 2 * length) for _ in range(count)]
+    index = SortedIndex(array)
+    report(
+        f"{count} lookups in [{length}]",
+        {
+            "binary_search": measure(lambda: searches(queries, array), repeat=1),
+            "lower_bound": measure(
+                lambda: [lower_bound(item, array) for item in queries], repeat=1
+            ),
+            "SortedIndex.lookup": measure(
+                lambda: [index.lookup(item) for item in queries], repeat=1
+            ),
+            "SortedIndex.rank": measure(
+                lambda: [index.rank(item) for item in queries], repeat=1
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    main(length, int(sys.argv[2]) if len(sys.argv) > 2 else min(length, 10**6))
@@ -0,0 +1,58 @@
+"""
+`Stack` push/pop one element per call vs `push_many`/`pop_many` blocks,
+and the memory of a list storage vs a typed `array` storage.
+
+    python -m benchmarks.stack [length]
+"""
+import sys
+import tracemalloc
+
+from data_structures import Stack
+from . import random_array, measure, report
+
+
+def one_by_one(array: list, **options):
+    stack = Stack(growable=True, **options)
+    for item in array:
+        stack.push(item)
+    while not stack.is_empty:
+        stack.pop()
+
+
+def blocks(array: list, *, block: int = 1024, **options):
+    stack = Stack(growable=True, **options)
+    for start in range(0, len(array), block):
+        stack.push_many(array[start : start + block])
+    while stack.size >= block:
+        stack.pop_many(block)
+
+
+def memory(array: list, **options) -> int:
+    """Memory held by a filled stack with its elements, in bytes."""
+    tracemalloc.start()
+    try:
+        values = [item + 2**31 for item in array]  # new objects, not the shared ones
+        stack = Stack(growable=True, **options)
+        stack.push_many(values)
+        del values  # only the stack holds them
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(length: int):
+    array = random_array(length)
+    report(
+        f"push and pop [{length}]",
+        {
+            "one by one": measure(lambda: one_by_one(array)),
+            "blocks": measure(lambda: blocks(array)),
+            "blocks typed 'q'": measure(lambda: blocks(array, typecode="q")),
+        },
+    )
+    for name, options in (("list", {}), ("typed 'q'", {"typecode": "q"})):
+        print(f"    {name} memory: {memory(array, **options) / 2**20:.2f} MB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
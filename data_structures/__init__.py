@@ -1,9 +1,41 @@
 """
 Models of the Data Structures are implemented
+
+Every model is imported from its module on the first access.
 """
-from .stack import Stack  # noqa: F401
-from .queue import Queue  # noqa: F401
-from .linked_list import LinkedList  # noqa: F401
-from .hash_table import HashTable, String  # noqa: F401
-from .disjoint_set import DisjointSet  # noqa: F401
-from .tree import *  # noqa: F401, F403
+from _lazy import lazy_package
+from .tree import __all__ as _tree
+
+__all__ = (
+    "Stack",
+    "Queue",
+    "LinkedList",
+    "HashTable",
+    "String",
+    "DisjointSet",
+    "SortedIndex",
+    "QuantileSketch",
+    "BlockingQueue",
+    "BlockingStack",
+    "AsyncQueue",
+    "SharedQueue",
+) + _tree
+
+lazy_package(
+    __name__,
+    {
+        "Stack": ".stack",
+        "Queue": ".queue",
+        "LinkedList": ".linked_list",
+        "HashTable": ".hash_table",
+        "String": ".hash_table",
+        "DisjointSet": ".disjoint_set",
+        "SortedIndex": ".sorted_index",
+        "QuantileSketch": ".quantile_sketch",
+        "BlockingQueue": ".blocking",
+        "BlockingStack": ".blocking",
+        "AsyncQueue": ".async_queue",
+        "SharedQueue": ".shared_queue",
+        **{name: ".tree" for name in _tree},
+    },
+)
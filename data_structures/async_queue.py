@@ -0,0 +1,284 @@
+from asyncio import Future, get_running_loop
+from collections import deque
+from typing import Any, Deque, List, Optional
+
+from exceptions import UnderflowError
+
+
+class AsyncQueue:
+    """
+    # Async Queue
+    Bounded First In First Out `(FIFO)` queue for asyncio, on the same circular
+    buffer as `Queue` (first and number pointers with the modulo indexing)
+    but `enqueue` and `dequeue` are awaited instead of raising when it's full
+    or empty.
+
+    The backpressure has two watermarks: once the size reaches `high_water`
+    the producers are paused, and they're resumed only when the consumers
+    drain it down to `low_water`; so they aren't woken up for every item.
+    The waiting tasks are woken up one at a time in order, like `asyncio.Queue`.
+    The queue is iterated with `async for` until it's closed and drained.
+
+    ## Time Complexity:
+        * Enqueue, Dequeue: `O(1)`
+        * Dequeue Batch: `O(k)`
+    """
+
+    def __init__(
+        self,
+        length: int,
+        *,
+        high_water: Optional[int] = None,
+        low_water: Optional[int] = None,
+    ):
+        """
+        Initialize the queue list with first and number pointers.
+
+        :raises ValueError: if not `0 <= low_water < high_water <= length`
+        :param length: the maximum length size of this queue
+        :type length: int
+        :param high_water: size to pause the producers at, defaults to length
+        :type high_water: int, optional
+        :param low_water: size to resume the producers at, defaults to half of high
+        :type low_water: int, optional
+        """
+        high_water = length if high_water is None else high_water
+        low_water = high_water // 2 if low_water is None else low_water
+        if not 0 <= low_water < high_water <= length:
+            raise ValueError("Watermarks must be 0 <= low < high <= length.")
+
+        self.__length, self.__first, self.__number = length, 0, 0
+        self.__queue: List[Any] = [None] * length
+        self.__high, self.__low = high_water, low_water
+        self.__getters: Deque[Future] = deque()
+        self.__putters: Deque[Future] = deque()
+        self.__paused = self.__closed = False
+
+    async def enqueue(self, value: Any):
+        """
+        Adds an item to the queue, waits while the producers are paused.
+
+        :raises RuntimeError: if the queue is closed
+        :param value: the value to be pushed
+        :type value: Any
+        """
+        while self.__paused and not self.__closed:
+            await self.__wait(self.__putters)
+
+        self.enqueue_nowait(value)
+
+    def enqueue_nowait(self, value: Any):
+        """
+        Adds an item to the queue without waiting.
+        Time Complexity: `O(1)`
+
+        :raises RuntimeError: if the queue is closed
+        :raises OverflowError: if the producers are paused by the high watermark
+        :param value: the value to be pushed
+        :type value: Any
+        """
+        if self.__closed:
+            raise RuntimeError("Queue is closed.")
+        if self.__paused:
+            raise OverflowError("Queue is full.")
+
+        self.__queue[(self.__first + self.__number) % self.__length] = value
+        self.__number += 1
+        self.__paused = self.__number >= self.__high
+        self.__wake(self.__getters)
+
+    async def dequeue(self) -> Any:
+        """
+        Removes an item from the queue, waits while it's empty.
+
+        :raises UnderflowError: if the queue is closed and drained
+        :return: the value to be popped
+        :rtype: Any
+        """
+        while self.__number == 0:
+            if self.__closed:
+                raise UnderflowError("Queue is closed.")
+            await self.__wait(self.__getters)
+
+        return self.dequeue_nowait()
+
+    def dequeue_nowait(self) -> Any:
+        """
+        Removes an item from the queue without waiting.
+        Time Complexity: `O(1)`
+
+        :raises UnderflowError: if the queue is empty
+        :return: the value to be popped
+        :rtype: Any
+        """
+        if self.__number == 0:
+            raise UnderflowError("Queue is empty.")
+
+        first = self.__first
+        item, self.__queue[first] = self.__queue[first], None
+        self.__first = (first + 1) % self.__length
+        self.__number -= 1
+        self.__drained()
+        return item
+
+    async def dequeue_batch(self, max_items: int) -> List[Any]:
+        """
+        Removes up to `max_items` items from the queue, waits while it's empty.
+
+        :raises ValueError: if max_items isn't positive
+        :raises UnderflowError: if the queue is closed and drained
+        :param max_items: the maximum number of items to remove
+        :type max_items: int
+        :return: the values in the popping order
+        :rtype: list[Any]
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be a positive integer.")
+
+        while self.__number == 0:
+            if self.__closed:
+                raise UnderflowError("Queue is closed.")
+            await self.__wait(self.__getters)
+
+        return self.dequeue_batch_nowait(max_items)
+
+    def dequeue_batch_nowait(self, max_items: int) -> List[Any]:
+        """
+        Removes up to `max_items` items from the queue without waiting,
+        with slices of the circular buffer.
+        Time Complexity: `O(k)`
+
+        :raises ValueError: if max_items isn't positive
+        :raises UnderflowError: if the queue is empty
+        :param max_items: the maximum number of items to remove
+        :type max_items: int
+        :return: the values in the popping order
+        :rtype: list[Any]
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be a positive integer.")
+        if self.__number == 0:
+            raise UnderflowError("Queue is empty.")
+
+        count = min(max_items, self.__number)
+        start, end, queue = self.__first, self.__first + count, self.__queue
+        if end <= self.__length:  # one block, else it wraps around to the start
+            items, queue[start:end] = queue[start:end], [None] * count
+        else:
+            end -= self.__length
+            items = queue[start:] + queue[:end]
+            queue[start:], queue[:end] = [None] * (count - end), [None] * end
+
+        self.__first = end % self.__length
+        self.__number -= count
+        self.__drained()
+        return items
+
+    def close(self):
+        """
+        Close the queue, no more items can be enqueued; the waiting consumers
+        get the remaining items and then the iteration stops.
+        """
+        self.__closed = True
+        self.__wake(self.__getters, len(self.__getters))
+        self.__wake(self.__putters, len(self.__putters))
+
+    def __drained(self):
+        """Resume all of the producers once the size is down to the low watermark."""
+        if self.__paused and self.__number <= self.__low:
+            self.__paused = False
+            self.__wake(self.__putters, len(self.__putters))
+
+    @staticmethod
+    async def __wait(waiters: Deque[Future]):
+        """
+        Wait in line until woken up; a cancelled task which was already
+        woken up passes its turn on to the next one.
+        """
+        future = get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                AsyncQueue.__wake(waiters)
+            elif future in waiters:  # a wake up may have skipped it already
+                waiters.remove(future)
+            raise
+
+    @staticmethod
+    def __wake(waiters: Deque[Future], count: int = 1):
+        """Wake up the first waiting tasks of the line."""
+        while waiters and count:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                count -= 1
+
+    def __aiter__(self) -> "AsyncQueue":
+        return self
+
+    async def __anext__(self) -> Any:
+        """
+        Next item of the async iteration.
+
+        :raises StopAsyncIteration: if the queue is closed and drained
+        :return: the popped value
+        :rtype: Any
+        """
+        while self.__number == 0:
+            if self.__closed:
+                raise StopAsyncIteration
+            await self.__wait(self.__getters)
+
+        return self.dequeue_nowait()
+
+    @property
+    def size(self) -> int:
+        """
+        The number size of queue elements.
+
+        :return: the queue size number
+        :rtype: int
+        """
+        return self.__number
+
+    @property
+    def length(self) -> int:
+        """
+        The maximum length of the queue.
+
+        :return: the maximum size number
+        :rtype: int
+        """
+        return self.__length
+
+    @property
+    def is_paused(self) -> bool:
+        """
+        Boolean indicating whether the producers are paused by the watermarks.
+
+        :return: flag to check if the backpressure is on
+        :rtype: bool
+        """
+        return self.__paused
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Boolean indicating whether the queue is closed.
+
+        :return: flag to check if queue is closed
+        :rtype: bool
+        """
+        return self.__closed
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Boolean indicating whether the queue is empty.
+
+        :return: flag to check if queue is empty
+        :rtype: bool
+        """
+        return self.__number == 0
@@ -0,0 +1,236 @@
+from abc import ABC, abstractmethod
+from threading import Condition, Lock
+from typing import Any, List, Optional
+
+from exceptions import UnderflowError
+
+
+class _Blocking(ABC):
+    """
+    # Blocking Container
+    A bounded container which is safe to share between threads. One lock guards
+    the storage, with two conditions on it: producers wait on `not full` and
+    consumers on `not empty`, so a thread is only woken up when it can proceed.
+    The `timeout` of the blocking operations is in seconds, None waits forever
+    and 0 doesn't wait at all.
+    """
+
+    __slots__ = ("_length", "_number", "_items", "_not_empty", "_not_full")
+
+    def __init__(self, length: int):
+        """
+        Initialize the container with the fixed length storage.
+
+        :raises ValueError: if the length isn't positive
+        :param length: the maximum length size of this container
+        :type length: int
+        """
+        if length < 1:
+            raise ValueError("Length must be a positive integer.")
+
+        lock = Lock()
+        self._length, self._number = length, 0
+        self._items: List[Any] = [None] * length
+        self._not_empty, self._not_full = Condition(lock), Condition(lock)
+
+    def put(self, item: Any, *, timeout: Optional[float] = None):
+        """
+        Add an item, wait while the container is full.
+
+        :raises OverflowError: if it's still full after the timeout
+        :param item: the value to be added
+        :type item: Any
+        :param timeout: seconds to wait for a free slot, defaults to forever
+        :type timeout: float, optional
+        """
+        with self._not_full:
+            if self._number == self._length and not self._not_full.wait_for(
+                self._has_room, timeout
+            ):
+                raise OverflowError("Container is full.")
+
+            self._add(item)
+            self._number += 1
+            self._not_empty.notify()
+
+    def get(self, *, timeout: Optional[float] = None) -> Any:
+        """
+        Remove an item, wait while the container is empty.
+
+        :raises UnderflowError: if it's still empty after the timeout
+        :param timeout: seconds to wait for an item, defaults to forever
+        :type timeout: float, optional
+        :return: the removed value
+        :rtype: Any
+        """
+        with self._not_empty:
+            if self._number == 0 and not self._not_empty.wait_for(
+                self._has_items, timeout
+            ):
+                raise UnderflowError("Container is empty.")
+
+            item = self._pop()
+            self._number -= 1
+            self._not_full.notify()
+            return item
+
+    def get_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove up to `max_items` items with one lock acquisition, wait while
+        the container is empty; it drains many items for the cost of one get.
+
+        :raises ValueError: if max_items isn't positive
+        :param max_items: the maximum number of items to remove
+        :type max_items: int
+        :param timeout: seconds to wait for an item, defaults to forever
+        :type timeout: float, optional
+        :return: the removed values in the getting order, empty after the timeout
+        :rtype: list[Any]
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be a positive integer.")
+
+        with self._not_empty:
+            if self._number == 0 and not self._not_empty.wait_for(
+                self._has_items, timeout
+            ):
+                return []
+
+            count = min(max_items, self._number)
+            items = self._remove(count)
+            self._number -= count
+            self._not_full.notify(count)
+            return items
+
+    def _has_room(self) -> bool:
+        return self._number < self._length
+
+    def _has_items(self) -> bool:
+        return self._number > 0
+
+    @abstractmethod
+    def _add(self, item: Any):
+        pass
+
+    @abstractmethod
+    def _pop(self) -> Any:
+        pass
+
+    @abstractmethod
+    def _remove(self, count: int) -> List[Any]:
+        pass
+
+    @property
+    def size(self) -> int:
+        """
+        The number size of the elements, it may change right after reading it.
+
+        :return: the size number
+        :rtype: int
+        """
+        return self._number
+
+    @property
+    def length(self) -> int:
+        """
+        The maximum length of the container.
+
+        :return: the maximum size number
+        :rtype: int
+        """
+        return self._length
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Boolean indicating whether the container is empty.
+
+        :return: flag to check if container is empty
+        :rtype: bool
+        """
+        return self._number == 0
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Boolean indicating whether the container is full.
+
+        :return: flag to check if container is full
+        :rtype: bool
+        """
+        return self._number == self._length
+
+
+class BlockingQueue(_Blocking):
+    """
+    # Blocking Queue
+    Thread-safe bounded First In First Out `(FIFO)` queue on a ring buffer;
+    an alternative to `queue.Queue` with batched gets.
+
+    ## Time Complexity:
+        * Put, Get: `O(1)`
+        * Get Batch: `O(k)`
+    """
+
+    __slots__ = ("_first",)
+
+    def __init__(self, length: int):
+        """
+        Initialize the queue ring buffer with first and number pointers.
+
+        :raises ValueError: if the length isn't positive
+        :param length: the maximum length size of this queue
+        :type length: int
+        """
+        super().__init__(length)
+        self._first = 0
+
+    def _add(self, item: Any):
+        self._items[(self._first + self._number) % self._length] = item
+
+    def _pop(self) -> Any:
+        first = self._first
+        item, self._items[first] = self._items[first], None
+        self._first = (first + 1) % self._length
+        return item
+
+    def _remove(self, count: int) -> List[Any]:
+        start, end = self._first, self._first + count
+        items, blank = self._items, [None] * count
+        if end <= self._length:  # one block, else it wraps around to the start
+            result, items[start:end] = items[start:end], blank
+        else:
+            end -= self._length
+            result = items[start:] + items[:end]
+            items[start:], items[:end] = blank[end:], blank[:end]
+
+        self._first = end % self._length
+        return result
+
+
+class BlockingStack(_Blocking):
+    """
+    # Blocking Stack
+    Thread-safe bounded Last In First Out `(LIFO)` stack;
+    the batches are got in the popping order, the top first.
+
+    ## Time Complexity:
+        * Put, Get: `O(1)`
+        * Get Batch: `O(k)`
+    """
+
+    __slots__ = ()
+
+    def _add(self, item: Any):
+        self._items[self._number] = item
+
+    def _pop(self) -> Any:
+        top = self._number - 1
+        item, self._items[top] = self._items[top], None
+        return item
+
+    def _remove(self, count: int) -> List[Any]:
+        start, end = self._number - count, self._number
+        result, self._items[start:end] = self._items[start:end], [None] * count
+        result.reverse()
+        return result
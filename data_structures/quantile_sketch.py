@@ -0,0 +1,280 @@
+from bisect import bisect_left
+from itertools import accumulate, islice
+from math import ceil
+from random import Random
+from typing import Iterable, List, Optional, Tuple, Union
+
+from algorithms.quick_select import select_many
+
+Number = Union[int, float]
+
+
+class QuantileSketch:
+    """
+    # Quantile Sketch
+    A KLL (Karnin, Lang & Liberty) sketch to answer rank and quantile queries
+    over a stream that doesn't fit in memory. The values are kept in a stack of
+    compactors; an item at level `h` stands for `2^h` values of the stream.
+    When a level is over its capacity it's sorted and every other item (from
+    a random offset) is promoted to the next level, the rest are dropped.
+    The capacities shrink by `2/3` going down from the top level, so the
+    memory is bounded by about `3k` items whatever the length of the stream.
+
+    Until the first compaction (the first `k` values) nothing is dropped and the
+    queries are exact, answered by the `quick_select` engine (`select_many`).
+
+    Two sketches can be merged, e.g. the sketches of multiple worker processes;
+    they're plain picklable objects.
+
+    ## Time Complexity:
+        * Update: amortized `O(log(k))`
+        * Merge, Rank, Quantile: `O(k*log(k))`
+
+    ## Auxiliary Space: `O(k)`
+    """
+
+    def __init__(self, k: int = 200, *, seed: Optional[int] = None):
+        """
+        Initialize an empty sketch.
+
+        :raises ValueError: if k is less than 8
+        :param k: capacity of the top compactor, the accuracy parameter, default 200
+        :type k: int, optional
+        :param seed: seed of the random compaction offsets, defaults to None
+        :type seed: int, optional
+        """
+        if k < 8:
+            raise ValueError("K must be at least 8.")
+
+        self.__k, self.__count = k, 0
+        self.__levels: List[list] = [[]]
+        self.__size, self.__max_size = 0, k  # retained items and their capacity
+        self.__random = Random(seed)
+        self.__minimum: Optional[Number] = None
+        self.__maximum: Optional[Number] = None
+
+    @property
+    def exact(self) -> bool:
+        """
+        Boolean indicating whether every value is still retained.
+
+        :return: flag of the exact mode
+        :rtype: bool
+        """
+        return len(self.__levels) == 1
+
+    @property
+    def error(self) -> float:
+        """
+        Normalized rank error of the queries with 99% confidence,
+        the empirical bound of KLL `2.296 / k^0.9`; zero in the exact mode.
+
+        :return: rank error as a fraction of the stream length
+        :rtype: float
+        """
+        return 0.0 if self.exact else 2.296 / self.__k**0.9
+
+    def update(self, value: Number):
+        """
+        Add a value of the stream to the sketch.
+
+        :param value: a number of the stream
+        :type value: int | float
+        """
+        if self.__count == 0:
+            self.__minimum = self.__maximum = value
+        elif value < self.__minimum:
+            self.__minimum = value
+        elif value > self.__maximum:
+            self.__maximum = value
+
+        self.__count += 1
+        self.__size += 1
+        self.__levels[0].append(value)
+        if self.__size > self.__max_size:
+            self._compress()
+
+    def extend(self, values: Iterable[Number]):
+        """
+        Add the values of the stream to the sketch, a chunk at a time
+        which fills the sketch up to its capacity.
+
+        :param values: numbers of the stream
+        :type values: Iterable[int | float]
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, self.__max_size + 1 - self.__size))
+            if not chunk:
+                break
+
+            if self.__count == 0:
+                self.__minimum = self.__maximum = chunk[0]
+            self.__minimum = min(self.__minimum, min(chunk))
+            self.__maximum = max(self.__maximum, max(chunk))
+            self.__count += len(chunk)
+            self.__size += len(chunk)
+            self.__levels[0].extend(chunk)
+            self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch into this one, as if this one saw both streams.
+
+        :param other: the sketch to merge from, it's left unchanged
+        :type other: QuantileSketch
+        :return: this sketch
+        :rtype: QuantileSketch
+        """
+        if other.__count == 0:
+            return self
+
+        if self.__count == 0:
+            self.__minimum, self.__maximum = other.__minimum, other.__maximum
+        else:
+            self.__minimum = min(self.__minimum, other.__minimum)
+            self.__maximum = max(self.__maximum, other.__maximum)
+
+        self.__count += other.__count
+        for height, level in enumerate(other.__levels):
+            if height == len(self.__levels):
+                self._grow()
+            self.__levels[height].extend(level)
+            self.__size += len(level)
+
+        self._compress()
+        return self
+
+    def rank(self, value: Number) -> int:
+        """
+        Estimated number of the stream values less than the value.
+
+        :param value: a number to rank
+        :type value: int | float
+        :return: the estimated rank
+        :rtype: int
+        """
+        return sum(
+            sum(1 for item in level if item < value) << height
+            for height, level in enumerate(self.__levels)
+        )
+
+    def quantile(self, q: float) -> Number:
+        """
+        Estimated value of the q-quantile, e.g. `0.99` for the p99;
+        the smallest value which at least `q` of the stream isn't greater than.
+
+        :raises ValueError: if q isn't between 0 and 1 or the sketch is empty
+        :param q: fraction between 0 and 1
+        :type q: float
+        :return: the estimated quantile value
+        :rtype: int | float
+        """
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[Number]:
+        """
+        Estimated values of several quantiles in one pass.
+
+        :raises ValueError: if a q isn't between 0 and 1 or the sketch is empty
+        :param qs: fractions between 0 and 1
+        :type qs: Iterable[float]
+        :return: the estimated quantile values in the order of qs
+        :rtype: list[int | float]
+        """
+        qs, count = list(qs), self.__count
+        if not all(0 <= q <= 1 for q in qs):
+            raise ValueError("Q must be between zero and one.")
+        if count == 0:
+            raise ValueError("Sketch is empty.")
+
+        ranks = [max(1, ceil(q * count)) for q in qs]
+        if self.exact:
+            return select_many(ranks, self.__levels[0])
+
+        values, weights = self._cumulative()
+        return [
+            self.__minimum
+            if rank == 1
+            else self.__maximum
+            if rank == count
+            else values[bisect_left(weights, rank)]
+            for rank in ranks
+        ]
+
+    def _cumulative(self) -> Tuple[list, list]:
+        """
+        Retained items in sorted order with their cumulative weights.
+
+        :return: tuple of sorted values and cumulative weights
+        :rtype: tuple[list, list[int]]
+        """
+        items = sorted(
+            (item, 1 << height)
+            for height, level in enumerate(self.__levels)
+            for item in level
+        )
+        return [item for item, _ in items], list(accumulate(w for _, w in items))
+
+    def _capacity(self, height: int) -> int:
+        """
+        Capacity of the compactor at the level, `k * (2/3)^depth` and at least 2.
+
+        :param height: level of the compactor
+        :type height: int
+        :return: number of items the level may hold
+        :rtype: int
+        """
+        depth = len(self.__levels) - height - 1
+        return max(2, int(self.__k * (2 / 3) ** depth))
+
+    def _grow(self):
+        """
+        Add an empty level on the top, the capacities of the others shrink.
+        """
+        self.__levels.append([])
+        self.__max_size = sum(map(self._capacity, range(len(self.__levels))))
+
+    def _compress(self):
+        """
+        While the sketch is over its capacity, compact the lowest level which is
+        over its own capacity; so the small levels are compacted lazily.
+        """
+        levels = self.__levels
+        while self.__size > self.__max_size:
+            height = next(
+                height
+                for height, level in enumerate(levels)
+                if len(level) > self._capacity(height)
+            )
+            if height + 1 == len(levels):
+                self._grow()
+
+            level = levels[height]
+            level.sort()
+            kept = [level.pop()] if len(level) % 2 else []
+            promoted = level[self.__random.getrandbits(1) :: 2]
+            levels[height + 1].extend(promoted)
+            levels[height] = kept
+            self.__size -= len(level) - len(promoted)
+
+    def __len__(self) -> int:
+        """
+        Return the number of the stream values seen by the sketch.
+
+        :return: length of the stream
+        :rtype: int
+        """
+        return self.__count
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """
+        Representation of the sketch with its size and mode.
+
+        :return: representation string
+        :rtype: str
+        """
+        retained = self.__size
+        return (
+            f"QuantileSketch(k={self.__k}, count={self.__count}, retained={retained})"
+        )
@@ -0,0 +1,338 @@
+from contextlib import nullcontext
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from os import getpid
+from struct import Struct
+from typing import Any, List, Optional, Sequence, Union
+
+from exceptions import UnderflowError
+
+# the head and the tail counters are on their own cache lines, no false sharing
+_LINE = 64
+_HEAD, _TAIL, _HEADER = 0, _LINE // 8, 2 * _LINE
+
+
+class SharedQueue:
+    """
+    # Shared Queue
+    Bounded First In First Out `(FIFO)` queue of fixed size records in shared
+    memory, to pass them between processes without pickling. It's the circular
+    buffer of `Queue` with the pointers kept as two counters in the header:
+    the head is the number of dequeued records and the tail of enqueued ones,
+    so the size is `tail - head` and a record lives in slot `counter % length`.
+
+    The records are packed with a `struct` format (values are tuples)
+    or are raw `bytes` slots of a given size.
+    With one producer and one consumer (the default) there's no lock: each
+    counter has a single writer which moves it forward only after the slot is
+    written or read, so the other side sees a stale value at worst.
+    With `multiple=True` a process-shared lock guards every operation.
+
+    The queue is sent to the other processes as an argument of `Process`,
+    it's pickled by the name of the shared memory; with `multiple=True` it's
+    only picklable while spawning a process, since the lock refuses otherwise.
+    Only the process which created it unlinks the shared memory.
+
+    ## Time Complexity:
+        * Enqueue, Dequeue: `O(1)`
+        * Enqueue Many, Dequeue Batch: `O(k)`
+    """
+
+    def __init__(
+        self,
+        length: int,
+        record: Union[str, int],
+        *,
+        multiple: bool = False,
+        context: Optional[Any] = None,
+    ):
+        """
+        Initialize the shared memory with the counters and the slots.
+
+        :raises ValueError: if the length or the record size isn't positive
+        :param length: the maximum length size of this queue
+        :type length: int
+        :param record: `struct` format of the records or size of the raw slots
+        :type record: str | int
+        :param multiple: for many producers or consumers, defaults to False
+        :type multiple: bool, optional
+        :param context: `multiprocessing` context of the processes to create the
+            lock in, defaults to the default context
+        :type context: multiprocessing.context.BaseContext, optional
+        """
+        struct = Struct(record) if isinstance(record, str) else None
+        size = record if struct is None else struct.size
+        if length < 1 or size < 1:
+            raise ValueError("Length and record size must be positive integers.")
+
+        memory = SharedMemory(create=True, size=_HEADER + length * size)
+        lock = (context or multiprocessing).Lock() if multiple else None
+        self.__attach(memory, length, record, lock)
+        self.__owner = getpid()  # a forked copy isn't the owner either
+
+    def __attach(
+        self, memory: SharedMemory, length: int, record: Union[str, int], lock: Any
+    ):
+        self.__memory, self.__length, self.__record = memory, length, record
+        self.__struct = Struct(record) if isinstance(record, str) else None
+        self.__size = record if self.__struct is None else self.__struct.size
+        self.__lock, self.__guard = lock, nullcontext() if lock is None else lock
+        self.__counters = memory.buf[:_HEADER].cast("Q")
+        self.__slots = memory.buf[_HEADER : _HEADER + length * self.__size]
+        self.__owner: Optional[int] = None
+
+    def __reduce__(self) -> tuple:
+        return _attach, (self.__memory.name, self.__length, self.__record, self.__lock)
+
+    def enqueue(self, value: Union[Sequence[Any], bytes]):
+        """
+        Adds a record to the queue.
+        Time Complexity: `O(1)`
+
+        :raises OverflowError: if the queue is full, then it's Overflow exception
+        :param value: fields of the struct format or bytes of the slot size
+        :type value: Sequence[Any] | bytes
+        """
+        with self.__guard:
+            counters = self.__counters
+            tail = counters[_TAIL]
+            if tail - counters[_HEAD] == self.__length:
+                raise OverflowError("Queue is full.")
+
+            self.__write(tail % self.__length, value)
+            counters[_TAIL] = tail + 1
+
+    def enqueue_many(self, values: Sequence[Union[Sequence[Any], bytes]]):
+        """
+        Adds the records to the queue in order, all of them or none,
+        and publishes them with a single update of the tail.
+        Time Complexity: `O(k)`
+
+        :raises OverflowError: if there isn't room for all of the records
+        :param values: records of the struct format or bytes of the slot size
+        :type values: Sequence[Sequence[Any] | bytes]
+        """
+        with self.__guard:
+            counters = self.__counters
+            tail = counters[_TAIL]
+            if tail - counters[_HEAD] + len(values) > self.__length:
+                raise OverflowError("Queue doesn't have room for all of the values.")
+
+            for offset, value in enumerate(values, tail):
+                self.__write(offset % self.__length, value)
+            counters[_TAIL] = tail + len(values)
+
+    def dequeue(self) -> Union[tuple, bytes]:
+        """
+        Removes a record from the queue, it's copied out of the shared memory.
+        Time Complexity: `O(1)`
+
+        :raises UnderflowError: if the queue is empty, then it's Underflow exception
+        :return: unpacked fields of the struct format or bytes of the slot
+        :rtype: tuple | bytes
+        """
+        with self.__guard:
+            counters = self.__counters
+            head = counters[_HEAD]
+            if head == counters[_TAIL]:
+                raise UnderflowError("Queue is empty.")
+
+            item = self.__read(head % self.__length, 1)[0]
+            counters[_HEAD] = head + 1
+            return item
+
+    def dequeue_batch(self, max_items: int) -> List[Union[tuple, bytes]]:
+        """
+        Removes up to `max_items` records from the queue,
+        they're unpacked from at most two contiguous blocks of the slots.
+        Time Complexity: `O(k)`
+
+        :raises ValueError: if max_items isn't positive
+        :param max_items: the maximum number of records to remove
+        :type max_items: int
+        :return: the records in the dequeuing order, empty if the queue is empty
+        :rtype: list[tuple | bytes]
+        """
+        if max_items < 1:
+            raise ValueError("Max items must be a positive integer.")
+
+        with self.__guard:
+            counters = self.__counters
+            head = counters[_HEAD]
+            count = min(max_items, counters[_TAIL] - head)
+            start = head % self.__length
+            first = min(count, self.__length - start)
+            items = self.__read(start, first)
+            if first < count:  # it wraps around to the start
+                items += self.__read(0, count - first)
+
+            counters[_HEAD] = head + count
+            return items
+
+    def peek(self) -> memoryview:
+        """
+        View of the first slot in the shared memory without copying it, for a
+        single consumer; it's valid until `release` and released before closing.
+        Time Complexity: `O(1)`
+
+        :raises UnderflowError: if the queue is empty, then it's Underflow exception
+        :return: writable view of the slot bytes
+        :rtype: memoryview
+        """
+        counters = self.__counters
+        head = counters[_HEAD]
+        if head == counters[_TAIL]:
+            raise UnderflowError("Queue is empty.")
+
+        return self.__slot(head % self.__length)
+
+    def release(self):
+        """
+        Removes the first record after it's read through `peek`.
+        Time Complexity: `O(1)`
+
+        :raises UnderflowError: if the queue is empty, then it's Underflow exception
+        """
+        with self.__guard:
+            counters = self.__counters
+            if counters[_HEAD] == counters[_TAIL]:
+                raise UnderflowError("Queue is empty.")
+
+            counters[_HEAD] += 1
+
+    def reserve(self) -> memoryview:
+        """
+        View of the next free slot in the shared memory to be written in place,
+        for a single producer; it's added to the queue by `commit`.
+        Time Complexity: `O(1)`
+
+        :raises OverflowError: if the queue is full, then it's Overflow exception
+        :return: writable view of the slot bytes
+        :rtype: memoryview
+        """
+        counters = self.__counters
+        tail = counters[_TAIL]
+        if tail - counters[_HEAD] == self.__length:
+            raise OverflowError("Queue is full.")
+
+        return self.__slot(tail % self.__length)
+
+    def commit(self):
+        """
+        Adds the record written through `reserve` to the queue.
+        Time Complexity: `O(1)`
+
+        :raises OverflowError: if the queue is full, then it's Overflow exception
+        """
+        with self.__guard:
+            counters = self.__counters
+            if counters[_TAIL] - counters[_HEAD] == self.__length:
+                raise OverflowError("Queue is full.")
+
+            counters[_TAIL] += 1
+
+    def close(self):
+        """
+        Detach this process from the shared memory, and free it if this process
+        created the queue; the other processes should close their copies too.
+        """
+        self.__counters.release()
+        self.__slots.release()
+        self.__memory.close()
+        if self.__owner == getpid():
+            self.__memory.unlink()
+
+    def __enter__(self) -> "SharedQueue":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __slot(self, index: int) -> memoryview:
+        return self.__slots[index * self.__size : (index + 1) * self.__size]
+
+    def __write(self, index: int, value: Union[Sequence[Any], bytes]):
+        if self.__struct is not None:
+            self.__struct.pack_into(self.__slots, index * self.__size, *value)
+        elif len(value) != self.__size:
+            raise ValueError(f"Value must be {self.__size} bytes.")
+        else:
+            self.__slots[index * self.__size : (index + 1) * self.__size] = value
+
+    def __read(self, index: int, count: int) -> List[Union[tuple, bytes]]:
+        size = self.__size
+        block = self.__slots[index * size : (index + count) * size]
+        if self.__struct is not None:
+            return list(self.__struct.iter_unpack(block))
+
+        data = bytes(block)
+        return [data[offset : offset + size] for offset in range(0, len(data), size)]
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory block.
+
+        :return: the shared memory name
+        :rtype: str
+        """
+        return self.__memory.name
+
+    @property
+    def record_size(self) -> int:
+        """
+        The number of bytes of every slot.
+
+        :return: the slot size number
+        :rtype: int
+        """
+        return self.__size
+
+    @property
+    def size(self) -> int:
+        """
+        The number size of queue records, it may change right after reading it.
+
+        :return: the queue size number
+        :rtype: int
+        """
+        return self.__counters[_TAIL] - self.__counters[_HEAD]
+
+    @property
+    def length(self) -> int:
+        """
+        The maximum length of the queue.
+
+        :return: the maximum size number
+        :rtype: int
+        """
+        return self.__length
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Boolean indicating whether the queue is empty.
+
+        :return: flag to check if queue is empty
+        :rtype: bool
+        """
+        return self.size == 0
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Boolean indicating whether the queue is full.
+
+        :return: flag to check if queue is full
+        :rtype: bool
+        """
+        return self.size == self.__length
+
+
+def _attach(
+    name: str, length: int, record: Union[str, int], lock: Optional[Any]
+) -> SharedQueue:
+    """Copy of the queue in another process, attached to the same memory."""
+    queue = SharedQueue.__new__(SharedQueue)
+    queue._SharedQueue__attach(SharedMemory(name), length, record, lock)
+    return queue
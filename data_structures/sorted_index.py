@@ -0,0 +1,137 @@
+from array import array as ArrayType
+from typing import Any, Optional, Sequence, Union
+
+
+class SortedIndex:
+    """
+    # Sorted Index
+    A static search index built once from a sorted sequence. The elements are
+    re-laid in Eytzinger (breadth first) order of the implicit binary search tree:
+    the root at `1`, the children of node `k` at `2k` and `2k + 1`.
+    So the first levels of every search are packed at the beginning of the array
+    and each search walks down the tree without branches on the comparisons.
+    The elements and their sorted ranks are stored in typed `array`s.
+
+    ## Time Complexity:
+        * Build: `O(n)`
+        * Lookup, Rank, Predecessor: `O(log(n))`
+
+    ## Auxiliary Space: `O(n)`
+    """
+
+    def __init__(self, array: Sequence[Any], *, typecode: Optional[str] = "q"):
+        """
+        Initialize the index from the sorted sequence.
+
+        :param array: sorted sequence of elements
+        :type array: Sequence[Any]
+        :param typecode: `array` typecode of elements or None for objects, default "q"
+        :type typecode: str, optional
+        """
+        length = self.__length = len(array)
+        tree: list = [array[0] if length else 0] * (length + 1)  # node 0 unused
+        ranks = [0] * (length + 1)
+
+        stack, node, rank = [], 1, 0
+        while stack or node <= length:  # in order traversal of the implicit tree
+            while node <= length:
+                stack.append(node)
+                node *= 2
+
+            node = stack.pop()
+            tree[node], ranks[node] = array[rank], rank
+            rank, node = rank + 1, 2 * node + 1
+
+        self.__tree: Union[list, ArrayType] = (
+            tree if typecode is None else ArrayType(typecode, tree)
+        )
+        self.__ranks = ArrayType("q", ranks)
+
+    def _lower(self, item: Any) -> int:
+        """
+        Eytzinger node of the first element which isn't less than item, or `0`.
+        The descent goes right while the node is less than item; then the trailing
+        right turns (the one bits) and the last left turn are cancelled.
+
+        :param item: a value to search for
+        :type item: Any
+        :return: node index in the tree or 0 if every element is less than item
+        :rtype: int
+        """
+        tree, length, node = self.__tree, self.__length, 1
+        while node <= length:
+            node = 2 * node + (tree[node] < item)
+
+        return node >> ((~node & (node + 1)).bit_length())
+
+    def rank(self, item: Any) -> int:
+        """
+        Number of the elements less than item; its lower bound in sorted order.
+
+        :param item: a value to search for
+        :type item: Any
+        :return: index of the leftmost insertion point of item
+        :rtype: int
+        """
+        node = self._lower(item)
+        return self.__ranks[node] if node else self.__length
+
+    def lookup(self, item: Any) -> int:
+        """
+        Index of the item in sorted order, its first occurrence; or `-1` if missing.
+
+        :param item: a value to search for
+        :type item: Any
+        :return: index of item in the sorted sequence or -1
+        :rtype: int
+        """
+        node = self._lower(item)
+        return self.__ranks[node] if node and self.__tree[node] == item else -1
+
+    def predecessor(self, item: Any) -> Optional[Any]:
+        """
+        The greatest element which is less than item, or None if there isn't any.
+
+        :param item: a value to search for
+        :type item: Any
+        :return: the predecessor element or None
+        :rtype: Any, optional
+        """
+        tree, length, node, result = self.__tree, self.__length, 1, None
+        while node <= length:
+            if tree[node] < item:
+                result, node = tree[node], 2 * node + 1
+            else:
+                node = 2 * node
+
+        return result
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Boolean indicating whether the item is in the index.
+
+        :param item: a value to search for
+        :type item: Any
+        :return: flag to check if item is in the index
+        :rtype: bool
+        """
+        node = self._lower(item)
+        return node != 0 and self.__tree[node] == item
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the index.
+
+        :return: number of elements
+        :rtype: int
+        """
+        return self.__length
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """
+        Representation the index in Eytzinger order.
+
+        :return: representation string
+        :rtype: str
+        """
+        return f"SortedIndex({list(self.__tree[1:])})"
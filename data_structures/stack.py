@@ -1,5 +1,6 @@
+from array import array as ArrayType
 from collections import deque  # noqa: F401
-from typing import Optional, List
+from typing import Iterable, Optional, List, Union
 
 from exceptions import UnderflowError
 
@@ -10,17 +11,36 @@ class Stack:
     A stack is a linear data structure that stores items in a Last-In/First-Out `(LIFO)`
     or First-In/Last-Out `(FILO)` manner.
     A new element is added at one end and an element is removed from that end only.
+
+    A growable stack doubles its length when it's full (amortized `O(1)` push)
+    instead of raising `OverflowError`. With a typecode, the elements are stored
+    in an `array` (e.g. 8 bytes per element for "q" or "d") instead of a list
+    of pointers to objects.
     """
 
-    def __init__(self, length: int):
+    __slots__ = ("__length", "__number", "__stack", "__growable")
+
+    def __init__(
+        self,
+        length: int = 0,
+        *,
+        growable: bool = False,
+        typecode: Optional[str] = None,
+    ):
         """
         Initialize the stack list with a number pointer.
 
-        :param length: the maximum length size of this queue
-        :type length: int
+        :param length: the maximum (or initial if growable) length size of this stack
+        :type length: int, optional
+        :param growable: double the length when it's full, defaults to False
+        :type growable: bool, optional
+        :param typecode: `array` typecode of the elements or None for a list
+        :type typecode: str, optional
         """
-        self.__length, self.__number = length, 0
-        self.__stack: List[Optional[int]] = [None for _ in range(self.__length)]
+        self.__length, self.__number, self.__growable = length, 0, growable
+        self.__stack: Union[List[Optional[int]], ArrayType] = (
+            [None] * length if typecode is None else ArrayType(typecode, [0]) * length
+        )
 
     def pop(self) -> int:
         """
@@ -46,12 +66,75 @@ class Stack:
         :param value: the value to be pushed
         :type value: int
         """
-        if self.is_full:
-            raise OverflowError("Stack Overflow.")
+        if self.__number == self.__length:
+            self.__reserve(self.__number + 1)
 
         self.__stack[self.__number] = value
         self.__number += 1
 
+    def push_many(self, values: Iterable[int]):
+        """
+        Inserts the elements at the top of the stack in order, the last one on top;
+        as one block with a slice assignment.
+        Time Complexity: `O(k)`
+
+        :raises OverflowError: if they don't fit in the stack, nothing is pushed
+        :param values: the values to be pushed
+        :type values: Iterable[int]
+        """
+        stack = self.__stack
+        if isinstance(stack, ArrayType):
+            values = ArrayType(stack.typecode, values)
+        elif not isinstance(values, list):
+            values = list(values)
+
+        start, end = self.__number, self.__number + len(values)
+        if end > self.__length:
+            self.__reserve(end)
+
+        self.__stack[start:end] = values
+        self.__number = end
+
+    def pop_many(self, count: int) -> Union[List[int], ArrayType]:
+        """
+        Deletes the topmost elements of the stack as one block.
+        Time Complexity: `O(k)`
+
+        :raises UnderflowError: if the stack has less elements, nothing is popped
+        :param count: number of the elements to be popped
+        :type count: int
+        :return: the popped values in the popping order, the top first;
+            an `array` if the stack has a typecode
+        :rtype: list[int] | array
+        """
+        if not 0 <= count <= self.__number:
+            raise UnderflowError("Stack hasn't enough elements.")
+
+        self.__number -= count
+        values = self.__stack[self.__number : self.__number + count]
+        values.reverse()
+        return values
+
+    def __reserve(self, length: int):
+        """
+        Grow the storage to hold at least the length, doubling it.
+
+        :raises OverflowError: if the stack isn't growable
+        :param length: the required length
+        :type length: int
+        """
+        if not self.__growable:
+            raise OverflowError("Stack Overflow.")
+
+        length, stack = max(length, 2 * self.__length), self.__stack
+        extra = length - self.__length
+        stack.extend(
+            [None] * extra
+            if isinstance(stack, list)
+            else ArrayType(stack.typecode, [0]) * extra
+        )
+        self.__length = length
+
     @property
     def size(self) -> int:
         """
@@ -65,7 +148,7 @@ class Stack:
     @property
     def length(self) -> int:
         """
-        The maximum length of the queue.
+        The maximum length of the stack, the current one if it's growable.
 
         :return: the maximum size number
         :rtype: int
@@ -99,12 +182,12 @@ class Stack:
     @property
     def is_full(self) -> bool:
         """
-        Boolean indicating whether the stack is full.
+        Boolean indicating whether the stack is full, a growable one never is.
 
         :return: flag to check if stack is full
         :rtype: bool
         """
-        return self.__number == self.__length
+        return not self.__growable and self.__number == self.__length
 
     def __repr__(self) -> str:  # pragma: no cover
         """
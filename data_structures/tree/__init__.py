@@ -1,12 +1,9 @@
 """
 Models of the Tree Data Structures are implemented
-"""
-from .binary_tree import BinaryTree
-from .trie import Trie
-from .heap import MinHeap, MaxHeap
-from .red_black import RBBinaryTree
-from .fenwick import FenwickTree
 
+Every model is imported from its module on the first access.
+"""
+from _lazy import lazy_package
 
 __all__ = (
     "BinaryTree",
@@ -16,3 +13,15 @@ __all__ = (
     "RBBinaryTree",
     "FenwickTree",
 )
+
+lazy_package(
+    __name__,
+    {
+        "BinaryTree": ".binary_tree",
+        "Trie": ".trie",
+        "MinHeap": ".heap",
+        "MaxHeap": ".heap",
+        "RBBinaryTree": ".red_black",
+        "FenwickTree": ".fenwick",
+    },
+)
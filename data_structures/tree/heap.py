@@ -1,6 +1,8 @@
 import heapq  # noqa: F401
 from abc import ABC, abstractmethod
 
+from algorithms.counters import count_moves
+
 
 class _AbstractHeap(ABC):
     """
@@ -61,6 +63,23 @@ class _AbstractHeap(ABC):
         self.bubble_down(index=0)
         return result
 
+    def replace(self, item: int) -> int:
+        """
+        Delete the top head node and insert the new value with one bubble down;
+        faster than a delete followed by an insert.
+
+        :param item: new integer item value to inserted
+        :type item: int
+        :return: integer value of the top head node
+        :rtype: int
+        """
+        if self.is_empty:
+            raise Exception("Heap is empty.")
+
+        result, self._heap[0] = self._heap[0], item
+        self.bubble_down(index=0)
+        return result
+
     @staticmethod
     def parent(index: int) -> int:
         """
@@ -130,13 +149,14 @@ class _AbstractHeap(ABC):
 
     def _swap(self, i: int, j: int, /):
         """
-        Swap two nodes in the heap with indexes.
+        Swap two nodes in the heap with indexes, counted inside `count_operations`.
 
         :param i: index of first node to swap
         :type i: int
         :param j: index of second node to swap
         :type j: int
         """
+        count_moves(self._heap, 2)
         self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
 
     def __len__(self) -> int:
@@ -1,6 +1,6 @@
-from pytest import mark, raises
+from pytest import mark, raises, importorskip
 
-from algorithms import binary_search
+from algorithms import binary_search, lower_bound, upper_bound, contains, search_many
 from ..conftest import ODD_ARRAY, EVEN_ARRAY
 
 
@@ -16,3 +16,41 @@ def test_binary_search(item, array, expected):
 def test_binary_search_errors():
     with raises(ValueError):
         binary_search(10, ODD_ARRAY)
+
+
+duplicates = [1, 2, 2, 2, 5, 7, 7]
+
+
+@mark.parametrize(
+    "item, lower, upper",
+    [(0, 0, 0), (1, 0, 1), (2, 1, 4), (3, 4, 4), (5, 4, 5), (7, 5, 7), (8, 7, 7)],
+)
+def test_bounds(item, lower, upper):
+    assert lower_bound(item, duplicates) == lower
+    assert upper_bound(item, duplicates) == upper
+    assert contains(item, duplicates) is (lower != upper)
+
+
+def test_bounds_range():
+    assert lower_bound(2, duplicates, start=2) == 2
+    assert upper_bound(2, duplicates, end=3) == 3
+    assert contains(1, []) is False
+
+
+@mark.parametrize(
+    "queries, expected",
+    [
+        ([], []),
+        ([7, 0, 2, 5, 9, 2, 1], [5, -1, 1, 4, -1, 1, 0]),
+        (EVEN_ARRAY.reversed, [-1, -1, -1, 5, -1, 4, -1, -1, 1, 0]),
+    ],
+)
+def test_search_many(queries, expected):
+    assert search_many(queries, duplicates) == expected
+
+
+def test_search_many_numpy():
+    numpy = importorskip("numpy")
+    array = numpy.array(duplicates)
+    assert search_many([7, 0, 2, 5, 9, 2, 1], array) == [5, -1, 1, 4, -1, 1, 0]
+    assert search_many([1], array[:0]) == [-1]
@@ -0,0 +1,187 @@
+import sys
+import tracemalloc
+from threading import Thread
+
+from pytest import mark
+
+from algorithms import (
+    registry,
+    count_operations,
+    merge_sort,
+    bubble_sort,
+    insertion_sort,
+    selection_sort,
+    tim_sort,
+    heap_sort,
+    quick_sort,
+    partial_sort,
+    counting_sort,
+)
+from algorithms.counters import Counted, Operations
+from data_structures import MinHeap, MaxHeap
+from ..conftest import ODD_ARRAY, EVEN_ARRAY
+
+quick_select = sys.modules["algorithms.quick_select"]
+
+
+def test_disabled():
+    with count_operations() as operations:
+        pass
+    assert merge_sort(ODD_ARRAY.shuffled) == ODD_ARRAY.sorted
+    assert MinHeap(*ODD_ARRAY.shuffled).top == ODD_ARRAY.sorted[0]
+    assert operations == Operations()
+
+
+def test_registry():
+    registry.reset()
+    with count_operations() as operations:
+        assert counting_sort(ODD_ARRAY.shuffled) == ODD_ARRAY.sorted
+        registry.enable()
+        try:
+            assert merge_sort(ODD_ARRAY.shuffled) == ODD_ARRAY.sorted
+        finally:
+            registry.disable()
+    assert list(registry.snapshot()) == ["merge_sort"]
+    assert operations.comparisons > 0
+    registry.reset()
+
+
+@mark.parametrize("array", [ODD_ARRAY, EVEN_ARRAY])
+def test_bubble_sort(array):
+    length = len(array)
+    with count_operations() as operations:
+        assert bubble_sort(array.reversed) == array.sorted
+    assert operations.comparisons == length * (length - 1) // 2
+    assert operations.swaps == length * (length - 1)  # a swap is two moves
+    assert operations.allocations > 0
+
+
+@mark.parametrize(
+    "function, kwargs",
+    [
+        (merge_sort, {}),
+        (merge_sort, {"key": lambda item: -item, "reverse": True}),
+        (quick_sort, {}),
+        (partial_sort, {"k": 4}),
+    ],
+)
+def test_comparison_sorts(function, kwargs):
+    array = EVEN_ARRAY.shuffled
+    with count_operations() as operations:
+        result = function(array, **kwargs)
+    assert all(type(item) is int for item in result)
+    assert result == EVEN_ARRAY.sorted[: kwargs.get("k")]
+    assert operations.comparisons >= len(result) - 1
+
+
+@mark.parametrize(
+    "function, kwargs",
+    [
+        (insertion_sort, {}),
+        (insertion_sort, {"binary": True}),
+        (selection_sort, {}),
+        (merge_sort, {}),
+        (merge_sort, {"bottom_up": True}),
+        (tim_sort, {}),
+        (heap_sort, {}),
+        (heap_sort, {"in_place": True}),
+        (quick_sort, {}),
+        (quick_sort, {"intro": True}),
+        (quick_sort, {"key": lambda item: -item, "reverse": True}),
+        (bubble_sort, {"reverse": True}),
+    ],
+)
+def test_moves(function, kwargs):
+    with count_operations() as operations:
+        result = function(EVEN_ARRAY.shuffled, **kwargs)
+    assert sorted(result) == EVEN_ARRAY.sorted
+    assert operations.swaps >= len(result) // 2
+
+
+def test_merge_moves():
+    array = EVEN_ARRAY.shuffled
+    with count_operations() as operations:
+        merge_sort(array, bottom_up=True)
+    passes = (len(array) - 1).bit_length()
+    assert operations.swaps == len(array) * (passes + passes % 2)
+
+
+def test_key():
+    array = EVEN_ARRAY.shuffled
+    with count_operations() as plain:
+        merge_sort(array)
+    with count_operations() as keyed:
+        merge_sort(array, key=lambda item: item)
+    assert keyed.comparisons == plain.comparisons > 0
+
+
+def test_in_place_and_nested():
+    array = ODD_ARRAY.reversed
+    with count_operations() as outer:
+        with count_operations() as inner:
+            assert heap_sort(array, in_place=True) is array
+        assert counting_sort(ODD_ARRAY.reversed) == ODD_ARRAY.sorted
+    assert array == ODD_ARRAY.sorted
+    assert inner.comparisons > 0 and outer == inner
+
+
+def test_threads():
+    counts = []
+
+    def count():
+        with count_operations() as operations:
+            merge_sort(EVEN_ARRAY.reversed)
+        counts.append(operations.comparisons)
+
+    with count_operations() as outer:
+        threads = [Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    count()
+    assert outer == Operations() and len(set(counts)) == 1
+
+
+def test_traced_by_caller():
+    tracemalloc.start()
+    try:
+        block = bytearray(1 << 20)
+        del block
+        peak = tracemalloc.get_traced_memory()[1]
+        with count_operations() as operations:
+            merge_sort(EVEN_ARRAY.shuffled)
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak
+    finally:
+        tracemalloc.stop()
+    assert operations.comparisons > 0 and operations.allocations == 0
+
+
+def test_partition():
+    array = [Counted(item) for item in ODD_ARRAY.shuffled]
+    with count_operations() as operations:
+        pivot = quick_select.partition(array, start=0, end=len(array) - 1)
+    assert all(item <= array[pivot] for item in array[:pivot])
+    assert operations.comparisons >= len(array) - 1 and operations.swaps >= 2
+
+    array = ODD_ARRAY.shuffled
+    with count_operations() as raw:
+        quick_select.partition(array, start=0, end=len(array) - 1)
+    assert raw.comparisons == 0 and raw.swaps >= 2
+
+
+@mark.parametrize("cls", [MinHeap, MaxHeap])
+def test_heaps(cls):
+    with count_operations() as operations:
+        tree = cls(*map(Counted, ODD_ARRAY.shuffled))
+        for item in EVEN_ARRAY.reversed:
+            tree.insert(Counted(item))
+        result = [tree.delete().value for _ in range(len(tree))]
+    assert result == sorted(result, reverse=cls is MaxHeap)
+    assert operations.comparisons > 0 and operations.swaps > 0
+
+
+def test_counted():
+    assert hash(Counted(3)) == hash(3) and Counted(3) == 3 != Counted(4)
+    assert Operations(1) != Operations() and Operations() != 0
@@ -0,0 +1,52 @@
+from bisect import bisect_left, bisect_right
+
+from pytest import mark
+
+from algorithms import exponential_search
+from ..conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+class Stream:
+    """Sorted sequence of unknown length, only supports indexing."""
+
+    def __init__(self, array):
+        self.array = array
+
+    def __getitem__(self, index):
+        return self.array[index]
+
+
+duplicates = [1, 2, 2, 2, 5, 7, 7] + [9] * 20
+
+
+@mark.parametrize("item", range(11))
+@mark.parametrize("array", [ODD_ARRAY, EVEN_ARRAY, duplicates, []])
+@mark.parametrize("right", [False, True])
+def test_exponential_search(item, array, right):
+    expected = (bisect_right if right else bisect_left)(array, item)
+    assert exponential_search(item, array, right=right) == expected
+    assert exponential_search(item, Stream(array), right=right) == expected
+
+
+@mark.parametrize(
+    "item, start, end, right",
+    [(2, 2, 6, False), (2, 2, 6, True), (0, 3, 5, False), (8, 0, 7, True)],
+)
+def test_exponential_search_range(item, start, end, right):
+    bisect = bisect_right if right else bisect_left
+    assert exponential_search(
+        item, duplicates, start=start, end=end, right=right
+    ) == bisect(duplicates, item, start, end)
+
+
+@mark.parametrize("end", [None, 100])
+def test_exponential_search_probes(end):
+    probes = []
+
+    class Probed(Stream):
+        def __getitem__(self, index):
+            probes.append(index)
+            return super().__getitem__(index)
+
+    assert exponential_search(50, Probed(list(range(100))), end=end) == 50
+    assert probes[:7] == [0, 1, 3, 7, 15, 31, 63]
@@ -0,0 +1,40 @@
+from pytest import mark, raises
+
+from algorithms import interpolation_search
+from ..conftest import ODD_ARRAY, EVEN_ARRAY
+
+skewed = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10**9]
+
+
+@mark.parametrize(
+    "item, array, expected",
+    [(item, EVEN_ARRAY, index) for index, item in enumerate(EVEN_ARRAY)]
+    + [(item, ODD_ARRAY, index) for index, item in enumerate(ODD_ARRAY)]
+    + [(item, skewed, index) for index, item in enumerate(skewed)]
+    + [
+        (0.5 * item, [0.5 * i for i in skewed], index)
+        for index, item in enumerate(skewed)
+    ],
+)
+def test_interpolation_search(item, array, expected):
+    assert interpolation_search(item, array) == expected
+
+
+def test_interpolation_search_duplicates():
+    array = [3] * 8 + [4]
+    assert array[interpolation_search(3, array)] == 3
+    assert interpolation_search(4, array) == 8
+
+
+def test_interpolation_search_range():
+    assert interpolation_search(5, skewed, start=2, end=6) == 4
+    with raises(ValueError):
+        interpolation_search(9, skewed, start=2, end=6)
+
+
+@mark.parametrize(
+    "item, array", [(10, ODD_ARRAY), (0, ODD_ARRAY), (4.5, skewed), (1, [])]
+)
+def test_interpolation_search_errors(item, array):
+    with raises(ValueError):
+        interpolation_search(item, array)
@@ -0,0 +1,64 @@
+import json
+
+from pytest import fixture, raises
+
+from algorithms import registry, merge_sort, bubble_sort
+from algorithms.metrics import BOUNDS, Histogram
+from ..conftest import ODD_ARRAY
+
+
+@fixture
+def enabled():
+    registry.reset()
+    yield registry
+    registry.disable()
+    registry.reset()
+
+
+def test_disabled(enabled):
+    assert bubble_sort(ODD_ARRAY.reversed) == ODD_ARRAY.sorted
+    assert registry.snapshot() == {}
+
+
+def test_calls(enabled):
+    registry.enable()
+    merge_sort(ODD_ARRAY.shuffled)  # the recursive calls aren't counted
+    bubble_sort(ODD_ARRAY.shuffled)
+    snapshot = registry.snapshot()
+    assert list(snapshot) == ["bubble_sort", "merge_sort"]
+    assert snapshot["merge_sort"]["calls"] == snapshot["merge_sort"]["count"] == 1
+    assert snapshot["bubble_sort"]["buckets"][-1] == ["+Inf", 1]
+
+
+def test_sample(enabled):
+    registry.enable(sample=3)
+    for _ in range(7):
+        bubble_sort(ODD_ARRAY.shuffled)
+    registry.disable()
+    bubble_sort(ODD_ARRAY.shuffled)
+    metric = registry.snapshot()["bubble_sort"]
+    assert (metric["calls"], metric["count"]) == (7, 2)
+    with raises(ValueError):
+        registry.enable(sample=0)
+
+
+def test_histogram():
+    histogram = Histogram()
+    for value in (0, BOUNDS[0], BOUNDS[1], 1e-6 * 1.5, 1e3):
+        histogram.observe(value)
+    buckets = histogram.snapshot()["buckets"]
+    assert [count for _, count in buckets[:3]] == [2, 4, 4]
+    assert buckets[-2][1] == 4 and buckets[-1] == ["+Inf", 5]
+    assert histogram.snapshot()["sum"] == sum((0, 1e-6, 2e-6, 1.5e-6, 1e3))
+
+
+def test_export(enabled):
+    registry.enable()
+    bubble_sort(ODD_ARRAY.shuffled)
+    assert json.loads(registry.to_json()) == registry.snapshot()
+    lines = registry.to_prometheus(prefix="test").splitlines()
+    assert "# TYPE test_calls_total counter" in lines
+    assert 'test_calls_total{function="bubble_sort"} 1' in lines
+    assert 'test_latency_seconds_bucket{function="bubble_sort",le="+Inf"} 1' in lines
+    assert 'test_latency_seconds_count{function="bubble_sort"} 1' in lines
+    assert len(lines) == 3 + 2 + len(BOUNDS) + 1 + 2
@@ -1,6 +1,9 @@
+import sys
+from random import randint
+
 from pytest import mark, raises
 
-from algorithms import quick_select
+from algorithms import quick_select, select_many
 from ..conftest import ODD_ARRAY, EVEN_ARRAY
 
 
@@ -21,3 +24,34 @@ def test_quick_select(k, array):
 def test_quick_select_errors(k):
     with raises(ValueError):
         quick_select(k, ODD_ARRAY)
+
+
+def test_quick_select_copy():
+    array = ODD_ARRAY.reversed
+    assert quick_select(1, array) == 1
+    assert array == ODD_ARRAY.reversed
+    assert quick_select(1, array, in_place=True) == 1
+
+
+@mark.parametrize("length", [1, 17, 100, 1000])
+def test_select_many(length):
+    array = [randint(0, length // 2) for _ in range(length)]
+    expected = sorted(array)
+    ks = [length, 1, (length + 1) // 2, max(1, length * 9 // 10), length]
+    assert select_many(ks, array) == [expected[k - 1] for k in ks]
+
+
+@mark.parametrize("ks", [[1, 0], [10]])
+def test_select_many_errors(ks):
+    with raises(ValueError):
+        select_many(ks, ODD_ARRAY)
+
+
+@mark.parametrize("length", [50, 1001])
+def test_median_of_medians(length):
+    module = sys.modules["algorithms.quick_select"]
+    array = [randint(0, 100) for _ in range(length)]
+    indexes = [0, length // 2, length - 1]
+    module._introselect(array, indexes, 0, length, depth=0)
+    expected = sorted(array)
+    assert [array[i] for i in indexes] == [expected[i] for i in indexes]
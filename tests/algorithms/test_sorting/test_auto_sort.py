@@ -0,0 +1,73 @@
+from random import randint, shuffle
+
+from pytest import mark
+
+from algorithms import sort, choose_sort
+from algorithms.sorting.auto_sort import Thresholds
+from ...conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+wide = [randint(-(2**40), 2**40) for _ in range(1000)]
+nearly = list(range(1000))
+nearly[10], nearly[500] = nearly[500], nearly[10]
+repeated = [randint(0, 3) * 2**40 for _ in range(1000)]
+floats = [randint(0, 10**6) / 7 for _ in range(1000)]
+words = [str(value) for value in wide]
+
+
+@mark.parametrize(
+    "array, thresholds, algorithm",
+    [
+        (ODD_ARRAY.shuffled, None, "insertion_sort"),
+        ([randint(0, 100) for _ in range(1000)], None, "counting_sort"),
+        (wide, None, "quick_sort"),
+        (wide, Thresholds(radix=500), "radix_sort"),
+        (words, None, "string_sort"),
+        ([value.encode() for value in words], None, "string_sort"),
+        (nearly, Thresholds(counting=0), "tim_sort"),
+        (nearly[::-1], Thresholds(counting=0), "tim_sort"),
+        (repeated, None, "quick_sort"),
+        (floats, None, "quick_sort"),
+        (floats, Thresholds(default="heap_sort"), "heap_sort"),
+        (floats + [1], Thresholds(default="merge_sort"), "merge_sort"),
+    ],
+)
+def test_choose_sort(array, thresholds, algorithm):
+    decision = choose_sort(array, thresholds=thresholds)
+    assert decision.algorithm == algorithm
+    assert decision.size == len(array)
+    assert sort(list(array), thresholds=thresholds) == sorted(array)
+
+
+def test_choose_sort_statistics():
+    decision = choose_sort(repeated)
+    assert decision.reason == "many duplicates"
+    assert decision.kind == "int"
+    assert decision.duplicates > 0.9
+    assert decision.value_range == 3 * 2**40 + 1
+    assert decision.options == {"intro": True}
+
+    assert choose_sort(nearly).presorted > 0.9
+    assert choose_sort(floats, sample=8).kind == "any"
+
+    mixed = list(range(1000))
+    mixed[500] = 0.5  # the sample of the first and the last windows misses it
+    decision = choose_sort(mixed, sample=8)
+    assert decision.kind == "int" and decision.value_range is None
+    assert sort(mixed) == sorted(mixed)
+
+
+def test_sort_key_reverse():
+    records = [(value, index) for index, value in enumerate(EVEN_ARRAY * 10)]
+    shuffle(records)
+    assert sort(records, key=lambda record: record[0], reverse=True) == sorted(
+        records, key=lambda record: record[0], reverse=True
+    )
+
+
+def test_sort_unhashable():
+    lists = [[index % 7, index] for index in range(100)]
+    shuffle(lists)
+    assert choose_sort(lists).duplicates == 0
+    assert sort(lists) == sorted(lists)
+    assert choose_sort([[0]] * 100).duplicates > 0.9
@@ -1,6 +1,6 @@
 from pytest import mark
 
-from algorithms import bucket_sort
+from algorithms import bucket_sort, string_sort
 from ...conftest import Array
 
 
@@ -17,3 +17,42 @@ array = Array(["farzane", "jane", "lucy", "sepehr", "tom"])
 )
 def test_bucket_sort(array, expected):
     assert bucket_sort(array) == expected
+
+
+mixed = Array(["", "Zebra", "apple", "APP", "42", "ünï", "b", "a"])
+
+
+@mark.parametrize("function", [sorted, string_sort])
+def test_bucket_sort_mixed(function):
+    assert bucket_sort(mixed.shuffled, function=function) == sorted(mixed)
+
+
+def test_bucket_sort_key():
+    names = [("tom", 1), ("Jane", 2), ("lucy", 3), ("jane", 4)]
+    assert bucket_sort(names, key=lambda name: name[0].lower()) == [
+        ("Jane", 2),
+        ("jane", 4),
+        ("lucy", 3),
+        ("tom", 1),
+    ]
+    assert bucket_sort(array, reverse=True) == array.reversed
+
+
+def test_bucket_sort_key_buckets():
+    sizes = []
+
+    def function(bucket):
+        sizes.append(len(bucket))
+        return sorted(bucket)
+
+    names = [("tom", 1), ("jane", 2), ("jack", 3), ("jane", 4), ("", 5)]
+    result = bucket_sort(names, key=lambda name: name[0], function=function)
+    assert result == [("", 5), ("jack", 3), ("jane", 2), ("jane", 4), ("tom", 1)]
+    assert sorted(sizes) == [1, 1, 3]  # by the first character of the keys
+    assert bucket_sort(names, key=lambda name: name[0], reverse=True) == [
+        ("tom", 1),
+        ("jane", 2),
+        ("jane", 4),
+        ("jack", 3),
+        ("", 5),
+    ]
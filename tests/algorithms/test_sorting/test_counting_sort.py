@@ -1,34 +1,68 @@
-from pytest import mark
+from pytest import mark, raises
 
 from algorithms import counting_sort
-from algorithms.sorting.counting_sort import _minimum_maximum
 from ...conftest import Array, ODD_ARRAY, EVEN_ARRAY
 
 
 array = Array([1, 1, 2, 2, 2, 2, 5, 10, 10, 10])
+records = [("c", 3), ("a", 1), ("d", 3), ("b", 1), ("e", -2)]
 
 
 @mark.parametrize(
     "array, expected",
     [
+        ([], []),
         (array.shuffled, array),
         (ODD_ARRAY.shuffled, ODD_ARRAY),
         (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        ([3, -1, 0, -5, 3], [-5, -1, 0, 3, 3]),
     ],
 )
 def test_counting_sort(array, expected):
     assert counting_sort(array) == expected
 
 
-@mark.parametrize(
-    "accumulator, element, expected",
-    [
-        ((2, 3), 1, (1, 3)),
-        ((1, 3), 2, (1, 3)),
-        ((1, 2), 3, (1, 3)),
-        ((1, 3), 1, (1, 3)),
-        ((1, 3), 3, (1, 3)),
-    ],
-)
-def test_minimum_maximum(accumulator, element, expected):
-    assert _minimum_maximum(accumulator, element) == expected
+@mark.parametrize("budget", [10, 1])
+def test_counting_sort_key(budget):
+    assert counting_sort(records, key=lambda record: record[1], budget=budget) == [
+        ("e", -2),
+        ("a", 1),
+        ("b", 1),
+        ("c", 3),
+        ("d", 3),
+    ]
+
+
+@mark.parametrize("budget", [10, 1])
+def test_counting_sort_permutation(budget):
+    assert counting_sort([30, 10, 20, 10], permutation=True, budget=budget) == [
+        1,
+        3,
+        2,
+        0,
+    ]
+
+
+def test_counting_sort_fallback():
+    assert counting_sort([2**40, -(2**40), 0], budget=100) == [
+        -(2**40),
+        0,
+        2**40,
+    ]
+
+
+def test_counting_sort_errors():
+    with raises(ValueError):
+        counting_sort([2**40, 0], fallback=False)
+
+
+@mark.parametrize("budget", [100, 1])
+def test_counting_sort_reverse(budget):
+    assert counting_sort([3, -1, 2, 3], reverse=True, budget=budget) == [3, 3, 2, -1]
+    assert counting_sort(records, key=lambda record: record[1], reverse=True) == [
+        ("c", 3),
+        ("d", 3),
+        ("a", 1),
+        ("b", 1),
+        ("e", -2),
+    ]
@@ -0,0 +1,94 @@
+import sys
+from array import array as ArrayType
+from random import randint
+
+from pytest import mark, raises
+
+from algorithms import external_sort, quick_sort
+from algorithms.sorting.external_sort import main, _read_chunks
+
+
+numbers = [randint(-(2**63), 2**63 - 1) for _ in range(1000)]
+lines = [f"{randint(0, 10**6)}-line".encode() for _ in range(500)]
+
+
+@mark.parametrize(
+    "memory, fan_in",
+    [(2**20, 16), (800, 16), (800, 2), (8, 3)],
+)
+def test_external_sort_numbers(tmp_path, memory, fan_in):
+    source, target = tmp_path / "numbers", tmp_path / "sorted"
+    source.write_bytes(ArrayType("q", numbers).tobytes())
+
+    count = external_sort(source, target, typecode="q", memory=memory, fan_in=fan_in)
+    assert count == len(numbers)
+    assert ArrayType("q", target.read_bytes()).tolist() == sorted(numbers)
+
+
+@mark.parametrize(
+    "memory, fan_in",
+    [(2**20, 16), (256, 4), (256, 2)],
+)
+def test_external_sort_lines(tmp_path, memory, fan_in):
+    source, target = tmp_path / "lines", tmp_path / "sorted"
+    source.write_bytes(b"\n".join(lines))  # without the last newline
+
+    count = external_sort(
+        source, target, memory=memory, fan_in=fan_in, algorithm=quick_sort
+    )
+    assert count == len(lines)
+    assert target.read_bytes() == b"\n".join(sorted(lines))  # still no last newline
+
+
+def test_external_sort_last_newline(tmp_path):
+    source, target = tmp_path / "lines", tmp_path / "sorted"
+    source.write_bytes(b"".join(line + b"\n" for line in lines))
+
+    assert external_sort(source, target, memory=256) == len(lines)
+    assert target.read_bytes() == b"".join(line + b"\n" for line in sorted(lines))
+
+
+@mark.parametrize("typecode, memory", [("q", 800), ("i", 4096), (None, 1024)])
+def test_read_chunks_footprint(tmp_path, typecode, memory):
+    source = tmp_path / "source"
+    if typecode:
+        source.write_bytes(
+            ArrayType(
+                typecode, numbers[:200] if typecode == "q" else range(200)
+            ).tobytes()
+        )
+    else:
+        source.write_bytes(b"\n".join(lines))
+
+    chunks = list(_read_chunks(source, typecode, memory))
+    assert sum(map(len, chunks)) == (200 if typecode else len(lines))
+    for chunk in chunks[:-1]:  # the objects fit in the budget, roughly
+        footprint = sum(sys.getsizeof(record) + 8 for record in chunk)
+        assert memory / 2 <= footprint <= memory + 100
+
+
+def test_external_sort_empty(tmp_path):
+    source, target = tmp_path / "empty", tmp_path / "sorted"
+    source.write_bytes(b"")
+
+    assert external_sort(source, target, typecode="i") == 0
+    assert target.read_bytes() == b""
+
+
+def test_external_sort_errors(tmp_path):
+    with raises(ValueError):
+        external_sort(tmp_path / "source", tmp_path / "target", fan_in=1)
+
+    source = tmp_path / "source"
+    source.write_bytes(b"\x00" * 12)  # one and a half numbers of 8 bytes
+    with raises(ValueError):
+        external_sort(source, tmp_path / "target", typecode="q")
+
+
+def test_external_sort_main(tmp_path, capsys):
+    source, target = tmp_path / "numbers", tmp_path / "sorted"
+    source.write_bytes(ArrayType("i", [3, 1, 2]).tobytes())
+
+    main([str(source), str(target), "--typecode", "i", "--memory", "4"])
+    assert ArrayType("i", target.read_bytes()).tolist() == [1, 2, 3]
+    assert capsys.readouterr().out == f"3 records sorted into {target}\n"
@@ -32,3 +32,20 @@ def test_heap_sort(array, expected):
 )
 def test_heap_sort_reversed(array, expected):
     assert heap_sort(array, reverse=True) == expected
+
+
+@mark.parametrize(
+    "array, reverse, expected",
+    [
+        ([], False, []),
+        ([1], False, [1]),
+        (ODD_ARRAY.shuffled, False, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, False, EVEN_ARRAY),
+        (EVEN_ARRAY.reversed, False, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, True, ODD_ARRAY.reversed),
+        (EVEN_ARRAY.shuffled * 3, False, sorted(EVEN_ARRAY * 3)),
+    ],
+)
+def test_heap_sort_in_place(array, reverse, expected):
+    assert heap_sort(array, reverse=reverse, in_place=True) is array
+    assert array == expected
@@ -1,6 +1,6 @@
 from pytest import mark
 
-from algorithms import insertion_sort
+from algorithms import insertion_sort, binary_insertion_sort
 from ...conftest import ODD_ARRAY, EVEN_ARRAY
 
 
@@ -17,3 +17,27 @@ from ...conftest import ODD_ARRAY, EVEN_ARRAY
 )
 def test_insertion_sort(array, expected):
     assert insertion_sort(array) == expected
+
+
+@mark.parametrize(
+    "array, expected",
+    [
+        ([], []),
+        ([1], [1]),
+        (ODD_ARRAY, ODD_ARRAY),
+        (EVEN_ARRAY, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        (ODD_ARRAY.reversed, ODD_ARRAY),
+        (EVEN_ARRAY.reversed, EVEN_ARRAY),
+        ([2, 1, 2, 1, 2], [1, 1, 2, 2, 2]),
+    ],
+)
+def test_insertion_sort_binary(array, expected):
+    assert insertion_sort(array, binary=True) == expected
+
+
+def test_binary_insertion_sort_range():
+    array = [9, 1, 2, 5, 3, 4, 0]
+    assert binary_insertion_sort(array, 1, 6) == [9, 1, 2, 3, 4, 5, 0]
+    assert binary_insertion_sort([1, 4, 6, 2, 5], start=3) == [1, 2, 4, 5, 6]
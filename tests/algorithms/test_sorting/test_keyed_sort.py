@@ -0,0 +1,71 @@
+from pytest import mark
+
+from algorithms import (
+    insertion_sort,
+    bubble_sort,
+    selection_sort,
+    merge_sort,
+    tim_sort,
+    heap_sort,
+    quick_sort,
+    parallel_sort,
+    counting_sort,
+    radix_sort,
+)
+from ...conftest import ODD_ARRAY
+
+
+records = [("c", 3), ("a", 1), ("d", 3), ("b", 1), ("e", -2), ("f", 1)]
+ascending = [("e", -2), ("a", 1), ("b", 1), ("f", 1), ("c", 3), ("d", 3)]
+descending = [("c", 3), ("d", 3), ("a", 1), ("b", 1), ("f", 1), ("e", -2)]
+
+
+@mark.parametrize(
+    "function",
+    [
+        insertion_sort,
+        bubble_sort,
+        selection_sort,
+        merge_sort,
+        tim_sort,
+        heap_sort,
+        quick_sort,
+        parallel_sort,
+        counting_sort,
+        radix_sort,
+    ],
+)
+def test_keyed_sort(function):
+    assert function(list(records), key=lambda record: record[1]) == ascending
+    assert function(list(records), key=lambda record: record[1], reverse=True) == (
+        descending
+    )
+    assert function(ODD_ARRAY.shuffled, reverse=True) == ODD_ARRAY.reversed
+
+
+def test_keyed_sort_calls_key_once():
+    calls = []
+
+    def key(record):
+        calls.append(record)
+        return record[1]
+
+    assert merge_sort(list(records), key=key) == ascending
+    assert len(calls) == len(records)
+
+
+def test_keyed_sort_options():
+    assert merge_sort(list(records), key=lambda x: x[1], bottom_up=True) == ascending
+    assert quick_sort(list(records), key=lambda x: x[1], intro=True) == ascending
+
+
+def test_keyed_sort_positional_reverse():
+    assert heap_sort(ODD_ARRAY.shuffled, True) == ODD_ARRAY.reversed
+    assert heap_sort(list(records), True, key=lambda record: record[1]) == descending
+    assert heap_sort(ODD_ARRAY.shuffled, True, in_place=True) == ODD_ARRAY.reversed
+
+
+@mark.parametrize("function", [insertion_sort, bubble_sort, selection_sort])
+def test_keyed_sort_reverse_in_place(function):
+    array = ODD_ARRAY.shuffled
+    assert function(array, reverse=True) is array and array == ODD_ARRAY.reversed
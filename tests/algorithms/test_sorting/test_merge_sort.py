@@ -20,6 +20,24 @@ def test_merge_sort(array, expected):
     assert merge_sort(array) == expected
 
 
+@mark.parametrize(
+    "array, expected",
+    [
+        ([], []),
+        ([1], [1]),
+        (ODD_ARRAY, ODD_ARRAY),
+        (EVEN_ARRAY, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        (ODD_ARRAY.reversed, ODD_ARRAY),
+        (EVEN_ARRAY.reversed, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled + EVEN_ARRAY.shuffled, sorted(ODD_ARRAY + EVEN_ARRAY)),
+    ],
+)
+def test_merge_sort_bottom_up(array, expected):
+    assert merge_sort(array, bottom_up=True) == expected
+
+
 @mark.parametrize(
     "left, right",
     [
@@ -0,0 +1,65 @@
+from array import array as ArrayType
+from multiprocessing.shared_memory import SharedMemory
+from random import randint
+
+from pytest import mark
+
+from algorithms import parallel_sort, quick_sort, heap_sort, string_sort
+from algorithms.sorting._merge import k_way_merge
+from algorithms.sorting.parallel_sort import _sort_shared_chunk
+from ...conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+numbers = [randint(-(10**9), 10**9) for _ in range(2000)]
+
+
+@mark.parametrize(
+    "array, expected",
+    [
+        (ODD_ARRAY, ODD_ARRAY),
+        (EVEN_ARRAY, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        (ODD_ARRAY.reversed, ODD_ARRAY),
+        (EVEN_ARRAY.reversed, EVEN_ARRAY),
+    ],
+)
+def test_parallel_sort(array, expected):
+    assert parallel_sort(array, workers=2) == expected
+
+
+@mark.parametrize("algorithm", [quick_sort, heap_sort])
+def test_parallel_sort_algorithm(algorithm):
+    assert parallel_sort(numbers, workers=3, algorithm=algorithm) == sorted(numbers)
+
+
+def test_parallel_sort_pickled():
+    big = [2**70 + number for number in numbers]
+    assert parallel_sort(big, workers=2) == sorted(big)
+
+    words = [str(number) for number in numbers]
+    assert parallel_sort(words, workers=2, algorithm=string_sort) == sorted(words)
+
+
+def test_parallel_sort_single_worker():
+    assert parallel_sort(numbers, workers=1) == sorted(numbers)
+
+
+def test_k_way_merge():
+    assert list(k_way_merge([[1, 4, 7], [], [2, 5], [3, 6, 8, 9]])) == list(
+        range(1, 10)
+    )
+
+
+def test_sort_shared_chunk():
+    packed = ArrayType("q", [5, 4, 3, 2, 1])
+    memory = SharedMemory(create=True, size=len(packed) * packed.itemsize)
+    try:
+        memory.buf[: len(packed) * packed.itemsize] = packed.tobytes()
+        _sort_shared_chunk(memory.name, "q", 1, 4, quick_sort)
+        assert ArrayType("q", bytes(memory.buf[: len(packed) * packed.itemsize])) == (
+            ArrayType("q", [5, 2, 3, 4, 1])
+        )
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,33 @@
+from random import randint
+
+from pytest import mark
+
+from algorithms import partial_sort, nsmallest, nlargest
+from ...conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+numbers = [randint(0, 50) for _ in range(500)]
+records = [(value, index) for index, value in enumerate(numbers)]
+
+
+@mark.parametrize("k", [0, 1, 3, 9, 20])
+@mark.parametrize("array", [ODD_ARRAY.shuffled, EVEN_ARRAY.reversed, numbers])
+def test_nsmallest_nlargest(k, array):
+    assert nsmallest(k, array) == sorted(array)[:k]
+    assert nlargest(k, array) == sorted(array, reverse=True)[:k]
+
+
+@mark.parametrize("k", [1, 10, 100])
+def test_nsmallest_nlargest_key(k):
+    key = lambda record: record[0] // 10  # noqa: E731
+    assert nsmallest(k, iter(records), key=key) == sorted(records, key=key)[:k]
+    assert nlargest(k, iter(records), key=key) == (
+        sorted(records, key=key, reverse=True)[:k]
+    )
+
+
+def test_partial_sort():
+    generator = (value for value in numbers)
+    assert partial_sort(generator, 5) == sorted(numbers)[:5]
+    assert partial_sort(numbers, 5, reverse=True) == sorted(numbers)[::-1][:5]
+    assert partial_sort(records, 5, key=lambda record: -record[1]) == records[::-1][:5]
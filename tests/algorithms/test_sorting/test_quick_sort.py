@@ -1,6 +1,9 @@
+from random import randint
+
 from pytest import mark
 
 from algorithms import quick_sort
+from algorithms.sorting.quick_sort import _introsort, _median_of_three
 from ...conftest import ODD_ARRAY, EVEN_ARRAY
 
 
@@ -17,3 +20,47 @@ from ...conftest import ODD_ARRAY, EVEN_ARRAY
 )
 def test_quick_sort(array, expected):
     assert quick_sort(array) == expected
+
+
+@mark.parametrize(
+    "array",
+    [
+        [],
+        ODD_ARRAY.shuffled,
+        EVEN_ARRAY.reversed,
+        [randint(0, 5) for _ in range(300)],
+        [randint(-1000, 1000) for _ in range(1000)],
+        list(range(500, 0, -1)),
+        [1] * 200,
+    ],
+)
+def test_quick_sort_intro(array):
+    assert quick_sort(list(array), intro=True) == sorted(array)
+
+
+def test_quick_sort_intro_range():
+    array = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    assert quick_sort(array, start=2, end=6, intro=True) == [9, 8, 3, 4, 5, 6, 7, 2, 1]
+
+
+@mark.parametrize("length", [17, 100, 1000])
+def test_introsort_heap_fallback(length):
+    array = [randint(0, length) for _ in range(length)]
+    expected = sorted(array)
+    _introsort(array, start=0, end=length, depth_limit=0)
+    assert array == expected
+
+
+@mark.parametrize(
+    "values, expected",
+    [
+        ((1, 2, 3), 1),
+        ((1, 3, 2), 2),
+        ((2, 1, 3), 0),
+        ((2, 3, 1), 0),
+        ((3, 1, 2), 2),
+        ((3, 2, 1), 1),
+    ],
+)
+def test_median_of_three(values, expected):
+    assert _median_of_three(list(values), 0, 1, 2) == expected
@@ -0,0 +1,89 @@
+import sys
+from array import array as ArrayType
+from random import randint
+
+from pytest import mark, raises, importorskip
+
+from algorithms import radix_sort
+from ...conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+module = sys.modules["algorithms.sorting.radix_sort"]
+wide = [randint(-(2**63), 2**63 - 1) for _ in range(500)]
+
+
+@mark.parametrize(
+    "array, expected",
+    [
+        ([], []),
+        ([7], [7]),
+        ([3, 3, 3], [3, 3, 3]),
+        (ODD_ARRAY, ODD_ARRAY),
+        (EVEN_ARRAY, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        (ODD_ARRAY.reversed, ODD_ARRAY),
+        (EVEN_ARRAY.reversed, EVEN_ARRAY),
+        ([5, -3, 0, -(2**40), 2**40, -3], [-(2**40), -3, -3, 0, 5, 2**40]),
+        ([256, 1, 512, 2], [1, 2, 256, 512]),
+        ([768, 256, 512], [256, 512, 768]),
+        (wide, sorted(wide)),
+    ],
+)
+@mark.parametrize("bits", [8, 11, 16])
+def test_radix_sort(array, expected, bits):
+    assert radix_sort(array, bits=bits) == expected
+
+
+def test_radix_sort_array(monkeypatch):
+    monkeypatch.setattr(module, "numpy", None)
+    result = radix_sort(ArrayType("q", wide))
+    assert isinstance(result, ArrayType)
+    assert result.tolist() == sorted(wide)
+    assert radix_sort(ArrayType("q", wide), reverse=True).tolist() == sorted(
+        wide, reverse=True
+    )
+
+
+def test_radix_sort_key():
+    records = [(value % 7, index) for index, value in enumerate(wide)]
+    assert radix_sort(records, key=lambda record: record[0]) == sorted(records)
+    assert radix_sort([], key=abs) == []
+    assert radix_sort(ArrayType("q", [3, -5, 1]), key=abs) == ArrayType("q", [1, 3, -5])
+
+
+@mark.parametrize("typecode", ["b", "B", "q", "Q"])
+def test_radix_sort_numpy_array(typecode):
+    importorskip("numpy")
+    array = ArrayType(typecode, [randint(0, 100) for _ in range(300)])
+    result = radix_sort(array)
+    assert isinstance(result, ArrayType)
+    assert result.tolist() == sorted(array)
+
+
+def test_radix_sort_numpy_ndarray():
+    numpy = importorskip("numpy")
+    array = numpy.array(wide + [0, 0], dtype=numpy.int64)
+    assert radix_sort(array).tolist() == sorted(wide + [0, 0])
+    assert radix_sort(array[:0]).tolist() == []
+    assert radix_sort(array, reverse=True).tolist() == sorted(wide + [0, 0])[::-1]
+
+
+def test_radix_sort_numpy_key():
+    numpy = importorskip("numpy")
+    array = numpy.array([3, -5, 1, -2], dtype=numpy.int32)
+    result = radix_sort(array, key=abs)
+    assert isinstance(result, numpy.ndarray) and result.dtype == numpy.int32
+    assert result.tolist() == [1, -2, 3, -5]
+
+
+@mark.parametrize("bits", [0, -1])
+def test_radix_sort_bits(bits):
+    with raises(ValueError):
+        radix_sort([3, 1, 2], bits=bits)
+
+
+def test_radix_sort_errors():
+    numpy = importorskip("numpy")
+    with raises(TypeError):
+        radix_sort(numpy.array([0.5, 0.25]))
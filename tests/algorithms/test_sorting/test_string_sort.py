@@ -0,0 +1,74 @@
+import sys
+from random import choice, randint
+
+from pytest import mark
+
+from algorithms import string_sort
+from algorithms.sorting.string_sort import _multikey_quick_sort
+from ...conftest import Array
+
+
+array = Array(["farzane", "jane", "lucy", "sepehr", "tom"])
+mixed = Array(["", "Zebra", "apple", "app", "APP", "42", "ünï", "https://a.b/c", "a"])
+identifiers = [
+    "".join(choice("aAbB0_/é") for _ in range(randint(0, 12))) for _ in range(2000)
+]
+
+
+@mark.parametrize(
+    "array, expected",
+    [
+        ([], []),
+        (array, array),
+        (array.shuffled, array),
+        (array.reversed, array),
+        (mixed.shuffled, sorted(mixed)),
+        (identifiers, sorted(identifiers)),
+        (
+            [item.encode() for item in identifiers],
+            sorted(x.encode() for x in identifiers),
+        ),
+        (["same"] * 50, ["same"] * 50),
+    ],
+)
+def test_string_sort(array, expected):
+    assert string_sort(list(array)) == expected
+
+
+def test_string_sort_key():
+    words = [("b", 1), ("A", 2), ("a", 3), ("B", 4), ("a", 5)] * 5
+    assert string_sort(words, key=lambda word: word[0].lower()) == sorted(
+        words, key=lambda word: word[0].lower()
+    )
+    assert string_sort(words, key=lambda word: word[0], reverse=True) == sorted(
+        words, key=lambda word: word[0], reverse=True
+    )
+    assert string_sort(list(identifiers), reverse=True) == sorted(
+        identifiers, reverse=True
+    )
+
+
+@mark.parametrize(
+    "keys",
+    [
+        list(identifiers),
+        [f"{number:08b}" for number in range(2048)],  # one long shared prefix
+        ["a" * length for length in range(300)],  # the equal parts are the large ones
+    ],
+)
+def test_string_sort_stack(keys):
+    heights = []
+
+    def tracer(frame, event, arg):
+        if frame.f_code is _multikey_quick_sort.__code__:
+            heights.append(len(frame.f_locals.get("stack", ())))
+            return tracer
+
+    previous = sys.gettrace()  # the tracer of the coverage, if any
+    sys.settrace(tracer)
+    try:
+        _multikey_quick_sort(keys, None)
+    finally:
+        sys.settrace(previous)
+    assert keys == sorted(keys)
+    assert max(heights) <= 2 * len(keys).bit_length()
@@ -0,0 +1,65 @@
+from random import randint, seed
+
+from pytest import mark
+
+from algorithms import tim_sort
+from algorithms.sorting.tim_sort import _min_run
+from ...conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+class Record:
+    def __init__(self, key, index):
+        self.key, self.index = key, index
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def _runs(length):
+    seed(length)
+    array = []
+    while len(array) < length:
+        array += sorted(randint(0, 100) for _ in range(randint(1, 300)))
+    return array[:length]
+
+
+@mark.parametrize(
+    "array, expected",
+    [
+        ([], []),
+        ([1], [1]),
+        (ODD_ARRAY, ODD_ARRAY),
+        (EVEN_ARRAY, EVEN_ARRAY),
+        (ODD_ARRAY.shuffled, ODD_ARRAY),
+        (EVEN_ARRAY.shuffled, EVEN_ARRAY),
+        (ODD_ARRAY.reversed, ODD_ARRAY),
+        (EVEN_ARRAY.reversed, EVEN_ARRAY),
+    ],
+)
+def test_tim_sort(array, expected):
+    assert tim_sort(array) == expected
+
+
+@mark.parametrize(
+    "array",
+    [
+        [randint(0, 10) for _ in range(500)],
+        [randint(0, 10**6) for _ in range(3000)],
+        list(range(1000)) + list(range(1000, 0, -1)),
+        list(range(2000, 0, -1)),
+        list(range(100)) + [0],
+        _runs(5000),
+    ],
+)
+def test_tim_sort_stable(array):
+    records = [Record(key, index) for index, key in enumerate(array)]
+    result = [(record.key, record.index) for record in tim_sort(records)]
+    assert result == sorted(zip(array, range(len(array))))
+
+
+@mark.parametrize(
+    "length, expected",
+    [(1, 1), (63, 63), (64, 32), (65, 33), (128, 32), (2000, 63)],
+)
+def test_min_run(length, expected):
+    assert _min_run(length) == expected
@@ -0,0 +1,130 @@
+import asyncio
+
+from pytest import mark, raises
+
+from data_structures import AsyncQueue
+from exceptions import UnderflowError
+
+
+@mark.parametrize("n", [1, 2, 5])
+def test_async_queue(n):
+    async def main():
+        queue = AsyncQueue(length=n)
+        assert queue.length == n and queue.is_empty is True
+        for _ in range(3):  # the circular buffer wraps around
+            for i in range(n):
+                await queue.enqueue(i)
+            assert queue.size == n and queue.is_paused is True
+            with raises(OverflowError):
+                queue.enqueue_nowait(n)
+            assert [await queue.dequeue() for _ in range(n)] == list(range(n))
+            with raises(UnderflowError):
+                queue.dequeue_nowait()
+
+    asyncio.run(main())
+
+
+def test_watermarks():
+    async def main():
+        queue, produced = AsyncQueue(8, high_water=6, low_water=2), []
+
+        async def produce():
+            for i in range(10):
+                await queue.enqueue(i)
+                produced.append(i)
+
+        producer = asyncio.create_task(produce())
+        await asyncio.sleep(0)
+        assert produced == list(range(6)) and queue.is_paused is True
+        assert await queue.dequeue_batch(3) == [0, 1, 2]
+        await asyncio.sleep(0)
+        assert len(produced) == 6  # still paused above the low watermark
+        assert await queue.dequeue() == 3
+        await asyncio.sleep(0)
+        assert produced == list(range(10)) and queue.size == 6
+        await producer
+        assert await queue.dequeue_batch(10) == [4, 5, 6, 7, 8, 9]  # wraps around
+
+    asyncio.run(main())
+
+
+def test_async_iteration():
+    async def main():
+        queue = AsyncQueue(4)
+
+        async def produce():
+            for i in range(20):
+                await queue.enqueue(i)
+            queue.close()
+
+        async def consume():
+            return [item async for item in queue]
+
+        results = await asyncio.gather(consume(), consume(), produce())
+        assert sorted(results[0] + results[1]) == list(range(20))
+        assert queue.is_closed is True
+        with raises(RuntimeError):
+            await queue.enqueue(20)
+        with raises(UnderflowError):
+            await queue.dequeue_batch(1)
+
+    asyncio.run(main())
+
+
+@mark.parametrize(
+    "length, high, low", [(4, 5, None), (4, 2, 2), (4, None, -1), (0, None, None)]
+)
+def test_errors(length, high, low):
+    with raises(ValueError):
+        AsyncQueue(length, high_water=high, low_water=low)
+
+
+def test_waiting_and_cancel():
+    async def main():
+        queue = AsyncQueue(4)
+        with raises(UnderflowError):
+            queue.dequeue_batch_nowait(2)
+
+        batch = asyncio.create_task(queue.dequeue_batch(2))
+        cancelled = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0)
+        cancelled.cancel()  # it leaves the line before it's woken up
+        await asyncio.sleep(0)
+        queue.enqueue_nowait(0)
+        assert await batch == [0]
+
+        woken = asyncio.create_task(queue.dequeue())
+        single = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0)
+        queue.enqueue_nowait(1)
+        woken.cancel()  # woken up but cancelled, it passes its turn on
+        await asyncio.sleep(0)
+        assert woken.cancelled() is True and await single == 1
+
+        skipped = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0)
+        skipped.cancel()
+        queue.enqueue_nowait(2)  # skips the cancelled one before it resumes
+        with raises(asyncio.CancelledError):
+            await skipped
+        assert queue.dequeue_nowait() == 2
+
+        queue.close()
+        with raises(UnderflowError):
+            await queue.dequeue()
+
+    asyncio.run(main())
+
+
+@mark.parametrize("max_items", [0, -2])
+def test_batch_errors(max_items):
+    async def main():
+        queue = AsyncQueue(8)
+        queue.enqueue_nowait(1)
+        with raises(ValueError):
+            queue.dequeue_batch_nowait(max_items)
+        with raises(ValueError):
+            await queue.dequeue_batch(max_items)
+        assert queue.size == 1 and queue.dequeue_batch_nowait(8) == [1]
+
+    asyncio.run(main())
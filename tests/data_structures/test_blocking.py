@@ -0,0 +1,108 @@
+from threading import Thread
+
+from pytest import mark, raises
+
+from data_structures import BlockingQueue, BlockingStack
+from exceptions import UnderflowError
+
+
+@mark.parametrize("n", [1, 2, 5])
+def test_blocking_queue(n):
+    queue = BlockingQueue(length=n)
+    assert queue.length == n and queue.is_empty is True
+
+    for rounds in range(3):  # the ring buffer wraps around
+        for i in range(n):
+            queue.put(i)
+        assert queue.is_full is True and queue.size == n
+        with raises(OverflowError):
+            queue.put(n, timeout=0)
+        assert [queue.get() for _ in range(n)] == list(range(n))
+        with raises(UnderflowError):
+            queue.get(timeout=0.01)
+
+
+def test_blocking_stack():
+    stack = BlockingStack(length=3)
+    for i in range(3):
+        stack.put(i)
+    with raises(OverflowError):
+        stack.put(3, timeout=0)
+    assert stack.get() == 2
+    stack.put(3)
+    assert stack.get_batch(10) == [3, 1, 0] and stack.is_empty is True
+    with raises(UnderflowError):
+        stack.get(timeout=0)
+
+
+def test_get_batch():
+    queue = BlockingQueue(length=5)
+    assert queue.get_batch(3, timeout=0) == []
+    for i in range(4):
+        queue.put(i)
+    assert queue.get_batch(3) == [0, 1, 2]
+    for i in range(4, 8):
+        queue.put(i)
+    assert queue.get_batch(10) == [3, 4, 5, 6, 7]  # wraps around
+    assert queue.is_empty is True
+
+
+def test_blocking():
+    queue = BlockingQueue(length=1)
+    queue.put(0)
+    thread = Thread(target=queue.put, args=(1,))  # blocks until the get
+    thread.start()
+    assert queue.get(timeout=1) == 0
+    thread.join(timeout=1)
+    assert queue.get_batch(2, timeout=1) == [1]
+
+    thread = Thread(target=lambda: queue.put(2))
+    thread.start()
+    assert queue.get() == 2  # waits for the put
+    thread.join(timeout=1)
+
+
+@mark.parametrize("cls", [BlockingQueue, BlockingStack])
+def test_producers_consumers(cls):
+    container, results, stop = cls(length=8), [], object()
+
+    def produce(start):
+        for i in range(start, start + 1000):
+            container.put(i, timeout=10)
+
+    def consume(batch):  # every consumer stops at its own sentinel
+        while True:
+            items = (
+                container.get_batch(batch, 10) if batch else [container.get(timeout=10)]
+            )
+            if stop in items:
+                results.extend(item for item in items if item is not stop)
+                for _ in range(items.count(stop) - 1):  # give the others back
+                    container.put(stop, timeout=10)
+                return
+            results.extend(items)
+
+    threads = [Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+    threads += [Thread(target=consume, args=(batch,)) for batch in (0, 16)]
+    for thread in threads:
+        thread.daemon = True  # a failure doesn't hang the test run
+        thread.start()
+    for thread in threads[:4]:
+        thread.join(timeout=10)
+    for _ in range(2):
+        container.put(stop, timeout=10)
+    for thread in threads[4:]:
+        thread.join(timeout=10)
+    assert sorted(results) == list(range(4000)) and container.is_empty
+
+
+def test_errors():
+    with raises(ValueError):
+        BlockingQueue(0)
+
+    queue = BlockingQueue(4)
+    queue.put(1)
+    for max_items in (0, -2):
+        with raises(ValueError):
+            queue.get_batch(max_items)
+    assert queue.size == 1 and queue.get() == 1
@@ -0,0 +1,85 @@
+import pickle
+from bisect import bisect_left, bisect_right
+from math import ceil
+from random import Random
+
+from pytest import mark, raises
+
+from data_structures import QuantileSketch
+
+QS = [0, 0.01, 0.25, 0.5, 0.9, 0.99, 1]
+
+
+@mark.parametrize("length", [1, 50, 200])
+def test_exact(length):
+    values = [Random(length).randint(0, 100) for _ in range(length)]
+    sketch = QuantileSketch(200)
+    sketch.extend(values)
+    ordered = sorted(values)
+    assert sketch.exact and sketch.error == 0 and len(sketch) == length
+    assert sketch.quantiles(QS) == [ordered[max(1, ceil(q * length)) - 1] for q in QS]
+    assert sketch.rank(50) == bisect_left(ordered, 50)
+
+
+def check(sketch, ordered):
+    length = len(ordered)
+    assert not sketch.exact and len(sketch) == length
+    for q, value in zip(QS, sketch.quantiles(QS)):
+        low, high = bisect_left(ordered, value), bisect_right(ordered, value)
+        target = q * length
+        assert low - sketch.error * length <= target <= high + sketch.error * length
+    assert sketch.quantile(0) == ordered[0] and sketch.quantile(1) == ordered[-1]
+    for value in ordered[:: length // 10]:
+        assert (
+            abs(sketch.rank(value) - bisect_left(ordered, value))
+            <= sketch.error * length
+        )
+
+
+def test_stream():
+    random = Random(1)
+    values = [random.randint(0, 10**6) for _ in range(50_000)]
+    sketch = QuantileSketch(seed=1)
+    sketch.extend(values)
+    check(sketch, sorted(values))
+    assert sketch.quantile(0.5) == sketch.quantiles([0.5])[0]
+
+
+def test_update():
+    random = Random(4)
+    values = [random.random() for _ in range(10_000)]
+    updated, extended = QuantileSketch(50, seed=5), QuantileSketch(50, seed=5)
+    for value in values:
+        updated.update(value)
+    extended.extend(values)
+    assert updated.quantiles(QS) == extended.quantiles(QS)
+    check(updated, sorted(values))
+
+
+def test_merge():
+    random = Random(2)
+    chunks = [
+        [random.gauss(0, 1) for _ in range(length)] for length in (10, 5000, 20_000)
+    ]
+    sketches = []
+    for index, chunk in enumerate(chunks):
+        sketch = QuantileSketch(100, seed=index)
+        sketch.extend(chunk)
+        sketches.append(pickle.loads(pickle.dumps(sketch)))  # as if from a worker
+
+    merged = QuantileSketch(100, seed=3)
+    for sketch in [QuantileSketch(100)] + sketches:
+        assert merged.merge(sketch) is merged
+    assert QuantileSketch(100).merge(merged).merge(QuantileSketch(100)) is not merged
+    check(merged, sorted(value for chunk in chunks for value in chunk))
+
+
+def test_errors():
+    with raises(ValueError):
+        QuantileSketch(4)
+    sketch = QuantileSketch()
+    with raises(ValueError):
+        sketch.quantile(0.5)
+    sketch.update(1)
+    with raises(ValueError):
+        sketch.quantile(1.5)
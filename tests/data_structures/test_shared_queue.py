@@ -0,0 +1,164 @@
+import pickle
+from multiprocessing import get_context
+from time import sleep
+
+from pytest import mark, raises
+
+from data_structures import SharedQueue
+from exceptions import UnderflowError
+
+
+def put(queue: SharedQueue, value: tuple):
+    while True:
+        try:
+            return queue.enqueue(value)
+        except OverflowError:
+            sleep(0)
+
+
+def produce(queue: SharedQueue, count: int, start: int = 0):
+    for i in range(start, start + count):
+        put(queue, (i, i / 2))
+    queue.close()
+
+
+def consume(queue: SharedQueue, results):
+    items = []
+    while True:  # until its own stop record
+        try:
+            item = queue.dequeue()
+        except UnderflowError:
+            sleep(0)
+            continue
+        if item[0] < 0:
+            break
+        items.append(item)
+    results.put(items)
+    queue.close()
+
+
+@mark.parametrize("n", [1, 2, 5])
+@mark.parametrize("multiple", [False, True])
+def test_shared_queue(n, multiple):
+    with SharedQueue(n, "qd", multiple=multiple) as queue:
+        assert queue.length == n and queue.record_size == 16
+        assert queue.is_empty is True and queue.is_full is False
+        for _ in range(3):  # the circular buffer wraps around
+            for i in range(n):
+                queue.enqueue((i, i / 2))
+                assert queue.size == i + 1
+            assert queue.is_full is True
+            with raises(OverflowError):
+                queue.enqueue((n, 0.0))
+            assert [queue.dequeue() for _ in range(n)] == [(i, i / 2) for i in range(n)]
+            with raises(UnderflowError):
+                queue.dequeue()
+
+
+def test_batches():
+    with SharedQueue(5, 3) as queue:
+        assert queue.dequeue_batch(2) == []
+        queue.enqueue_many([b"abc", b"def", b"ghi"])
+        assert queue.dequeue_batch(2) == [b"abc", b"def"]
+        queue.enqueue_many([b"jkl", b"mno", b"pqr", b"stu"])  # wraps around
+        with raises(OverflowError):
+            queue.enqueue_many([b"vwx"])
+        assert queue.dequeue_batch(10) == [b"ghi", b"jkl", b"mno", b"pqr", b"stu"]
+        with raises(ValueError):
+            queue.enqueue(b"toolong")
+        with raises(ValueError):
+            queue.enqueue_many([b"xyz", b"no"])
+        assert queue.is_empty is True
+
+
+def test_views():
+    with SharedQueue(2, "i") as queue:
+        with raises(UnderflowError):
+            queue.peek()
+        with raises(UnderflowError):
+            queue.release()
+
+        for i in range(2):
+            with queue.reserve() as slot:
+                slot.cast("i")[0] = i
+            queue.commit()
+        with raises(OverflowError):
+            queue.reserve()
+        with raises(OverflowError):
+            queue.commit()
+
+        for i in range(2):
+            with queue.peek() as slot:
+                assert slot.cast("i")[0] == i
+            queue.release()
+        assert queue.is_empty is True
+
+
+def test_pickle():
+    with SharedQueue(4, "q") as queue:
+        copy = pickle.loads(pickle.dumps(queue))
+        assert copy.name == queue.name and copy.length == 4
+        copy.enqueue((7,))
+        copy.close()  # only the creator unlinks the memory
+        assert queue.dequeue() == (7,)
+
+
+@mark.parametrize("method", ["fork", "spawn"])
+def test_processes(method):
+    context = get_context(method)
+    with SharedQueue(8, "qd") as queue:
+        process = context.Process(target=produce, args=(queue, 100))
+        process.start()
+        items = []
+        while len(items) < 100:
+            items += queue.dequeue_batch(8)
+        process.join()
+        assert items == [(i, i / 2) for i in range(100)]
+
+
+@mark.parametrize("method", ["fork", "spawn"])
+def test_multiple_processes(method):
+    context = get_context(method)
+    with SharedQueue(8, "qd", multiple=True, context=context) as queue:
+        results = context.Queue()
+        producers = [
+            context.Process(target=produce, args=(queue, 500, start))
+            for start in (0, 500)
+        ]
+        consumers = [
+            context.Process(target=consume, args=(queue, results)) for _ in range(2)
+        ]
+        for process in producers + consumers:
+            process.start()
+        for process in producers:
+            process.join(timeout=30)
+        for _ in consumers:  # a stop record for each consumer
+            put(queue, (-1, 0.0))
+        items = results.get(timeout=30) + results.get(timeout=30)
+        for process in consumers:
+            process.join(timeout=30)
+        assert sorted(items) == [(i, i / 2) for i in range(1000)]
+
+
+@mark.parametrize("length, record", [(0, "q"), (4, 0), (4, "")])
+def test_errors(length, record):
+    with raises(ValueError):
+        SharedQueue(length, record)
+
+
+@mark.parametrize("max_items", [0, -2])
+def test_batch_errors(max_items):
+    with SharedQueue(4, "q") as queue:
+        for i in range(3):
+            queue.enqueue((i,))
+            queue.dequeue()
+        queue.enqueue((3,))
+        with raises(ValueError):
+            queue.dequeue_batch(max_items)
+        assert queue.dequeue_batch(10) == [(3,)]  # the head didn't move back
+
+
+def test_pickle_multiple():
+    with SharedQueue(4, "q", multiple=True) as queue:
+        with raises(RuntimeError):  # only while spawning a process
+            pickle.dumps(queue)
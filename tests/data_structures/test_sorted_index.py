@@ -0,0 +1,34 @@
+from bisect import bisect_left
+from random import randint
+
+from pytest import mark
+
+from data_structures import SortedIndex
+from ..conftest import ODD_ARRAY, EVEN_ARRAY
+
+
+numbers = sorted(randint(-100, 100) for _ in range(300))
+
+
+@mark.parametrize(
+    "array, typecode",
+    [
+        ([], "q"),
+        ([5], "q"),
+        (ODD_ARRAY, "q"),
+        (EVEN_ARRAY, "i"),
+        (numbers, "q"),
+        (sorted(str(number) for number in numbers), None),
+    ],
+)
+def test_sorted_index(array, typecode):
+    index = SortedIndex(array, typecode=typecode)
+    assert len(index) == len(array)
+
+    probes = set(array) | {"", "~"} if typecode is None else set(range(-102, 103))
+    for item in probes:
+        rank = bisect_left(array, item)
+        assert index.rank(item) == rank
+        assert index.lookup(item) == (rank if item in array else -1)
+        assert (item in index) is (item in array)
+        assert index.predecessor(item) == (array[rank - 1] if rank else None)
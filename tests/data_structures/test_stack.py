@@ -37,3 +37,40 @@ def test_stack(n):
 
     with raises(UnderflowError):
         stack.pop()
+
+
+@mark.parametrize("typecode", [None, "q", "d"])
+def test_growable_stack(typecode):
+    stack = Stack(growable=True, typecode=typecode)
+    assert stack.length == 0 and stack.is_full is False
+
+    for i in range(10):
+        stack.push(value=i)
+    assert stack.size == 10 and stack.length == 16 and stack.top == 9
+
+    stack.push_many(range(10, 100))
+    assert stack.size == 100 and stack.length == 100
+    stack.push_many([100])
+    assert stack.length == 200 and stack.is_full is False
+
+    assert list(stack.pop_many(3)) == [100, 99, 98]
+    assert list(stack.pop_many(0)) == []
+    assert stack.pop() == 97 and stack.size == 97
+    assert list(stack.pop_many(97)) == list(range(96, -1, -1))
+    assert stack.is_empty is True
+
+
+def test_bulk_errors():
+    stack = Stack(length=4, typecode="q")
+    stack.push_many((1, 2, 3))
+    with raises(OverflowError):
+        stack.push_many([4, 5])
+    with raises(UnderflowError):
+        stack.pop_many(4)
+    with raises(TypeError):
+        stack.push_many(["a"])
+
+    assert stack.size == 3 and stack.top == 3
+    assert stack.pop_many(3).tolist() == [3, 2, 1]
+    with raises(AttributeError):
+        stack.attribute = None  # slots
@@ -33,3 +33,20 @@ def test_heap(Heap, build_down):
 
     with raises(Exception, match="Heap is empty."):
         heap.delete()
+
+    with raises(Exception, match="Heap is empty."):
+        heap.replace(1)
+
+
+@mark.parametrize(
+    "Heap, expected",
+    [
+        (MinHeap, [2, 3, 4, 5, 6, 7, 8, 9, 10]),
+        (MaxHeap, [10, 8, 7, 6, 5, 4, 3, 2, 1]),
+    ],
+)
+def test_heap_replace(Heap, expected):
+    heap = Heap(*ODD_ARRAY.shuffled)
+    assert heap.replace(10) in (1, 9)
+    assert len(heap) == 9
+    assert [heap.delete() for _ in range(9)] == expected
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+from importlib import import_module
+from pathlib import Path
+
+from pytest import mark, raises
+
+import algorithms
+import data_structures
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET = 50_000  # microseconds of the cumulative import time
+
+
+def run(statement: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times(statement: str) -> dict:
+    times = {}
+    for line in run(statement, "-X", "importtime").stderr.splitlines()[1:]:
+        _, cumulative, name = line.rsplit("|", 2)
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def loaded_modules(statement: str) -> set:
+    return set(run(f"{statement}; import sys; print(*sys.modules)").stdout.split())
+
+
+def test_packages_budget():
+    times = import_times("import algorithms, data_structures")
+    assert times["algorithms"] + times["data_structures"] < BUDGET
+    assert not any(
+        name.startswith(("algorithms.sorting.", "data_structures.tree."))
+        or name == "logging.config"
+        for name in loaded_modules("import algorithms, data_structures")
+    )
+
+
+@mark.parametrize(
+    "statement, loaded, unloaded",
+    [
+        (
+            "from algorithms import merge_sort",
+            "algorithms.sorting.merge_sort",
+            ["algorithms.sorting.quick_sort", "data_structures", "logging.config"],
+        ),
+        (
+            "from data_structures import MinHeap",
+            "data_structures.tree.heap",
+            [
+                "data_structures.stack",
+                "data_structures.tree.trie",
+                "algorithms.sorting.heap_sort",
+            ],
+        ),
+        (
+            "from algorithms import sort; sort([3, 1, 2])",
+            "algorithms.sorting.auto_sort",
+            ["logging.config"],
+        ),
+        (
+            "from algorithms import external_sort",
+            "algorithms.sorting.external_sort",
+            ["algorithms.sorting.parallel_sort", "concurrent.futures"],
+        ),
+        (
+            "from data_structures import QuantileSketch",
+            "data_structures.quantile_sketch",
+            ["algorithms.decorators", "algorithms.sorting.tim_sort"],
+        ),
+    ],
+)
+def test_lazy_submodules(statement, loaded, unloaded):
+    modules = loaded_modules(statement)
+    assert loaded in modules and not set(unloaded) & modules
+
+
+def test_lazy_attributes():
+    assert "quick_select" in dir(algorithms) and "Trie" in dir(data_structures)
+    module = import_module("algorithms.quick_select")
+    assert algorithms.quick_select is module.quick_select  # not shadowed
+    with raises(AttributeError):
+        algorithms.missing